@@ -1,8 +1,10 @@
 from logging.config import fileConfig
 
+import app.models  # noqa: F401  (registers every model on Base.metadata)
 from alembic import context
-from app.db.base import Base
+from app.db.partitioning import UNMAPPED_TABLES, partition_month
 from app.db.session import engine
+from app.models.base import Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -19,6 +21,29 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Foreign keys the models declare differently from the database
+UNMANAGED_CONSTRAINTS = {
+    fk.constraint.name
+    for table in target_metadata.tables.values()
+    for fk in table.foreign_keys
+    if fk.info.get("autogenerate") is False
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate away from schema the migrations manage by hand."""
+    if type_ == "table" and reflected and compare_to is None:
+        # Monthly partitions and the tables behind them are not models
+        return not (
+            name in UNMAPPED_TABLES
+            or name.endswith("_default")
+            or partition_month(name) is not None
+        )
+    if type_ == "foreign_key_constraint":
+        return name not in UNMANAGED_CONSTRAINTS
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -43,6 +68,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -64,7 +90,11 @@ def run_migrations_online() -> None:
     connectable = engine
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
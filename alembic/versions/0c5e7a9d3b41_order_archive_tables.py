@@ -0,0 +1,102 @@
+"""order archive tables
+
+Revision ID: 0c5e7a9d3b41
+Revises: f4a8c2e6b913
+Create Date: 2026-10-19 15:10:52.180447
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0c5e7a9d3b41"
+down_revision: Union[str, Sequence[str], None] = "f4a8c2e6b913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _enum(name: str, *values: str) -> postgresql.ENUM:
+    # Types already exist; they belong to the hot tables
+    return postgresql.ENUM(*values, name=name, create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "orders_archive",
+        sa.Column("id", sa.UUID(), primary_key=True),
+        sa.Column("client_id", sa.UUID(), nullable=False),
+        sa.Column("service_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "status",
+            _enum(
+                "order_status_enum",
+                "pending",
+                "in_progress",
+                "ready",
+                "completed",
+                "cancelled",
+            ),
+            nullable=False,
+        ),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("requested_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("estimated_completion", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("actual_completion", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("quoted_price", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("actual_price", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.Column(
+            "priority",
+            _enum("order_priority_enum", "normal", "high", "urgent"),
+            nullable=True,
+        ),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_orders_archive_client_id", "orders_archive", ["client_id"]
+    )
+
+    op.create_table(
+        "order_images_archive",
+        sa.Column("id", sa.UUID(), primary_key=True),
+        sa.Column("order_id", sa.UUID(), nullable=False),
+        sa.Column("uploaded_by", sa.UUID(), nullable=False),
+        sa.Column("s3_url", sa.String(), nullable=True),
+        sa.Column("s3_object_path", sa.String(), nullable=True),
+        sa.Column(
+            "image_type",
+            _enum("image_type_enum", "before", "after", "reference", "instruction"),
+            nullable=False,
+        ),
+        sa.Column("uploaded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_order_images_archive_order_id", "order_images_archive", ["order_id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_order_images_archive_order_id", table_name="order_images_archive")
+    op.drop_table("order_images_archive")
+    op.drop_index("ix_orders_archive_client_id", table_name="orders_archive")
+    op.drop_table("orders_archive")
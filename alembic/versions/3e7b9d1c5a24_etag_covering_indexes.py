@@ -0,0 +1,39 @@
+"""etag covering indexes
+
+Revision ID: 3e7b9d1c5a24
+Revises: 6a1d3f8b2c50
+Create Date: 2026-10-19 17:48:12.530918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e7b9d1c5a24"
+down_revision: Union[str, Sequence[str], None] = "6a1d3f8b2c50"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Both tables are partitioned: the indexes cascade to every partition
+    op.create_index(
+        "ix_orders_client_etag",
+        "orders",
+        ["client_id"],
+        postgresql_include=["id", "version"],
+    )
+    op.create_index(
+        "ix_order_images_order_etag",
+        "order_images",
+        ["order_id"],
+        postgresql_include=["id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_order_images_order_etag", table_name="order_images")
+    op.drop_index("ix_orders_client_etag", table_name="orders")
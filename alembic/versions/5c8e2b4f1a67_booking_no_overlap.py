@@ -0,0 +1,50 @@
+"""booking no overlap
+
+Revision ID: 5c8e2b4f1a67
+Revises: a3f1c7d2e9b4
+Create Date: 2026-10-19 10:04:55.902117
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c8e2b4f1a67"
+down_revision: Union[str, Sequence[str], None] = "a3f1c7d2e9b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column(
+        "bookings",
+        sa.Column("appointment_end", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Existing bookings get the default 30 minute slot
+    op.execute(
+        "UPDATE bookings SET appointment_end = appointment_time + interval '30 minutes'"
+    )
+    op.alter_column("bookings", "appointment_end", nullable=False)
+
+    # Fails if live bookings already overlap; cancel the duplicates first.
+    op.execute(
+        """
+        ALTER TABLE bookings ADD CONSTRAINT bookings_no_overlap
+        EXCLUDE USING gist (
+            service_id WITH =,
+            tstzrange(appointment_time, appointment_end, '[)') WITH &&
+        ) WHERE (status <> 'cancelled')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("bookings_no_overlap", "bookings")
+    op.drop_column("bookings", "appointment_end")
@@ -0,0 +1,62 @@
+"""order revenue total slots
+
+Revision ID: 7d3f5b9a2c18
+Revises: e2a7c9f1d4b6
+Create Date: 2026-10-21 10:42:18.530274
+
+Every completion updated the single order_revenue_totals row, so all
+writers completing orders queued on its row lock. The totals are now
+spread over slot rows (one per revenue_slot(order_id)); the dashboard
+sums them. The existing row keeps its totals as slot 1.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3f5b9a2c18"
+down_revision: Union[str, Sequence[str], None] = "e2a7c9f1d4b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.models.rollup.REVENUE_TOTAL_SLOTS when this revision was written
+SLOTS = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint(
+        "ck_order_revenue_totals_single", "order_revenue_totals", type_="check"
+    )
+    op.alter_column("order_revenue_totals", "id", new_column_name="slot")
+    # Slots are chosen by the writer, never generated
+    op.alter_column("order_revenue_totals", "slot", server_default=None)
+    op.execute("DROP SEQUENCE IF EXISTS order_revenue_totals_id_seq")
+    op.create_check_constraint(
+        "ck_order_revenue_totals_slot",
+        "order_revenue_totals",
+        f"slot >= 0 AND slot < {SLOTS}",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "ck_order_revenue_totals_slot", "order_revenue_totals", type_="check"
+    )
+    # Fold every slot into row 1 before the single-row check comes back
+    op.execute(
+        """
+        INSERT INTO order_revenue_totals (slot, orders_completed, actual_revenue)
+        SELECT 1, coalesce(sum(orders_completed), 0), coalesce(sum(actual_revenue), 0)
+        FROM order_revenue_totals
+        ON CONFLICT (slot) DO UPDATE
+        SET orders_completed = excluded.orders_completed,
+            actual_revenue = excluded.actual_revenue
+        """
+    )
+    op.execute("DELETE FROM order_revenue_totals WHERE slot <> 1")
+    op.alter_column("order_revenue_totals", "slot", new_column_name="id")
+    op.create_check_constraint(
+        "ck_order_revenue_totals_single", "order_revenue_totals", "id = 1"
+    )
@@ -0,0 +1,68 @@
+"""search indexes
+
+Revision ID: 8e4b6d1f0c93
+Revises: d71a9e3c5b28
+Create Date: 2026-10-19 12:40:18.207745
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4b6d1f0c93"
+down_revision: Union[str, Sequence[str], None] = "d71a9e3c5b28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute(
+        """
+        ALTER TABLE orders ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english',
+                coalesce(description, '') || ' ' || coalesce(notes, ''))
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE services ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+
+    op.create_index(
+        "ix_orders_search_vector",
+        "orders",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_services_search_vector",
+        "services",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.execute(
+        """
+        CREATE INDEX ix_users_full_name_trgm ON users
+        USING gin ((first_name || ' ' || last_name) gin_trgm_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_full_name_trgm", table_name="users")
+    op.drop_index("ix_services_search_vector", table_name="services")
+    op.drop_index("ix_orders_search_vector", table_name="orders")
+    op.drop_column("services", "search_vector")
+    op.drop_column("orders", "search_vector")
@@ -0,0 +1,43 @@
+"""order revenue totals
+
+Revision ID: 9b3c5d7e1f20
+Revises: 3e7b9d1c5a24
+Create Date: 2026-10-20 09:14:37.201846
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3c5d7e1f20"
+down_revision: Union[str, Sequence[str], None] = "3e7b9d1c5a24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "order_revenue_totals",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("orders_completed", sa.Integer(), nullable=False),
+        sa.Column("actual_revenue", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.CheckConstraint("id = 1", name="ck_order_revenue_totals_single"),
+    )
+
+    # Backfill from the daily rollup; OrderRollupService keeps it current
+    op.execute(
+        """
+        INSERT INTO order_revenue_totals (id, orders_completed, actual_revenue)
+        SELECT 1, coalesce(sum(orders_completed), 0), coalesce(sum(actual_revenue), 0)
+        FROM order_daily_revenue
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("order_revenue_totals")
@@ -0,0 +1,49 @@
+"""order active partial indexes
+
+Revision ID: b2d6f9a4c1e7
+Revises: 8e4b6d1f0c93
+Create Date: 2026-10-19 13:21:05.694112
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d6f9a4c1e7"
+down_revision: Union[str, Sequence[str], None] = "8e4b6d1f0c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = "status IN ('pending', 'in_progress')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_orders_active_requested_date",
+        "orders",
+        ["status", "requested_date"],
+        postgresql_where=sa.text(ACTIVE),
+    )
+    op.create_index(
+        "ix_orders_active_estimated_completion",
+        "orders",
+        ["estimated_completion"],
+        postgresql_where=sa.text(ACTIVE),
+    )
+    op.create_index(
+        "ix_orders_urgent_requested_date",
+        "orders",
+        ["requested_date"],
+        postgresql_where=sa.text(f"priority = 'urgent' AND {ACTIVE}"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orders_urgent_requested_date", table_name="orders")
+    op.drop_index("ix_orders_active_estimated_completion", table_name="orders")
+    op.drop_index("ix_orders_active_requested_date", table_name="orders")
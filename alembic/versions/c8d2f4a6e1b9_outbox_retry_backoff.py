@@ -0,0 +1,50 @@
+"""outbox retry backoff
+
+Revision ID: c8d2f4a6e1b9
+Revises: 9b3c5d7e1f20
+Create Date: 2026-10-20 11:42:18.530274
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8d2f4a6e1b9"
+down_revision: Union[str, Sequence[str], None] = "9b3c5d7e1f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "outbox_events",
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "outbox_events",
+        sa.Column("failed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.drop_index("ix_outbox_events_pending", table_name="outbox_events")
+    op.create_index(
+        "ix_outbox_events_pending",
+        "outbox_events",
+        ["id"],
+        postgresql_where=sa.text("dispatched_at IS NULL AND failed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_outbox_events_pending", table_name="outbox_events")
+    op.create_index(
+        "ix_outbox_events_pending",
+        "outbox_events",
+        ["id"],
+        postgresql_where=sa.text("dispatched_at IS NULL"),
+    )
+    op.drop_column("outbox_events", "failed_at")
+    op.drop_column("outbox_events", "next_attempt_at")
@@ -0,0 +1,83 @@
+"""order dashboard rollups
+
+Revision ID: d71a9e3c5b28
+Revises: 5c8e2b4f1a67
+Create Date: 2026-10-19 11:27:03.554810
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d71a9e3c5b28"
+down_revision: Union[str, Sequence[str], None] = "5c8e2b4f1a67"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "order_status_counts",
+        sa.Column("status", sa.String(), primary_key=True),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "order_daily_revenue",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("orders_created", sa.Integer(), nullable=False),
+        sa.Column("quoted_revenue", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("orders_completed", sa.Integer(), nullable=False),
+        sa.Column("actual_revenue", sa.Numeric(precision=12, scale=2), nullable=False),
+    )
+    op.create_table(
+        "service_order_volumes",
+        sa.Column("service_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("quoted_revenue", sa.Numeric(precision=12, scale=2), nullable=False),
+    )
+
+    # Backfill once from orders; OrderService keeps them current from here on.
+    # Days are UTC, matching rollup_day() in the service layer.
+    op.execute(
+        """
+        INSERT INTO order_status_counts (status, order_count)
+        SELECT status::text, count(*) FROM orders GROUP BY status
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO order_daily_revenue
+            (day, orders_created, quoted_revenue, orders_completed, actual_revenue)
+        SELECT day, sum(created), sum(quoted), sum(completed), sum(actual)
+        FROM (
+            SELECT (created_at AT TIME ZONE 'UTC')::date AS day,
+                   1 AS created, quoted_price AS quoted,
+                   0 AS completed, 0 AS actual
+            FROM orders
+            UNION ALL
+            SELECT (actual_completion AT TIME ZONE 'UTC')::date,
+                   0, 0, 1, coalesce(actual_price, quoted_price)
+            FROM orders
+            WHERE status = 'completed' AND actual_completion IS NOT NULL
+        ) AS changes
+        GROUP BY day
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO service_order_volumes (service_id, order_count, quoted_revenue)
+        SELECT service_id, count(*), sum(quoted_price) FROM orders GROUP BY service_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("service_order_volumes")
+    op.drop_table("order_daily_revenue")
+    op.drop_table("order_status_counts")
@@ -0,0 +1,87 @@
+"""order id registry
+
+Revision ID: e2a7c9f1d4b6
+Revises: c8d2f4a6e1b9
+Create Date: 2026-10-20 14:27:51.904163
+
+Partitioning orders made its primary key (id, created_at), so orders.id
+was no longer unique and order_images.order_id lost its foreign key.
+order_ids is a plain table holding every orders.id: statement triggers on
+orders keep it in step, its primary key rejects a duplicate id, and
+order_images.order_id references it.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a7c9f1d4b6"
+down_revision: Union[str, Sequence[str], None] = "c8d2f4a6e1b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table("order_ids", sa.Column("id", sa.UUID(), primary_key=True))
+    op.execute("INSERT INTO order_ids (id) SELECT id FROM orders")
+
+    # Statement-level, so a bulk insert registers its ids in one statement.
+    # They fire for statements on orders, not on a partition directly.
+    op.execute(
+        """
+        CREATE FUNCTION register_order_ids() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO order_ids (id) SELECT id FROM new_orders;
+            RETURN NULL;
+        END $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION unregister_order_ids() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM order_ids USING old_orders
+            WHERE order_ids.id = old_orders.id;
+            RETURN NULL;
+        END $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER orders_register_ids AFTER INSERT ON orders
+        REFERENCING NEW TABLE AS new_orders
+        FOR EACH STATEMENT EXECUTE FUNCTION register_order_ids()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER orders_unregister_ids AFTER DELETE ON orders
+        REFERENCING OLD TABLE AS old_orders
+        FOR EACH STATEMENT EXECUTE FUNCTION unregister_order_ids()
+        """
+    )
+
+    op.create_foreign_key(
+        "order_images_order_id_fkey",
+        "order_images",
+        "order_ids",
+        ["order_id"],
+        ["id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "order_images_order_id_fkey", "order_images", type_="foreignkey"
+    )
+    op.execute("DROP TRIGGER orders_unregister_ids ON orders")
+    op.execute("DROP TRIGGER orders_register_ids ON orders")
+    op.execute("DROP FUNCTION unregister_order_ids()")
+    op.execute("DROP FUNCTION register_order_ids()")
+    op.drop_table("order_ids")
@@ -0,0 +1,173 @@
+"""partition orders by month
+
+Revision ID: f4a8c2e6b913
+Revises: b2d6f9a4c1e7
+Create Date: 2026-10-19 14:02:37.551930
+
+Rebuilds orders (by created_at) and order_images (by uploaded_at) as
+range-partitioned tables. Postgres cannot convert a table in place, so each
+table is renamed, recreated partitioned, refilled and the old copy dropped.
+
+The primary keys become (id, <partition key>), as Postgres requires, and
+order_images.order_id loses its foreign key because a foreign key can only
+reference a partitioned table through its full primary key. The ORM models
+are unchanged. e2a7c9f1d4b6 restores a unique orders.id and the foreign key
+through an order id registry.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.db.partitioning import (
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    month_start,
+    months_between,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a8c2e6b913"
+down_revision: Union[str, Sequence[str], None] = "b2d6f9a4c1e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+ACTIVE = "status IN ('pending', 'in_progress')"
+
+
+def _copy_rows(source: str, target: str) -> None:
+    """INSERT every non-generated column of source into target."""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE cols text;
+        BEGIN
+            SELECT string_agg(quote_ident(column_name), ', '
+                              ORDER BY ordinal_position)
+            INTO cols
+            FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = '{source}'
+              AND is_generated = 'NEVER';
+            EXECUTE format(
+                'INSERT INTO {target} (%s) SELECT %s FROM {source}', cols, cols
+            );
+        END $$
+        """
+    )
+
+
+def _rebuild(table: str, partition_key: str | None) -> None:
+    """Recreate table, partitioned by month on partition_key or plain if None."""
+    op.rename_table(table, f"{table}_old")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_old_pkey")
+
+    clause = f" PARTITION BY RANGE ({partition_key})" if partition_key else ""
+    op.execute(
+        f"""
+        CREATE TABLE {table} (
+            LIKE {table}_old
+            INCLUDING DEFAULTS INCLUDING GENERATED
+            INCLUDING CONSTRAINTS INCLUDING STORAGE
+        ){clause}
+        """
+    )
+
+    if partition_key:
+        first = op.get_bind().execute(
+            sa.text(f"SELECT min({partition_key}) FROM {table}_old")
+        ).scalar()
+        this_month = month_start(datetime.now(timezone.utc).date())
+        first_month = month_start(first.date()) if first else this_month
+        for month in months_between(
+            first_month, add_months(this_month, MONTHS_AHEAD)
+        ):
+            op.execute(create_partition_sql(table, month))
+        op.execute(create_default_partition_sql(table))
+
+    _copy_rows(f"{table}_old", table)
+    op.execute(f"DROP TABLE {table}_old CASCADE")
+
+    key = f"id, {partition_key}" if partition_key else "id"
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({key})")
+
+
+def _create_order_constraints() -> None:
+    op.create_foreign_key(
+        "orders_client_id_fkey", "orders", "users", ["client_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "orders_service_id_fkey", "orders", "services", ["service_id"], ["id"]
+    )
+    op.create_index("ix_orders_client_id", "orders", ["client_id"])
+    op.create_index("ix_orders_service_id", "orders", ["service_id"])
+    op.create_index(
+        "ix_orders_search_vector",
+        "orders",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_orders_active_requested_date",
+        "orders",
+        ["status", "requested_date"],
+        postgresql_where=sa.text(ACTIVE),
+    )
+    op.create_index(
+        "ix_orders_active_estimated_completion",
+        "orders",
+        ["estimated_completion"],
+        postgresql_where=sa.text(ACTIVE),
+    )
+    op.create_index(
+        "ix_orders_urgent_requested_date",
+        "orders",
+        ["requested_date"],
+        postgresql_where=sa.text(f"priority = 'urgent' AND {ACTIVE}"),
+    )
+
+
+def _create_order_image_constraints() -> None:
+    op.create_foreign_key(
+        "order_images_uploaded_by_fkey",
+        "order_images",
+        "users",
+        ["uploaded_by"],
+        ["id"],
+    )
+    op.create_index("ix_order_images_order_id", "order_images", ["order_id"])
+    op.create_index("ix_order_images_uploaded_by", "order_images", ["uploaded_by"])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint(
+        "order_images_order_id_fkey", "order_images", type_="foreignkey"
+    )
+
+    _rebuild("orders", "created_at")
+    _create_order_constraints()
+
+    _rebuild("order_images", "uploaded_at")
+    _create_order_image_constraints()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild("order_images", None)
+    _create_order_image_constraints()
+
+    _rebuild("orders", None)
+    _create_order_constraints()
+
+    op.create_foreign_key(
+        "order_images_order_id_fkey",
+        "order_images",
+        "orders",
+        ["order_id"],
+        ["id"],
+    )
@@ -0,0 +1,204 @@
+import csv
+from typing import List, Literal, Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
+
+from app.core.config import settings
+from app.core.dependencies import (
+    ArchiveServiceDep,
+    ImportServiceDep,
+    RollupServiceDep,
+    SearchServiceDep,
+)
+from app.core.exceptions import PasswordHashingBusyError
+from app.core.password_pool import get_password_pool
+from app.core.security import RoleChecker
+from app.db.slow_queries import get_slow_query_log
+from app.schemas.admin import (
+    AdminDashboardResponse,
+    ArchiveRunResponse,
+    ImportResult,
+    PasswordPoolStats,
+    SlowQueryEntry,
+)
+from app.schemas.search import SearchResponse
+from app.services.archive_service import archive_objects
+from app.services.import_service import detect_format, parse_rows
+
+allow_admin = RoleChecker(["admin"])
+
+router = APIRouter()
+
+
+@router.get(
+    "/dashboard",
+    response_model=AdminDashboardResponse,
+    dependencies=[Depends(allow_admin)],
+)
+async def get_dashboard(
+    service: RollupServiceDep,
+    days: int = Query(30, ge=1, le=366),
+):
+    """
+    Key order metrics for the admin dashboard.
+    Served from incrementally maintained rollups, never from orders.
+    """
+    return await service.dashboard(days=days)
+
+
+@router.get(
+    "/search",
+    response_model=SearchResponse,
+    dependencies=[Depends(allow_admin)],
+)
+async def search(
+    service: SearchServiceDep,
+    q: str = Query(..., min_length=2, max_length=200),
+    scope: Literal["all", "orders", "services"] = "all",
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+):
+    """
+    Ranked search over orders (description, notes, client name) and
+    services (name, description).
+    """
+    orders = []
+    services = []
+    if scope in ("all", "orders"):
+        orders = await service.search_orders(q, page, page_size)
+    if scope in ("all", "services"):
+        services = await service.search_services(q, page, page_size)
+
+    return {
+        "query": q,
+        "scope": scope,
+        "page": page,
+        "page_size": page_size,
+        "orders": orders,
+        "services": services,
+    }
+
+
+@router.post(
+    "/archive",
+    response_model=ArchiveRunResponse,
+    dependencies=[Depends(allow_admin)],
+)
+async def archive_orders(
+    service: ArchiveServiceDep,
+    background_tasks: BackgroundTasks,
+    older_than_days: Optional[int] = Query(None, ge=1),
+    batch_size: Optional[int] = Query(None, ge=1, le=5000),
+):
+    """
+    Move one batch (default ARCHIVE_BATCH_SIZE) of completed/cancelled
+    orders untouched for ``older_than_days`` (default ARCHIVE_AFTER_DAYS)
+    and their images to the archive tier; call again while ``more`` is
+    true. The archive job (python -m app.services.archive_service) does a
+    full run. Archived orders stay readable through the order endpoints.
+    """
+    orders, images, more = await service.archive_batch(older_than_days, batch_size)
+    if images:
+        # After the response, so after this request's commit
+        background_tasks.add_task(archive_objects, images)
+    return {"orders": orders, "images": len(images), "more": more}
+
+
+async def _read_import(file: UploadFile) -> list[tuple[int, dict]]:
+    content = await file.read()
+    try:
+        rows = parse_rows(content, detect_format(file.filename, file.content_type))
+    except (UnicodeDecodeError, ValueError, csv.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unreadable import file: {e}",
+        )
+
+    if len(rows) > settings.IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.IMPORT_MAX_ROWS} rows per import.",
+        )
+    return rows
+
+
+@router.post(
+    "/import/users",
+    response_model=ImportResult,
+    status_code=status.HTTP_207_MULTI_STATUS,
+    dependencies=[Depends(allow_admin)],
+)
+async def import_users(service: ImportServiceDep, file: UploadFile = File(...)):
+    """
+    Create or update users from a CSV (with header) or NDJSON file.
+    Existing users are matched by email and keep their password.
+    Invalid rows are skipped and reported by line number.
+    """
+    rows = await _read_import(file)
+    try:
+        return await service.import_users(rows)
+    except PasswordHashingBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+
+
+@router.post(
+    "/import/services",
+    response_model=ImportResult,
+    status_code=status.HTTP_207_MULTI_STATUS,
+    dependencies=[Depends(allow_admin)],
+)
+async def import_services(service: ImportServiceDep, file: UploadFile = File(...)):
+    """
+    Create or update services from a CSV (with header) or NDJSON file,
+    matched by name. Invalid rows are skipped and reported by line number.
+    """
+    return await service.import_services(await _read_import(file))
+
+
+@router.get(
+    "/slow-queries",
+    response_model=List[SlowQueryEntry],
+    dependencies=[Depends(allow_admin)],
+)
+async def get_slow_queries(limit: int = Query(50, ge=1, le=1000)):
+    """
+    Statements slower than SLOW_QUERY_THRESHOLD_MS on this worker, newest
+    first. A sample of the slow reads carries an EXPLAIN (ANALYZE, BUFFERS)
+    plan, filled in shortly after the statement ran.
+    """
+    return get_slow_query_log().recent(limit)
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(allow_admin)],
+)
+async def clear_slow_queries():
+    get_slow_query_log().clear()
+
+
+@router.get(
+    "/password-pool",
+    response_model=PasswordPoolStats,
+    dependencies=[Depends(allow_admin)],
+)
+async def get_password_pool_stats():
+    """
+    Load on this worker's password hashing pool: operations running and
+    waiting for a slot, and how many were turned away with a 503.
+    """
+    return get_password_pool().stats()
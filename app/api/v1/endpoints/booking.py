@@ -1,9 +1,11 @@
+from datetime import date
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.core.dependencies import BookingServiceDep
+from app.core.exceptions import BookingConflictError, InvalidBookingSlotError
 from app.core.security import (
     JWTBearer,
     get_current_user,
@@ -11,7 +13,11 @@ from app.core.security import (
 
 # from app.services.booking_service import create_booking, get_bookings_by_user
 from app.models.user import User
-from app.schemas.booking import BookingCreate, BookingResponse
+from app.schemas.booking import (
+    BookingAvailabilityResponse,
+    BookingCreate,
+    BookingResponse,
+)
 
 router = APIRouter()
 
@@ -23,7 +29,14 @@ async def make_booking(
     current_user: User = Depends(get_current_user),
 ):
     user_id = getattr(current_user, "id")
-    return await service.add(booking, UUID(user_id))
+    try:
+        return await service.add(booking, UUID(user_id))
+    except BookingConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except InvalidBookingSlotError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
 
 
 @router.get(
@@ -35,3 +48,18 @@ async def list_bookings(
 ):
     user_id = getattr(current_user, "id")
     return await service.get_bookings_by_user(user_id)
+
+
+@router.get(
+    "/availability",
+    response_model=BookingAvailabilityResponse,
+    dependencies=[Depends(JWTBearer())],
+)
+async def get_availability(service_id: UUID, day: date, service: BookingServiceDep):
+    """Free booking slots for a service on a given day."""
+    slots = await service.get_availability(service_id, day)
+    return {
+        "service_id": service_id,
+        "day": day,
+        "slots": [{"start": start, "end": end} for start, end in slots],
+    }
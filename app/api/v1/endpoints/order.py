@@ -1,18 +1,59 @@
-from typing import List
+import asyncio
+import json
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
 
+from app.core.config import settings
 from app.core.dependencies import OrderServiceDep
-from app.core.exceptions import DuplicateResourceError, InternalDatabaseError
+from app.core.etag import IfMatch, IfNoneMatch, conditional_response
+from app.core.exceptions import (
+    DuplicateResourceError,
+    InternalDatabaseError,
+    InvalidOrderTransitionError,
+    OrderArchivedError,
+    OrderNotFoundError,
+    OrderPreconditionFailedError,
+    OrderVersionConflictError,
+)
 from app.core.security import RoleChecker, get_current_user
-from app.schemas.order import OrderCreate, OrderResponse
+from app.schemas.order import (
+    OrderBulkCreateResponse,
+    OrderCreate,
+    OrderDetailResponse,
+    OrderExportParams,
+    OrderFilter,
+    OrderListItem,
+    OrderResponse,
+    OrderStatusTransition,
+)
 from app.schemas.order_image import OrderImageResponse
 from app.schemas.user import UserAuthPayload
+from app.services.export_service import (
+    EXPORT_COLUMNS,
+    csv_chunks,
+    export_query,
+    ndjson_chunks,
+    stream_partitions,
+)
 from app.services.image_service import (
     regenerate_download_urls,
 )
+from app.services.order_events import get_order_event_broker
+from app.services.order_service import order_etag
 
 allow_admin = RoleChecker(["admin"])
 
@@ -37,20 +78,150 @@ async def create_order(
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=OrderBulkCreateResponse,
+    status_code=status.HTTP_207_MULTI_STATUS,
+    dependencies=[Depends(allow_admin)],
+)
+async def create_orders_bulk(
+    orders: List[Dict[str, Any]],
+    service: OrderServiceDep,
+    current_user: UserAuthPayload = Depends(get_current_user),
+):
+    """
+    Create many orders in a single transaction (Admin only).
+    Each item is validated on its own; failures are reported per index.
+    """
+    if len(orders) > settings.BULK_ORDER_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BULK_ORDER_MAX_ITEMS} orders per request.",
+        )
+
+    try:
+        created, errors = await service.add_bulk(orders)
+    except InternalDatabaseError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected database error occurred during bulk order creation.",
+        )
+    return {"created": created, "errors": errors}
+
+
 @router.get(
-    "/", response_model=List[OrderResponse], dependencies=[Depends(allow_admin)]
+    "/", response_model=List[OrderListItem], dependencies=[Depends(allow_admin)]
 )
 async def list_order(
-    service: OrderServiceDep, current_user: UserAuthPayload = Depends(get_current_user)
+    service: OrderServiceDep,
+    filters: Annotated[OrderFilter, Query()],
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+    current_user: UserAuthPayload = Depends(get_current_user),
 ):
-    return await service.get()
+    """
+    List orders (Admin only), optionally filtered by status, priority,
+    service, client and requested/estimated date ranges (from inclusive,
+    to exclusive). Repeat status/priority to match several values.
+    Each order carries its client's and service's name.
+    """
+    not_modified = conditional_response(
+        if_none_match, await service.etag_list(filters), response
+    )
+    if not_modified:
+        return not_modified
+
+    orders = await service.get(filters)
+    return await service.attach_names(orders)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(allow_admin)],
+)
+async def export_orders(params: Annotated[OrderExportParams, Query()]):
+    """
+    Stream orders as CSV or NDJSON (Admin only).
+    Takes the same filters as the order listing; rows are read from a
+    server-side cursor in batches, so memory stays flat however many
+    orders match.
+    """
+    columns = params.columns or list(EXPORT_COLUMNS)
+    partitions = stream_partitions(export_query(params, columns))
+
+    if params.format == "ndjson":
+        body = ndjson_chunks(columns, partitions)
+        media_type = "application/x-ndjson"
+    else:
+        body = csv_chunks(columns, partitions)
+        media_type = "text/csv"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="orders.{params.format}"'
+        },
+    )
 
 
 @router.get("/me", response_model=List[OrderResponse])
 async def list_order_me(
-    service: OrderServiceDep, current_user=Depends(get_current_user)
+    service: OrderServiceDep,
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+    current_user=Depends(get_current_user),
 ):
-    return await service.getMe(UUID(current_user.id))
+    client_id = UUID(current_user.id)
+    not_modified = conditional_response(
+        if_none_match, await service.etag_me(client_id), response
+    )
+    if not_modified:
+        return not_modified
+
+    return await service.getMe(client_id)
+
+
+@router.get("/me/events", response_class=StreamingResponse)
+async def stream_order_events_me(
+    order_id: Annotated[Optional[List[UUID]], Query()] = None,
+    current_user=Depends(get_current_user),
+):
+    """
+    Live status and image events for the current user's orders, as
+    Server-Sent Events. Pass order_id (repeatable) to watch specific
+    orders only. Holds no database connection while open.
+    """
+    broker = get_order_event_broker()
+    subscription = broker.subscribe(
+        UUID(current_user.id), set(order_id) if order_id else None
+    )
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(), settings.SSE_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield (
+                    f"id: {event['id']}\n"
+                    f"event: {event['type']}\n"
+                    f"data: {json.dumps(event)}\n\n"
+                )
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/me/{order_id}", response_model=OrderResponse | None)
@@ -75,6 +246,7 @@ async def get_order_me(
 async def get_order(
     order_id,
     service: OrderServiceDep,
+    response: Response,
     current_user: UserAuthPayload = Depends(get_current_user),
 ):
     order = await service.getId(UUID(order_id))
@@ -85,9 +257,31 @@ async def get_order(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Order with ID {order_id} not found.",
         )
+    # Send it back as If-Match on PUT to update only this version
+    response.headers["ETag"] = order_etag(order)
     return order
 
 
+@router.get(
+    "/{order_id}/detail",
+    response_model=OrderDetailResponse,
+    dependencies=[Depends(allow_admin)],
+)
+async def get_order_detail(order_id: UUID, service: OrderServiceDep):
+    """
+    The order with its service, client summary and images (with fresh
+    download URLs): everything the admin order view needs in one request.
+    """
+    detail = await service.get_detail(order_id)
+
+    if detail is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order with ID {order_id} not found.",
+        )
+    return detail
+
+
 @router.put(
     "/{order_id}", response_model=OrderResponse, dependencies=[Depends(allow_admin)]
 )
@@ -95,11 +289,16 @@ async def update_order(
     order_id: UUID,
     payload: OrderCreate,
     service: OrderServiceDep,
+    response: Response,
+    if_match: IfMatch = None,
     current_user: UserAuthPayload = Depends(get_current_user),
 ):
-
+    """
+    Replace an order (Admin only). Send the ETag from GET /{order_id} as
+    If-Match to get a 412 instead of overwriting someone else's change.
+    """
     try:
-        updated_order = await service.update(order_id, payload)
+        updated_order = await service.update(order_id, payload, if_match)
         # updated_order = update_order_service(db, order_id, payload)
 
         if updated_order is None:
@@ -109,9 +308,18 @@ async def update_order(
                 detail=f"Order with ID {order_id} not found.",
             )
 
+        response.headers["ETag"] = order_etag(updated_order)
         return updated_order
 
-    except DuplicateResourceError as e:
+    except OrderPreconditionFailedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e)
+        )
+    except (
+        DuplicateResourceError,
+        OrderArchivedError,
+        OrderVersionConflictError,
+    ) as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except InternalDatabaseError:
         raise HTTPException(
@@ -120,6 +328,34 @@ async def update_order(
         )
 
 
+@router.patch(
+    "/{order_id}/status",
+    response_model=OrderResponse,
+    dependencies=[Depends(allow_admin)],
+)
+async def transition_order_status(
+    order_id: UUID,
+    payload: OrderStatusTransition,
+    service: OrderServiceDep,
+    current_user: UserAuthPayload = Depends(get_current_user),
+):
+    """
+    Move an order to a new status (Admin only).
+    The request must carry the order version it was based on; a stale
+    version or a transition the state machine forbids returns 409.
+    """
+    try:
+        return await service.transition_status(order_id, payload)
+    except OrderNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (
+        OrderArchivedError,
+        OrderVersionConflictError,
+        InvalidOrderTransitionError,
+    ) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
 @router.delete("/{order_id}", status_code=204, dependencies=[Depends(allow_admin)])
 async def delete_order(
     order_id: UUID,
@@ -159,6 +395,13 @@ async def upload_order_image_endpoint(
     Upload image for an order (Client only - their own orders).
     Works with both MinIO and AWS S3.
     """
+    # Validate image_type
+    valid_types = ["before", "after", "reference", "instruction"]
+    if image_type not in valid_types:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid image_type. Must be one of: {valid_types}"
+        )
+
     # Verify order exists and belongs to user
     order = await service.getId(UUID(order_id))
     if not order:
@@ -167,12 +410,8 @@ async def upload_order_image_endpoint(
     if order.client_id != UUID(current_user.id):
         raise HTTPException(status_code=403, detail="Not your order")
 
-    # Validate image_type
-    valid_types = ["before", "after", "reference", "instruction"]
-    if image_type not in valid_types:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid image_type. Must be one of: {valid_types}"
-        )
+    if getattr(order, "archived_at", None) is not None:
+        raise HTTPException(status_code=409, detail="Order is archived")
 
     try:
         saved_image = await service.upload_order_image_to_storage(
@@ -204,11 +443,6 @@ async def admin_upload_order_image(
     Upload image for any order (Admin only).
     Works with both MinIO and AWS S3.
     """
-    # Verify order exists
-    order = await service.getId(UUID(order_id))
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
     # Validate image_type
     valid_types = ["before", "after", "reference", "instruction"]
     if image_type not in valid_types:
@@ -216,6 +450,14 @@ async def admin_upload_order_image(
             status_code=400, detail=f"Invalid image_type. Must be one of: {valid_types}"
         )
 
+    # Verify order exists
+    order = await service.getId(UUID(order_id))
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    if getattr(order, "archived_at", None) is not None:
+        raise HTTPException(status_code=409, detail="Order is archived")
+
     try:
         saved_image = await service.upload_order_image_to_storage(
             order_id=order_id,
@@ -232,7 +474,11 @@ async def admin_upload_order_image(
 
 @router.get("/{order_id}/images", response_model=List[OrderImageResponse])
 async def get_order_images(
-    order_id: str, service: OrderServiceDep, current_user=Depends(get_current_user)
+    order_id: str,
+    service: OrderServiceDep,
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+    current_user=Depends(get_current_user),
 ):
     """
     Get all images for an order with fresh download URLs.
@@ -247,6 +493,11 @@ async def get_order_images(
     if order.client_id != UUID(current_user.id) and current_user.user_type != "admin":
         raise HTTPException(status_code=403, detail="Access denied")
 
+    not_modified = conditional_response(
+        if_none_match, await service.images_etag(order_id), response
+    )
+    if not_modified:
+        return not_modified
 
     images = await service.getOrderImages(order_id)
 
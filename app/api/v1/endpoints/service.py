@@ -1,9 +1,10 @@
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from fastapi.security import HTTPBearer
 
 from app.core.dependencies import ServiceServiceDep
+from app.core.etag import IfNoneMatch, conditional_response
 from app.core.security import JWTBearer, RoleChecker
 from app.schemas.service import ServiceCreate, ServiceResponse, ServiceUpdate
 
@@ -24,15 +25,35 @@ async def add_service(service: ServiceCreate, serviceDep: ServiceServiceDep):
 @router.get(
     "/", response_model=List[ServiceResponse], dependencies=[Depends(JWTBearer())]
 )
-async def list_services(service: ServiceServiceDep):
-    return await service.get()
+async def list_services(
+    service: ServiceServiceDep, response: Response, if_none_match: IfNoneMatch = None
+):
+    services, etag = await service.get_with_etag()
+    not_modified = conditional_response(if_none_match, etag, response)
+    if not_modified:
+        return not_modified
+
+    return services
 
 
 @router.get(
     "/{id}", response_model=ServiceResponse, dependencies=[Depends(JWTBearer())]
 )
-async def get_service(id, service: ServiceServiceDep):
-    return await service.getId(id)
+async def get_service(
+    id,
+    service: ServiceServiceDep,
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+):
+    found, etag = await service.get_id_with_etag(id)
+    if found is None:
+        return None
+
+    not_modified = conditional_response(if_none_match, etag, response)
+    if not_modified:
+        return not_modified
+
+    return found
 
 
 @router.delete("/{id}", dependencies=[Depends(JWTBearer())])
@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.core.dependencies import UserServiceDep
+from app.core.exceptions import PasswordHashingBusyError
 from app.core.security import (
     RoleChecker,
     create_access_token,
@@ -26,12 +27,23 @@ router = APIRouter()
 allow_admin = RoleChecker(["admin"])
 
 
+def password_pool_busy(e: PasswordHashingBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"},
+    )
+
+
 # ---- AUTHENTICATION (PUBLIC) ---- #
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
 async def register(user_in: UserCreate, service: UserServiceDep):
     # Ensure role is always client on public registration
     user_in.user_type = UserRole.CLIENT
-    user = await service.add(user_in)
+    try:
+        user = await service.add(user_in)
+    except PasswordHashingBusyError as e:
+        raise password_pool_busy(e)
 
     token = create_access_token({"sub": str(user.id), "role": user.user_type})
     return {"access_token": token, "token_type": "bearer"}
@@ -39,7 +51,10 @@ async def register(user_in: UserCreate, service: UserServiceDep):
 
 @router.post("/login", response_model=Token)
 async def login(credentials: UserLogin, service: UserServiceDep):
-    user = await service.authenticate_user(credentials.email, credentials.password)
+    try:
+        user = await service.authenticate_user(credentials.email, credentials.password)
+    except PasswordHashingBusyError as e:
+        raise password_pool_busy(e)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
@@ -65,7 +80,10 @@ async def update_my_profile(
     current_user=Depends(get_current_user),
 ):
     id = UUID(current_user.id)
-    updated = await service.update_user_self_service(id, payload)
+    try:
+        updated = await service.update_user_self_service(id, payload)
+    except PasswordHashingBusyError as e:
+        raise password_pool_busy(e)
 
     if not updated:
         raise HTTPException(status_code=404, detail="User not found")
@@ -98,7 +116,10 @@ async def update_user(
     service: UserServiceDep,
     admin: UserAuthPayload = Depends(allow_admin),
 ):
-    updated = await service.update_user_admin_service(id, payload)
+    try:
+        updated = await service.update_user_admin_service(id, payload)
+    except PasswordHashingBusyError as e:
+        raise password_pool_busy(e)
 
     if not updated:
         raise HTTPException(status_code=404, detail="User not found")
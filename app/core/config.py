@@ -69,6 +69,76 @@ class Settings(BaseSettings):
     ]
     PRESIGNED_URL_EXPIRY_MINUTES: int = 30  # 6 hours
 
+    # Bulk operations
+    BULK_ORDER_MAX_ITEMS: int = 1000
+
+    # Service catalog cache (per worker, cleared on every catalog write)
+    SERVICE_CACHE_TTL_SECONDS: int = 300
+    SERVICE_CACHE_MAX_ENTRIES: int = 1000
+
+    # Booking slots
+    BOOKING_SLOT_MINUTES: int = 30
+    BOOKING_DAY_START_HOUR: int = 9
+    BOOKING_DAY_END_HOUR: int = 18
+    BOOKING_TIMEZONE: str = "UTC"
+    BOOKING_AVAILABILITY_TTL_SECONDS: int = 60  # Re-sync with other workers
+
+    # Monthly partitions of orders / order_images
+    PARTITION_ENSURE_ON_STARTUP: bool = True  # Create upcoming months at startup
+    PARTITION_MONTHS_AHEAD: int = 3
+    PARTITION_RETAIN_MONTHS: int = 36  # Older partitions get detached
+
+    # Cold archive for finished orders
+    ARCHIVE_AFTER_DAYS: int = 365
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_STORAGE_CLASS: str = "GLACIER_IR"  # S3: still readable instantly
+    ARCHIVE_OBJECT_PREFIX: str = "archive/"  # MinIO: no storage classes
+
+    # Transactional outbox for order events
+    OUTBOX_DISPATCHER_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_SWEEP_SECONDS: int = 30  # Catch-up pass if a NOTIFY was missed
+    OUTBOX_RETENTION_HOURS: int = 72  # Delivered events kept this long
+    OUTBOX_MAX_ATTEMPTS: int = 10  # Failing events are marked failed after this
+    OUTBOX_RETRY_SECONDS: int = 30  # First retry delay; doubles per attempt
+    OUTBOX_RETRY_MAX_SECONDS: int = 3600
+
+    # Streaming exports
+    EXPORT_BATCH_SIZE: int = 2000  # Rows fetched per server-side cursor round trip
+
+    # Live order events (Server-Sent Events)
+    SSE_HEARTBEAT_SECONDS: int = 15  # Keeps proxies from closing idle streams
+    SSE_QUEUE_SIZE: int = 100  # Per connection; oldest events dropped beyond
+
+    # Bulk imports
+    IMPORT_MAX_ROWS: int = 50000
+
+    # Password hashing/verification for logins, sign-ups and password changes
+    PASSWORD_POOL_WORKERS: int = 4  # Operations in flight per worker
+    PASSWORD_POOL_QUEUE: int = 64  # Waiting operations beyond this get a 503
+    PASSWORD_POOL_TIMEOUT_SECONDS: float = 5.0  # Longest wait for a slot
+    PASSWORD_POOL_PROCESSES: bool = False  # Process pool instead of threads
+
+    # Password hashes. New hashes use PASSWORD_HASH_SCHEME; a hash in the other
+    # scheme or with other costs is replaced at the user's next login.
+    PASSWORD_HASH_SCHEME: Literal["argon2", "bcrypt"] = "argon2"
+    ARGON2_MEMORY_COST_KIB: int = 19456  # argon2id, per hash
+    ARGON2_TIME_COST: int = 2  # Passes over the memory
+    ARGON2_PARALLELISM: int = 1
+    BCRYPT_ROUNDS: int = 12  # log2 of the bcrypt work factor
+
+    # Response compression (br/zstd when their packages are installed, else gzip)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Smaller complete bodies are sent as is
+
+    # Per-request SQL accounting (always on in development)
+    QUERY_STATS_ENABLED: bool = False
+    QUERY_REPEAT_THRESHOLD: int = 3  # Same statement shape this often: N+1
+
+    # Slow query log (admin: GET /admin/slow-queries)
+    SLOW_QUERY_THRESHOLD_MS: int = 500  # 0 turns the log off
+    SLOW_QUERY_LOG_SIZE: int = 200  # Most recent entries kept per worker
+    SLOW_QUERY_EXPLAIN_RATE: float = 0.1  # Share of slow reads re-run under EXPLAIN
+
     # Security (For JWT)
     SECRET_KEY: str 
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
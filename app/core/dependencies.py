@@ -3,14 +3,42 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.loader import Loaders, get_loaders
 from app.db.session import get_session
+from app.services.archive_service import ArchiveService
 from app.services.booking_service import BookingService
+from app.services.import_service import ImportService
 from app.services.order_service import OrderService
+from app.services.rollup_service import OrderRollupService
+from app.services.search_service import SearchService
 from app.services.service import ServiceService
 from app.services.user_service import UserService
 
-# Asynchronous database session dep annotation
-SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+async def get_unit_of_work(
+    session: Annotated[AsyncSession, Depends(get_session, scope="function")],
+):
+    """
+    One transaction per request. Services only flush (and use savepoints
+    where a failure must not undo the rest of the request); the single
+    commit happens here once the handler has returned. If it raised,
+    get_session rolls everything back instead. The only early commit is
+    app.db.session.release_connection, before slow non-database work.
+    """
+    yield session
+    if session.in_transaction():
+        await session.commit()
+
+
+# Asynchronous database session dep annotation.
+# AsyncSession only checks out a connection at its first statement; the
+# "function" scope commits and closes it (returning the connection to the
+# pool) as soon as the handler returns, before the response is sent.
+SessionDep = Annotated[AsyncSession, Depends(get_unit_of_work, scope="function")]
+
+
+def get_request_loaders(session: SessionDep) -> Loaders:
+    return get_loaders(session)
 
 
 def get_user_service(session: SessionDep) -> UserService:
@@ -29,6 +57,22 @@ def get_booking_service(session: SessionDep) -> BookingService:
     return BookingService(session)
 
 
+def get_rollup_service(session: SessionDep) -> OrderRollupService:
+    return OrderRollupService(session)
+
+
+def get_search_service(session: SessionDep) -> SearchService:
+    return SearchService(session)
+
+
+def get_archive_service(session: SessionDep) -> ArchiveService:
+    return ArchiveService(session)
+
+
+def get_import_service(session: SessionDep) -> ImportService:
+    return ImportService(session)
+
+
 # Shipment service dep annotation
 UserServiceDep = Annotated[
     UserService,
@@ -44,3 +88,13 @@ ServiceServiceDep = Annotated[
 OrderServiceDep = Annotated[OrderService, Depends(get_order_service)]
 
 BookingServiceDep = Annotated[BookingService, Depends(get_booking_service)]
+
+RollupServiceDep = Annotated[OrderRollupService, Depends(get_rollup_service)]
+
+SearchServiceDep = Annotated[SearchService, Depends(get_search_service)]
+
+ArchiveServiceDep = Annotated[ArchiveService, Depends(get_archive_service)]
+
+ImportServiceDep = Annotated[ImportService, Depends(get_import_service)]
+
+LoadersDep = Annotated[Loaders, Depends(get_request_loaders)]
@@ -0,0 +1,66 @@
+"""
+Conditional request support.
+
+Endpoints compute an ETag from something cheaper than the response itself
+(row versions, an aggregate over a covering index, a cached hash) and
+answer ``304 Not Modified`` before loading or serializing the body when
+the client's copy is still current. Writes take ``If-Match`` and only
+apply to the version the client last saw.
+"""
+
+import hashlib
+from typing import Annotated, Optional
+
+from fastapi import Header, Response, status
+
+# Request headers as endpoint parameters
+IfNoneMatch = Annotated[Optional[str], Header()]
+IfMatch = Annotated[Optional[str], Header()]
+
+
+def make_etag(*parts, weak: bool = False) -> str:
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires (RFC 9110, 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def if_match_satisfied(if_match: Optional[str], etag: str) -> bool:
+    """
+    Strong comparison, as If-Match requires (RFC 9110, 13.1.1): weak tags
+    never match. Without the header there is no precondition.
+    """
+    if not if_match:
+        return True
+    if if_match.strip() == "*":
+        return True
+    if etag.startswith("W/"):
+        return False
+    return any(tag.strip() == etag for tag in if_match.split(","))
+
+
+def conditional_response(
+    if_none_match: Optional[str], etag: str, response: Response
+) -> Optional[Response]:
+    """
+    Tag the response with ``etag``. Returns the 304 to send instead when
+    the client already has this version, otherwise None.
+    """
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return None
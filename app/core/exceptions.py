@@ -10,6 +10,54 @@ class OrderNotFoundError(AppBaseException):
         super().__init__(self.message)
 
 
+class OrderVersionConflictError(AppBaseException):
+    """Raised when an order was modified by someone else since it was read."""
+
+    def __init__(self, message="Order was modified by another request"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class OrderPreconditionFailedError(AppBaseException):
+    """Raised when a write's If-Match names a version the order is no longer at."""
+
+    def __init__(self, message="Order has changed since it was read"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class InvalidOrderTransitionError(AppBaseException):
+    """Raised when a status change is not allowed by the order state machine."""
+
+    def __init__(self, message="Invalid order status transition"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class OrderArchivedError(AppBaseException):
+    """Raised when trying to change an order that has been moved to the archive."""
+
+    def __init__(self, message="Order is archived and read-only"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class BookingConflictError(AppBaseException):
+    """Raised when a booking overlaps an existing booking for the same service."""
+
+    def __init__(self, message="Requested slot is already booked"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class InvalidBookingSlotError(AppBaseException):
+    """Raised when a booking falls outside the bookable hours."""
+
+    def __init__(self, message="Requested slot is outside booking hours"):
+        self.message = message
+        super().__init__(self.message)
+
+
 class DuplicateResourceError(AppBaseException):
     """Raised when an attempt is made to create a resource that already exists."""
 
@@ -40,5 +88,13 @@ class DatabaseCommunicationError(AppBaseException):
         super().__init__(self.message)
 
 
+class PasswordHashingBusyError(AppBaseException):
+    """Raised when the password pool is saturated and the request should retry."""
+
+    def __init__(self, message="Too many sign-in requests, try again shortly"):
+        self.message = message
+        super().__init__(self.message)
+
+
 class S3ObjectDoesntExistException(Exception):
     pass
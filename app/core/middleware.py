@@ -0,0 +1,255 @@
+import logging
+import zlib
+from typing import Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+try:
+    import brotli
+except ImportError:  # optional: gzip still works without it
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: gzip still works without it
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Report the SQL work of each request in response headers:
+
+        X-DB-Query-Count     statements executed
+        X-DB-Time-Ms         time spent in them
+        X-DB-Repeated-Query  statement shapes run ``repeat_threshold`` times
+                             or more; each one is also logged as a likely N+1
+
+    Counted up to the moment headers go out, which for a streamed response
+    is before its body is produced.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 3):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message):
+                if message["type"] == "http.response.start":
+                    repeated = stats.repeated(self.repeat_threshold)
+                    for shape, count in repeated:
+                        logger.warning(
+                            f"Possible N+1 in {scope['method']} {scope['path']}: "
+                            f"{count}x {shape}"
+                        )
+
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Time-Ms"] = f"{stats.seconds * 1000:.1f}"
+                    headers["X-DB-Repeated-Query"] = str(len(repeated))
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+
+class _Encoder:
+    """Incremental compressor: every chunk is flushed so streams keep flowing."""
+
+    def __init__(self, compress: Callable, flush: Callable, finish: Callable):
+        self._compress = compress
+        self._flush = flush
+        self._finish = finish
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compress(data) + self._flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compress(data) + self._finish()
+
+
+def _gzip_encoder(level: int) -> _Encoder:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return _Encoder(
+        compressor.compress,
+        lambda: compressor.flush(zlib.Z_SYNC_FLUSH),
+        compressor.flush,
+    )
+
+
+def _brotli_encoder(quality: int) -> _Encoder:
+    compressor = brotli.Compressor(quality=quality)
+    return _Encoder(compressor.process, compressor.flush, compressor.finish)
+
+
+def _zstd_encoder(level: int) -> _Encoder:
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return _Encoder(
+        compressor.compress,
+        lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        compressor.flush,
+    )
+
+
+# Server preference when the client accepts several with the same weight
+_PREFERENCE = ("br", "zstd", "gzip")
+
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def negotiate_encoding(
+    accept_encoding: str, available: tuple[str, ...]
+) -> Optional[str]:
+    """Best coding from an Accept-Encoding header among ``available``."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip()] = weight
+
+    wildcard = weights.get("*", 0.0)
+    candidates = [
+        (weights.get(coding, wildcard), -rank, coding)
+        for rank, coding in enumerate(available)
+    ]
+    weight, _, coding = max(candidates, default=(0.0, 0, None))
+    return coding if weight > 0 else None
+
+
+def is_compressible(content_type: str) -> bool:
+    """
+    Text-like bodies only; images, archives and the like are already packed.
+    Event streams are left alone so each event reaches the client at once.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class CompressionMiddleware:
+    """
+    Compress text-like responses with the best coding the client accepts:
+    brotli or zstd when their packages are installed, gzip otherwise.
+
+    Complete bodies smaller than ``minimum_size`` go out as they are.
+    Streamed bodies (exports) are compressed chunk by chunk, each chunk
+    flushed so the client keeps receiving data. Responses that already
+    carry a Content-Encoding, non-text media and event streams are not
+    touched. ETags are left as they are: they name the resource version,
+    not the bytes, and If-Match needs them strong. Caches tell the codings
+    apart through ``Vary: Accept-Encoding``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders: dict[str, Callable[[], _Encoder]] = {
+            "gzip": lambda: _gzip_encoder(gzip_level)
+        }
+        if brotli is not None:
+            self.encoders["br"] = lambda: _brotli_encoder(brotli_quality)
+        if zstandard is not None:
+            self.encoders["zstd"] = lambda: _zstd_encoder(zstd_level)
+        self.available = tuple(c for c in _PREFERENCE if c in self.encoders)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.available
+        )
+        start: Optional[Message] = None
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    message["status"] < 200
+                    or message["status"] in (204, 304)
+                    or "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type", ""))
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # Held back until the first body chunk shows the size
+                    start = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start is not None:
+                headers = MutableHeaders(scope=start)
+                headers.add_vary_header("Accept-Encoding")
+                if coding is None or (not more_body and len(body) < self.minimum_size):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                encoder = self.encoders[coding]()
+                headers["Content-Encoding"] = coding
+                if more_body:
+                    del headers["Content-Length"]
+                    body = encoder.chunk(body)
+                else:
+                    body = encoder.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                await send(start)
+                start = None
+            elif more_body:
+                body = encoder.chunk(body)
+            else:
+                body = encoder.finish(body)
+
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_compressed)
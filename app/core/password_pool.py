@@ -0,0 +1,112 @@
+"""
+Bounded executor for password hashing and verification.
+
+A bcrypt hash costs a few hundred milliseconds of CPU; run on the event
+loop it stalls every other request of the worker. Operations here run on a
+dedicated pool (threads by default, processes with PASSWORD_POOL_PROCESSES)
+with at most PASSWORD_POOL_WORKERS in flight. Callers beyond that wait, up
+to PASSWORD_POOL_QUEUE of them and PASSWORD_POOL_TIMEOUT_SECONDS each;
+anything more is rejected with PasswordHashingBusyError so a login flood
+sheds load instead of growing an unbounded backlog.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+from app.core.exceptions import PasswordHashingBusyError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PasswordPool:
+    workers: int
+    max_queue: int
+    queue_timeout: float
+    use_processes: bool = False
+    running: int = field(init=False, default=0)
+    waiting: int = field(init=False, default=0)
+    completed: int = field(init=False, default=0)
+    rejected: int = field(init=False, default=0)
+    _executor: Optional[Executor] = field(init=False, default=None)
+    _slots: Optional[asyncio.Semaphore] = field(init=False, default=None)
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password"
+                )
+        return self._executor
+
+    async def run(self, fn: Callable, *args) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+
+        if not self._slots.locked():
+            # A free slot is taken without yielding to the loop
+            await self._slots.acquire()
+        else:
+            if self.waiting >= self.max_queue:
+                self._reject("queue full")
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._reject("timed out waiting for a slot")
+            finally:
+                self.waiting -= 1
+
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._slots.release()
+
+    def _reject(self, reason: str):
+        self.rejected += 1
+        logger.warning(
+            "Password operation rejected (%s): %d running, %d waiting",
+            reason,
+            self.running,
+            self.waiting,
+        )
+        raise PasswordHashingBusyError()
+
+    def stats(self) -> dict:
+        return {
+            "mode": "process" if self.use_processes else "thread",
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+# Singleton instance
+_password_pool: PasswordPool = None
+
+
+def get_password_pool() -> PasswordPool:
+    """Get singleton password pool instance"""
+    global _password_pool
+    if _password_pool is None:
+        _password_pool = PasswordPool(
+            workers=settings.PASSWORD_POOL_WORKERS,
+            max_queue=settings.PASSWORD_POOL_QUEUE,
+            queue_timeout=settings.PASSWORD_POOL_TIMEOUT_SECONDS,
+            use_processes=settings.PASSWORD_POOL_PROCESSES,
+        )
+    return _password_pool
@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -9,13 +10,28 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.password_pool import get_password_pool
 from app.schemas.user import UserAuthPayload
 
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# The configured scheme hashes, the other one only verifies. deprecated="auto"
+# makes verify_and_update flag its hashes, as well as hashes with outdated costs.
+PASSWORD_SCHEMES = [settings.PASSWORD_HASH_SCHEME] + [
+    scheme for scheme in ("argon2", "bcrypt") if scheme != settings.PASSWORD_HASH_SCHEME
+]
+
+pwd_context = CryptContext(
+    schemes=PASSWORD_SCHEMES,
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 security = HTTPBearer()
 
@@ -28,6 +44,53 @@ def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the password pool, off the event loop."""
+    return await get_password_pool().run(get_password_hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password on the password pool, off the event loop."""
+    return await get_password_pool().run(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Whether the password matches and, if it does but the stored hash is in a
+    deprecated scheme or has outdated costs, a new hash to store instead.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _hash_many(passwords: List[str]) -> List[str]:
+    return [pwd_context.hash(password) for password in passwords]
+
+
+async def hash_passwords(passwords: List[str], chunk_size: int = 8) -> List[str]:
+    """
+    Hash many passwords on the password pool, in order. Chunks go to the
+    pool a few at a time, leaving half of its slots to logins.
+    """
+    pool = get_password_pool()
+    chunks = [
+        passwords[i : i + chunk_size] for i in range(0, len(passwords), chunk_size)
+    ]
+    in_flight = max(1, pool.workers // 2)
+    hashed = []
+    for i in range(0, len(chunks), in_flight):
+        results = await asyncio.gather(
+            *(pool.run(_hash_many, chunk) for chunk in chunks[i : i + in_flight])
+        )
+        hashed.extend(h for chunk in results for h in chunk)
+    return hashed
+
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     # expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -0,0 +1,44 @@
+"""
+Work that must only happen once the request's transaction has committed.
+
+In-process state that mirrors the database (the availability index, the
+catalog cache) must not change while the write can still roll back:
+
+    on_commit(self.session, lambda: index.add(service_id, start, end))
+
+Callbacks run after the outermost commit, in order; they are dropped if
+the transaction rolls back instead. Savepoint releases do not count.
+"""
+
+import logging
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+logger = logging.getLogger(__name__)
+
+_KEY = "on_commit"
+
+
+def on_commit(session, callback: Callable[[], None]):
+    """Run ``callback`` after ``session`` (sync or async) next commits."""
+    session.info.setdefault(_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_callbacks(session: Session):
+    if session.in_nested_transaction():
+        return
+    for callback in session.info.pop(_KEY, []):
+        try:
+            callback()
+        except Exception:
+            # The data is committed; a stale mirror beats a failed request
+            logger.exception("on_commit callback failed")
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_callbacks(session: Session, transaction: SessionTransaction):
+    if transaction.parent is None:
+        session.info.pop(_KEY, None)
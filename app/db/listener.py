@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from typing import Callable
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NotificationCallback = Callable[[str], None]
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """Turn the SQLAlchemy URL into a DSN asyncpg understands."""
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class PgListener:
+    """
+    LISTEN on Postgres channels over one dedicated connection.
+
+    A pooled connection cannot be used: LISTEN belongs to the session and
+    the pool hands the connection to other requests. If the connection
+    drops it is re-established and every channel is listened to again;
+    notifications sent in between are lost, so consumers must also catch
+    up on their own from time to time.
+    """
+
+    def __init__(self, dsn: str | None = None, reconnect_seconds: float = 5.0):
+        self.dsn = dsn or asyncpg_dsn(settings.DATABASE_URL)
+        self.reconnect_seconds = reconnect_seconds
+        self._conn: asyncpg.Connection | None = None
+        self._callbacks: dict[str, list[NotificationCallback]] = {}
+        self._reconnect_task: asyncio.Task | None = None
+        self._closed = False
+
+    async def listen(self, channel: str, callback: NotificationCallback):
+        """Call ``callback(payload)`` for every notification on ``channel``."""
+        first = channel not in self._callbacks
+        self._callbacks.setdefault(channel, []).append(callback)
+
+        if self._conn is None:
+            await self._connect()
+        elif first:
+            await self._conn.add_listener(channel, self._notify)
+
+    async def close(self):
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._conn is not None and not self._conn.is_closed():
+            await self._conn.close()
+        self._conn = None
+
+    async def _connect(self):
+        self._conn = await asyncpg.connect(self.dsn)
+        self._conn.add_termination_listener(self._on_terminated)
+        for channel in self._callbacks:
+            await self._conn.add_listener(channel, self._notify)
+
+    def _notify(self, _conn, _pid, channel: str, payload: str):
+        for callback in self._callbacks.get(channel, ()):
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception(f"Notification callback failed on {channel}")
+
+    def _on_terminated(self, _conn):
+        if self._closed:
+            return
+        logger.warning("LISTEN connection lost, reconnecting")
+        self._conn = None
+        self._reconnect_task = asyncio.get_running_loop().create_task(
+            self._reconnect()
+        )
+
+    async def _reconnect(self):
+        while not self._closed:
+            try:
+                await self._connect()
+                # Tell everyone they may have missed notifications
+                for channel in self._callbacks:
+                    self._notify(None, None, channel, "")
+                return
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"LISTEN reconnect failed: {e}")
+                await asyncio.sleep(self.reconnect_seconds)
+
+
+# Singleton instance
+_pg_listener: PgListener = None
+
+
+def get_pg_listener() -> PgListener:
+    """Get the worker's shared LISTEN connection"""
+    global _pg_listener
+    if _pg_listener is None:
+        _pg_listener = PgListener()
+    return _pg_listener
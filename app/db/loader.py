@@ -0,0 +1,134 @@
+"""
+Request-scoped batch loading by primary key.
+
+Code that needs related rows one at a time (a client per order, a service
+per booking) calls ``load(id)`` instead of querying. Every load issued in
+the same event-loop tick is coalesced into one
+``SELECT ... WHERE id = ANY(:ids)``, and each id is fetched at most once
+per request:
+
+    loaders = get_loaders(self.session)
+    clients = await loaders.users.load_many(o["client_id"] for o in orders)
+
+Loaders live in ``session.info``, so they share the request's session and
+unit of work and are dropped with it.
+
+A loader given ``columns`` selects only those and resolves to read-only row
+mappings instead of entities, so lookups that need a name or two do not
+pull whole rows (password hashes included) into the request.
+"""
+
+import asyncio
+from typing import Any, Hashable, Iterable, Optional, Sequence
+
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.models.order_image import OrderImage
+from app.models.service import Service
+from app.models.user import User
+
+
+class DataLoader:
+    """
+    Batches lookups of ``model`` by its ``id`` column. A missing id
+    resolves to None.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model,
+        lock: Optional[asyncio.Lock] = None,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+    ):
+        self.session = session
+        self.model = model
+        if columns is not None and "id" not in {c.key for c in columns}:
+            columns = (model.id, *columns)
+        self.columns = columns
+        # A session runs one statement at a time; loaders sharing it share this
+        self._lock = lock or asyncio.Lock()
+        self._results: dict[Hashable, asyncio.Future] = {}
+        self._queue: list[Hashable] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, key: Hashable) -> asyncio.Future:
+        future = self._results.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._results[key] = loop.create_future()
+            if not self._queue:
+                # Runs once the callers of this tick have queued their keys
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> list[Any]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any):
+        """Seed an already loaded row so a later ``load`` does not query."""
+        if key not in self._results:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._results[key] = future
+
+    def _dispatch(self):
+        keys, self._queue = self._queue, []
+        task = asyncio.get_running_loop().create_task(self._load_batch(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, keys: list[Hashable]):
+        try:
+            async with self._lock:
+                rows = await self.fetch(keys)
+        except Exception as e:
+            for key in keys:
+                # Forget failed keys so a later load can retry them
+                future = self._results.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key in keys:
+            future = self._results[key]
+            if not future.done():
+                future.set_result(rows.get(key))
+
+    async def fetch(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        pk = self.model.id
+        ids = bindparam("ids", list(keys), type_=ARRAY(pk.type))
+        if self.columns is None:
+            result = await self.session.execute(
+                select(self.model).where(pk == any_(ids))
+            )
+            return {row.id: row for row in result.scalars().all()}
+
+        result = await self.session.execute(
+            select(*self.columns).where(pk == any_(ids))
+        )
+        return {row["id"]: row for row in result.mappings().all()}
+
+
+class Loaders:
+    """The loaders of one request."""
+
+    def __init__(self, session: AsyncSession):
+        lock = asyncio.Lock()
+        self.users = DataLoader(
+            session, User, lock, columns=(User.first_name, User.last_name)
+        )
+        self.services = DataLoader(session, Service, lock, columns=(Service.name,))
+        self.order_images = DataLoader(session, OrderImage, lock)
+
+
+def get_loaders(session: AsyncSession) -> Loaders:
+    """The loaders bound to ``session`` (one session per request)."""
+    loaders = session.info.get("loaders")
+    if loaders is None:
+        loaders = session.info["loaders"] = Loaders(session)
+    return loaders
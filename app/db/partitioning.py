@@ -0,0 +1,315 @@
+"""
+Monthly range partitions for the tables that grow without bound.
+
+``orders`` is partitioned by ``created_at`` and ``order_images`` by
+``uploaded_at``. Each month gets its own partition named
+``<table>_pYYYY_MM``; a ``<table>_default`` partition catches rows outside
+every defined month so an insert never fails for lack of a partition.
+
+Every worker creates the upcoming months at startup
+(PARTITION_ENSURE_ON_STARTUP); the same jobs can also run from cron (or any
+scheduler):
+
+    python -m app.db.partitioning ensure   # create upcoming months
+    python -m app.db.partitioning detach   # detach archived months past retention
+
+If months were missed anyway, ``ensure`` moves their rows out of the
+default partition into the new month.
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings as app_config
+
+logger = logging.getLogger(__name__)
+
+# Partitioned table -> partition key column
+PARTITIONED_TABLES = {
+    "orders": "created_at",
+    "order_images": "uploaded_at",
+}
+
+# Non-partitioned table registering every orders.id; a partitioned table
+# cannot have a unique key on id alone, nor be referenced by one
+ORDER_ID_REGISTRY = "order_ids"
+
+# Tables created by migrations that have no model
+UNMAPPED_TABLES = {ORDER_ID_REGISTRY}
+
+_PARTITION_NAME = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    """The month a partition covers, parsed back from its name."""
+    match = _PARTITION_NAME.search(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _bounds(month: date) -> tuple[str, str]:
+    start = month_start(month)
+    end = add_months(start, 1)
+    return f"'{start.isoformat()} 00:00:00+00'", f"'{end.isoformat()} 00:00:00+00'"
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    """DDL for the partition holding one UTC calendar month of ``table``."""
+    start, end = _bounds(month)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ({start}) TO ({end})"
+    )
+
+
+def month_filter_sql(table: str, month: date) -> str:
+    """WHERE condition selecting one UTC calendar month of ``table``."""
+    key = PARTITIONED_TABLES[table]
+    start, end = _bounds(month)
+    return f"{key} >= {start} AND {key} < {end}"
+
+
+def create_default_partition_sql(table: str) -> str:
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+
+
+def detach_partition_sql(table: str, month: date) -> str:
+    # Not CONCURRENTLY: Postgres refuses that while a default partition exists
+    return f"ALTER TABLE {table} DETACH PARTITION {partition_name(table, month)}"
+
+
+def months_between(first: date, last: date) -> list[date]:
+    """Every month from ``first`` to ``last`` inclusive."""
+    months = []
+    current = month_start(first)
+    while current <= last:
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def _this_month() -> date:
+    return month_start(datetime.now(timezone.utc).date())
+
+
+async def attached_partitions(conn: AsyncConnection, table: str) -> list[str]:
+    result = await conn.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :table
+            ORDER BY child.relname
+            """
+        ),
+        {"table": table},
+    )
+    return list(result.scalars().all())
+
+
+async def ensure_partitions(
+    conn: AsyncConnection, months_ahead: int | None = None
+) -> list[str]:
+    """
+    Create this month's partition and the next ``months_ahead`` ones.
+
+    Partitions should exist before rows for them arrive. A month whose rows
+    already landed in the default partition is created from them: Postgres
+    refuses to add a partition whose rows sit in the default one.
+
+    Returns:
+        Names of the partitions that did not exist yet
+    """
+    if months_ahead is None:
+        months_ahead = app_config.PARTITION_MONTHS_AHEAD
+
+    # Workers starting together (and cron) take turns
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('partitions'))"))
+
+    this_month = _this_month()
+    months = months_between(this_month, add_months(this_month, months_ahead))
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        existing = set(await attached_partitions(conn, table))
+        has_default = f"{table}_default" in existing
+        for month in months:
+            if partition_name(table, month) in existing:
+                continue
+            if has_default and await _default_holds(conn, table, month):
+                await _create_from_default(conn, table, month)
+            else:
+                await conn.execute(text(create_partition_sql(table, month)))
+            created.append(partition_name(table, month))
+    return created
+
+
+async def _default_holds(conn: AsyncConnection, table: str, month: date) -> bool:
+    return await conn.scalar(
+        text(
+            f"SELECT EXISTS (SELECT 1 FROM {table}_default "
+            f"WHERE {month_filter_sql(table, month)})"
+        )
+    )
+
+
+async def _create_from_default(conn: AsyncConnection, table: str, month: date):
+    """
+    Create a month's partition and move its rows there from the default one.
+
+    The rows go straight into the partition: statement triggers on the
+    parent (the order id registry) do not fire, and the rows keep ids that
+    are already registered.
+    """
+    name = partition_name(table, month)
+    logger.warning("Moving %s rows out of %s_default", name, table)
+
+    columns = ", ".join(await _insertable_columns(conn, table))
+    where = month_filter_sql(table, month)
+    await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {table}_default"))
+    await conn.execute(text(create_partition_sql(table, month)))
+    await conn.execute(
+        text(
+            f"INSERT INTO {name} ({columns}) "
+            f"SELECT {columns} FROM {table}_default WHERE {where}"
+        )
+    )
+    await conn.execute(text(f"DELETE FROM {table}_default WHERE {where}"))
+    await conn.execute(
+        text(f"ALTER TABLE {table} ATTACH PARTITION {table}_default DEFAULT")
+    )
+
+
+async def _insertable_columns(conn: AsyncConnection, table: str) -> list[str]:
+    result = await conn.execute(
+        text(
+            """
+            SELECT quote_ident(column_name)
+            FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = :table
+              AND is_generated = 'NEVER'
+            ORDER BY ordinal_position
+            """
+        ),
+        {"table": table},
+    )
+    return list(result.scalars().all())
+
+
+async def ensure_partitions_on_startup():
+    """Create upcoming partitions; failures are logged, never fatal."""
+    from app.db.session import engine
+
+    try:
+        async with engine.begin() as conn:
+            created = await ensure_partitions(conn)
+    except Exception:
+        logger.exception("Could not create upcoming partitions")
+        return
+    for name in created:
+        logger.info(f"Created partition {name}")
+
+
+async def partition_is_empty(conn: AsyncConnection, name: str) -> bool:
+    return not await conn.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {name})"))
+
+
+async def detach_partitions(
+    conn: AsyncConnection, retain_months: int | None = None
+) -> list[str]:
+    """
+    Detach monthly partitions older than ``retain_months``.
+
+    A month is detached only once every table's partition for it is empty,
+    i.e. the archive job has moved its finished orders and their images
+    out, and then for all tables together. Rows still in a detached
+    partition would vanish from every read (the archive fallback included),
+    and an image month can hold images of orders from other months.
+
+    Detached partitions stay in the database as ordinary tables, so they can
+    be archived or dropped separately without touching the live table.
+
+    Returns:
+        Names of the detached partitions
+    """
+    if retain_months is None:
+        retain_months = app_config.PARTITION_RETAIN_MONTHS
+
+    cutoff = add_months(_this_month(), -retain_months)
+
+    # month -> {table: partition name} for every expired partition
+    expired: dict[date, dict[str, str]] = {}
+    for table in PARTITIONED_TABLES:
+        for name in await attached_partitions(conn, table):
+            month = partition_month(name)
+            if month is not None and month < cutoff:
+                expired.setdefault(month, {})[table] = name
+
+    detached = []
+    for month, partitions in sorted(expired.items()):
+        busy = [
+            name
+            for name in partitions.values()
+            if not await partition_is_empty(conn, name)
+        ]
+        if busy:
+            logger.warning(
+                "Not detaching %s: %s still hold rows; archive them first",
+                month.strftime("%Y-%m"),
+                ", ".join(busy),
+            )
+            continue
+        for table, name in partitions.items():
+            await conn.execute(text(detach_partition_sql(table, month)))
+            detached.append(name)
+    return detached
+
+
+async def _main(argv: list[str] | None = None):
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(prog="python -m app.db.partitioning")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ensure = commands.add_parser("ensure", help="create upcoming partitions")
+    ensure.add_argument("--months-ahead", type=int, default=None)
+    detach = commands.add_parser("detach", help="detach expired partitions")
+    detach.add_argument("--retain-months", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    async with engine.begin() as conn:
+        if args.command == "ensure":
+            names = await ensure_partitions(conn, args.months_ahead)
+        else:
+            names = await detach_partitions(conn, args.retain_months)
+    await engine.dispose()
+
+    for name in names:
+        print(f"{args.command}: {name}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,29 @@
+"""
+Column projections for list reads.
+
+A list endpoint that only serializes a response schema does not need the
+ORM entities behind it: selecting just the schema's columns skips unused
+(and sensitive) columns, identity-map bookkeeping and change tracking, and
+the row mappings validate straight into the response model.
+"""
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+
+def response_columns(model, schema: type[BaseModel]) -> list:
+    """
+    The mapped columns of ``model`` that ``schema`` serializes, in field order.
+    Fails at import time if the schema has a field the model does not map.
+    """
+    attrs = inspect(model).column_attrs
+    missing = [name for name in schema.model_fields if name not in attrs]
+    if missing:
+        raise ValueError(
+            f"{schema.__name__} fields not mapped on {model.__name__}: {missing}"
+        )
+    return [attrs[name].class_attribute for name in schema.model_fields]
+
+
+def rows_as_dicts(result) -> list[dict]:
+    return [dict(row) for row in result.mappings().all()]
@@ -0,0 +1,127 @@
+"""
+Per-request accounting of SQL statements.
+
+Engine event hooks add every statement executed while a ``QueryStats`` is
+active (see ``track_queries``) to it, keyed by statement shape so that the
+same query issued over and over inside one request (the N+1 pattern)
+stands out.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PARAM = re.compile(r"\$\d+|%\(\w+\)s|\?|(?<!:):(?!:)\w+")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)*\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_SPACE = re.compile(r"\s+")
+
+
+def query_stats_enabled() -> bool:
+    return settings.QUERY_STATS_ENABLED or settings.ENVIRONMENT == "development"
+
+
+def statement_shape(statement: str) -> str:
+    """
+    The statement with parameters, literals and IN-list lengths erased, so
+    the same query with different arguments has the same shape.
+    """
+    shape = _PARAM.sub("?", statement)
+    shape = _LITERAL.sub("?", shape)
+    shape = _PARAM_LIST.sub("(?)", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Shapes executed at least ``threshold`` times, most frequent first."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed in this context (and tasks it spawns)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """
+    Fail if the block runs more than ``max_queries`` statements.
+
+        with query_budget(2):
+            await service.getOrderImages(order_id)
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        shapes = "\n".join(
+            f"  {count}x {shape}" for shape, count in stats.shapes.items()
+        )
+        raise QueryBudgetExceeded(
+            f"{stats.count} queries, budget is {max_queries}:\n{shapes}"
+        )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    started = conn.info.get("query_stats_start")
+    if not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+def install(engine: Engine):
+    """Hook the engine (the sync engine behind an AsyncEngine) once."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.db import query_stats
+from app.db.slow_queries import get_slow_query_log
 
 DATABASE_URL = settings.DATABASE_URL
 
@@ -13,11 +15,32 @@ engine = create_async_engine(
     pool_size=10,  # Number of permanent connections
     max_overflow=20,
 )
+if query_stats.query_stats_enabled():
+    query_stats.install(engine.sync_engine)
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    get_slow_query_log().install(engine.sync_engine, explain_engine=engine)
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
 )
 
 
+async def release_connection(session: AsyncSession):
+    """
+    Hand the session's pooled connection back before slow work that does
+    not need the database (storage uploads, remote calls).
+
+    This is the one sanctioned exception to committing once per request in
+    get_unit_of_work: it commits whatever the request has flushed so far.
+    Only call it when nothing was written yet, or when everything written
+    must survive even if the slow work then fails. Loaded objects stay
+    usable (expire_on_commit=False); the next statement checks out a
+    connection again and the unit of work commits the rest as usual.
+    """
+    if session.in_transaction():
+        await session.commit()
+
+
 async def get_session():
     """
     Asynchronous Dependency Injection for FastAPI.
@@ -0,0 +1,195 @@
+"""
+Slow query log.
+
+Statements slower than SLOW_QUERY_THRESHOLD_MS are kept in a per-worker
+ring buffer with their parameter types (never the values) and duration.
+A sampled share of slow read-only statements is re-run under
+``EXPLAIN (ANALYZE, BUFFERS)`` on a separate connection, off the request
+path, and the plan is attached to the entry.
+"""
+
+import asyncio
+import itertools
+import logging
+import random
+import re
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Execution option that keeps a statement out of the log (the EXPLAINs)
+SKIP_OPTION = "slow_query_log"
+
+_READ_ONLY = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+_WRITES = re.compile(
+    r"\b(insert|update|delete|merge|for\s+(no\s+key\s+)?update|for\s+share)\b",
+    re.IGNORECASE,
+)
+
+
+def explainable(statement: str) -> bool:
+    """
+    Only plain reads are re-run: EXPLAIN ANALYZE executes the statement.
+    The EXPLAIN also runs in a read-only transaction that is rolled back.
+    """
+    return bool(_READ_ONLY.match(statement)) and not _WRITES.search(statement)
+
+
+def parameter_shape(parameters) -> Any:
+    """Parameter types, so entries show how a statement was called without data."""
+    if isinstance(parameters, Mapping):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return None
+
+
+@dataclass
+class SlowQuery:
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any
+    # executemany: number of parameter sets, the shape is the first one's
+    rows: Optional[int] = None
+    plan: Optional[str] = None
+    plan_error: Optional[str] = None
+
+
+@dataclass
+class SlowQueryLog:
+    threshold_ms: float
+    capacity: int
+    explain_rate: float
+    explain_timeout_ms: int = 30000
+    max_pending_explains: int = 2
+    entries: deque = field(init=False)
+    _ids: itertools.count = field(
+        init=False, default_factory=lambda: itertools.count(1)
+    )
+    _explain_engine: Optional[AsyncEngine] = field(init=False, default=None)
+    _pending: set = field(init=False, default_factory=set)
+
+    def __post_init__(self):
+        self.entries = deque(maxlen=self.capacity)
+
+    def recent(self, limit: Optional[int] = None) -> list[SlowQuery]:
+        """Newest first."""
+        entries = list(reversed(self.entries))
+        return entries[:limit] if limit is not None else entries
+
+    def clear(self):
+        self.entries.clear()
+
+    def record(
+        self, statement: str, parameters, seconds: float, executemany: bool = False
+    ) -> Optional[SlowQuery]:
+        duration_ms = seconds * 1000
+        if duration_ms < self.threshold_ms:
+            return None
+
+        entry = SlowQuery(
+            id=next(self._ids),
+            recorded_at=datetime.now(timezone.utc),
+            duration_ms=round(duration_ms, 3),
+            statement=statement,
+            parameters=parameter_shape(parameters[0] if executemany else parameters),
+            rows=len(parameters) if executemany else None,
+        )
+        self.entries.append(entry)
+        logger.warning("Slow query (%.1f ms): %s", duration_ms, statement)
+
+        if not executemany and self._should_explain(statement):
+            self._schedule_explain(entry, parameters)
+        return entry
+
+    def _should_explain(self, statement: str) -> bool:
+        return (
+            self._explain_engine is not None
+            and len(self._pending) < self.max_pending_explains
+            and random.random() < self.explain_rate
+            and explainable(statement)
+        )
+
+    def _schedule_explain(self, entry: SlowQuery, parameters):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.explain(entry, parameters))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def explain(self, entry: SlowQuery, parameters):
+        """Attach the EXPLAIN (ANALYZE, BUFFERS) plan of a logged statement."""
+        try:
+            async with self._explain_engine.connect() as conn:
+                conn = await conn.execution_options(**{SKIP_OPTION: False})
+                await conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+                await conn.exec_driver_sql(
+                    f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}"
+                )
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {entry.statement}", parameters
+                )
+                entry.plan = "\n".join(row[0] for row in result.all())
+                await conn.rollback()
+        except Exception as e:
+            entry.plan_error = str(e)
+            logger.info("EXPLAIN of slow query %s failed: %s", entry.id, e)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        started = conn.info.get("slow_query_start")
+        if not started:
+            return
+        seconds = time.perf_counter() - started.pop()
+        if context is not None and not context.execution_options.get(SKIP_OPTION, True):
+            return
+        self.record(statement, parameters, seconds, executemany)
+
+    def install(self, engine: Engine, explain_engine: Optional[AsyncEngine] = None):
+        """
+        Time every statement on ``engine`` (the sync engine behind an
+        AsyncEngine). Plans are only captured when ``explain_engine`` is given.
+        """
+        self._explain_engine = explain_engine
+        if not event.contains(
+            engine, "before_cursor_execute", self._before_cursor_execute
+        ):
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+
+# Singleton instance
+_slow_query_log: SlowQueryLog = None
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """Get singleton slow query log instance"""
+    global _slow_query_log
+    if _slow_query_log is None:
+        _slow_query_log = SlowQueryLog(
+            threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+            capacity=settings.SLOW_QUERY_LOG_SIZE,
+            explain_rate=settings.SLOW_QUERY_EXPLAIN_RATE,
+        )
+    return _slow_query_log
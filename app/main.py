@@ -4,13 +4,32 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 import app.models
-from app.api.v1.endpoints import booking, order, service, user
+from app.api.v1.endpoints import admin, booking, order, service, user
 from app.core.config import settings
+from app.core.middleware import CompressionMiddleware, QueryStatsMiddleware
+from app.db.listener import get_pg_listener
+from app.db.partitioning import ensure_partitions_on_startup
+from app.db.query_stats import query_stats_enabled
+from app.services.order_events import get_order_event_broker
+from app.services.outbox_service import get_outbox_dispatcher
+from app.services.service import listen_for_catalog_changes
 
 
 @asynccontextmanager
 async def lifespan_handler(app: FastAPI):
+    if settings.PARTITION_ENSURE_ON_STARTUP:
+        await ensure_partitions_on_startup()
+    # One LISTEN connection per worker, shared by the outbox dispatcher,
+    # the live order event broker and the catalog cache
+    listener = get_pg_listener()
+    dispatcher = get_outbox_dispatcher()
+    if settings.OUTBOX_DISPATCHER_ENABLED:
+        await dispatcher.start(listener)
+    await get_order_event_broker().start(listener)
+    await listen_for_catalog_changes(listener)
     yield
+    await dispatcher.stop()
+    await listener.close()
 
 
 app = FastAPI(
@@ -35,12 +54,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if query_stats_enabled():
+    app.add_middleware(
+        QueryStatsMiddleware, repeat_threshold=settings.QUERY_REPEAT_THRESHOLD
+    )
+
+# Outermost, so it sees the final headers of every response
+app.add_middleware(
+    CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE
+)
+
 # Mount API
 # app.include_router(auth.router, prefix="/api/v1/auth", tags=["Auth"])
 app.include_router(user.router, prefix="/api/v1/user", tags=["User"])
 app.include_router(service.router, prefix="/api/v1/service", tags=["Service"])
 app.include_router(order.router, prefix="/api/v1/order", tags=["Order"])
 app.include_router(booking.router, prefix="/api/v1/booking", tags=["Booking"])
+app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
 
 
 @app.get("/health", tags=["Monitoring"])
@@ -1,6 +1,14 @@
+from .archive import OrderArchive, OrderImageArchive
 from .booking import Booking
 from .gallery import Gallery
 from .order import Order
 from .order_image import OrderImage
+from .outbox import OutboxEvent
+from .rollup import (
+    OrderDailyRevenue,
+    OrderRevenueTotal,
+    OrderStatusCount,
+    ServiceOrderVolume,
+)
 from .service import Service
 from .user import User
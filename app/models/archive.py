@@ -0,0 +1,80 @@
+from sqlalchemy import Column, DateTime, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+
+from app.models.base import Base, default_timestamp
+
+# Cold tier for finished orders. Rows are moved here by ArchiveService and
+# are read-only from then on; the enum types are owned by the hot tables.
+
+
+class OrderArchive(Base):
+    __tablename__ = "orders_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    client_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    service_id = Column(UUID(as_uuid=True), nullable=False)
+
+    status = Column(
+        ENUM(
+            "pending",
+            "in_progress",
+            "ready",
+            "completed",
+            "cancelled",
+            name="order_status_enum",
+            create_type=False,
+        ),
+        nullable=False,
+    )
+    description = Column(String, nullable=False)
+    requested_date = Column(DateTime(timezone=True), nullable=False)
+    estimated_completion = Column(DateTime(timezone=True), nullable=False)
+    actual_completion = Column(DateTime(timezone=True), nullable=True)
+    quoted_price = Column(Numeric(precision=10, scale=2), nullable=False)
+    actual_price = Column(Numeric(precision=10, scale=2), nullable=True)
+    notes = Column(String, nullable=True)
+    priority = Column(
+        ENUM(
+            "normal", "high", "urgent", name="order_priority_enum", create_type=False
+        ),
+        nullable=True,
+    )
+    version = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    archived_at = default_timestamp()
+
+    def __repr__(self):
+        return f"<OrderArchive(status='{self.status}', client_id='{self.client_id}')>"
+
+
+class OrderImageArchive(Base):
+    __tablename__ = "order_images_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    order_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    uploaded_by = Column(UUID(as_uuid=True), nullable=False)
+
+    s3_url = Column(String)
+    # Points at the archived copy once the object has been moved
+    s3_object_path = Column(String)
+    image_type = Column(
+        ENUM(
+            "before",
+            "after",
+            "reference",
+            "instruction",
+            name="image_type_enum",
+            create_type=False,
+        ),
+        nullable=False,
+    )
+
+    uploaded_at = Column(DateTime(timezone=True), nullable=False)
+    archived_at = default_timestamp()
+
+    def __repr__(self):
+        return (
+            f"<OrderImageArchive(order_id='{self.order_id}', type='{self.image_type}')>"
+        )
@@ -1,7 +1,7 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, String, event, func, text
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -15,8 +15,29 @@ class Booking(Base):
     service_id = Column(UUID(as_uuid=True), ForeignKey("services.id"), nullable=False)
     status = Column(String(50), default="pending", nullable=False)
     appointment_time = Column(DateTime(timezone=True), nullable=False)  # <-- add this
+    appointment_end = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # # Relationships (optional, but useful for joins)
     users = relationship("User", back_populates="bookings")
     service = relationship("Service", back_populates="bookings")
+
+    __table_args__ = (
+        # No two live bookings of one service may overlap. The GiST index
+        # behind it also serves the availability range lookups.
+        ExcludeConstraint(
+            ("service_id", "="),
+            (text("tstzrange(appointment_time, appointment_end, '[)')"), "&&"),
+            using="gist",
+            where=text("status <> 'cancelled'"),
+            name="bookings_no_overlap",
+        ),
+    )
+
+
+# btree_gist provides the "=" operator on uuid inside a GiST exclusion constraint
+event.listen(
+    Booking.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"),
+)
@@ -1,13 +1,31 @@
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, deferred, mapped_column, relationship
 
 from app.models.base import Base, default_timestamp, default_uuid
 
+# Statuses admins work from day to day; partial indexes cover only these
+ACTIVE_ORDER_STATUSES = ("pending", "in_progress")
+_ACTIVE = "status IN (%s)" % ", ".join(f"'{s}'" for s in ACTIVE_ORDER_STATUSES)
+
 
 class Order(Base):
     __tablename__ = "orders"
 
+    # The table is partitioned by created_at (app/db/partitioning.py), so
+    # its database primary key is (id, created_at); the order_ids registry
+    # keeps id unique on its own. The ORM only needs id.
     id = default_uuid()
 
     # # Foreign Keys
@@ -48,6 +66,21 @@ class Order(Base):
         default="normal",
     )
 
+    # Full-text search document, maintained by Postgres; never loaded by default
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', "
+                "coalesce(description, '') || ' ' || coalesce(notes, ''))",
+                persisted=True,
+            ),
+        )
+    )
+
+    # Optimistic concurrency: bumped on every write, checked on every update
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
     # Timestamps
     created_at = default_timestamp()
     updated_at = default_timestamp(update=True)
@@ -57,5 +90,31 @@ class Order(Base):
     service = relationship("Service", back_populates="orders")
     images = relationship("OrderImage", back_populates="orders")
 
+    __mapper_args__ = {"version_id_col": version}
+
+    __table_args__ = (
+        Index("ix_orders_search_vector", "search_vector", postgresql_using="gin"),
+        # Covers the order list ETag aggregate (index-only scan)
+        Index(
+            "ix_orders_client_etag", "client_id", postgresql_include=["id", "version"]
+        ),
+        Index(
+            "ix_orders_active_requested_date",
+            "status",
+            "requested_date",
+            postgresql_where=text(_ACTIVE),
+        ),
+        Index(
+            "ix_orders_active_estimated_completion",
+            "estimated_completion",
+            postgresql_where=text(_ACTIVE),
+        ),
+        Index(
+            "ix_orders_urgent_requested_date",
+            "requested_date",
+            postgresql_where=text(f"priority = 'urgent' AND {_ACTIVE}"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Order(status='{self.status}', client_id='{self.client_id}')>"
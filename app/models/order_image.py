@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, ForeignKey, String
+from sqlalchemy import Column, Enum, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -8,11 +8,24 @@ from app.models.base import Base, default_timestamp, default_uuid
 class OrderImage(Base):
     __tablename__ = "order_images"
 
+    # Partitioned by uploaded_at like orders; the database key is
+    # (id, uploaded_at)
     id = default_uuid()
 
     # Foreign Keys
+    # orders.id is not a key Postgres can reference once orders is
+    # partitioned, so in the database this references the order_ids
+    # registry instead. Declared against orders for the relationship and
+    # create_all; autogenerate leaves it alone (see alembic/env.py).
     order_id = Column(
-        UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False, index=True
+        UUID(as_uuid=True),
+        ForeignKey(
+            "orders.id",
+            name="order_images_order_id_fkey",
+            info={"autogenerate": False},
+        ),
+        nullable=False,
+        index=True,
     )
     uploaded_by = Column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
@@ -33,5 +46,10 @@ class OrderImage(Base):
     orders = relationship("Order", back_populates="images")
     uploader = relationship("User", back_populates="uploaded_images")
 
+    __table_args__ = (
+        # Covers the image list ETag aggregate (index-only scan)
+        Index("ix_order_images_order_etag", "order_id", postgresql_include=["id"]),
+    )
+
     def __repr__(self):
         return f"<OrderImage(order_id='{self.order_id}', type='{self.image_type}')>"
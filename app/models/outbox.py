@@ -0,0 +1,42 @@
+from sqlalchemy import BigInteger, Column, DateTime, Identity, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.models.base import Base, default_timestamp
+
+
+class OutboxEvent(Base):
+    """
+    An order change waiting to be delivered to downstream consumers.
+    Written in the same transaction as the change itself, so an event
+    exists if and only if the change was committed.
+    """
+
+    __tablename__ = "outbox_events"
+
+    # Monotonic so consumers see events in commit-ish order
+    id = Column(BigInteger, Identity(), primary_key=True)
+    aggregate_type = Column(String, nullable=False, default="order")
+    aggregate_id = Column(UUID(as_uuid=True), nullable=False)
+    event_type = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False)
+
+    created_at = default_timestamp()
+    dispatched_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(String, nullable=True)
+    # Set after a failed delivery; the event is not claimed again before then
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    # Set once attempts reach OUTBOX_MAX_ATTEMPTS; the event is given up on
+    failed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # The dispatcher only ever scans the undelivered tail
+        Index(
+            "ix_outbox_events_pending",
+            "id",
+            postgresql_where=dispatched_at.is_(None) & failed_at.is_(None),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, type='{self.event_type}')>"
@@ -0,0 +1,72 @@
+from sqlalchemy import CheckConstraint, Column, Date, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+# Dashboard rollups. They are maintained incrementally by OrderService in the
+# same transaction as the order change, so reading them never touches orders.
+
+
+class OrderStatusCount(Base):
+    __tablename__ = "order_status_counts"
+
+    status = Column(String, primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<OrderStatusCount(status='{self.status}', count={self.order_count})>"
+
+
+class OrderDailyRevenue(Base):
+    __tablename__ = "order_daily_revenue"
+
+    day = Column(Date, primary_key=True)
+    # Orders created that day and what they were quoted at
+    orders_created = Column(Integer, nullable=False, default=0)
+    quoted_revenue = Column(Numeric(precision=12, scale=2), nullable=False, default=0)
+    # Orders completed that day and what was actually charged
+    orders_completed = Column(Integer, nullable=False, default=0)
+    actual_revenue = Column(Numeric(precision=12, scale=2), nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<OrderDailyRevenue(day='{self.day}')>"
+
+
+# Writers each add to one slot row, so completions do not all queue on one
+# row lock; the total is the sum of the slots
+REVENUE_TOTAL_SLOTS = 16
+
+
+class OrderRevenueTotal(Base):
+    """Running all-time totals of order_daily_revenue, spread over slot rows."""
+
+    __tablename__ = "order_revenue_totals"
+
+    slot = Column(Integer, primary_key=True, autoincrement=False)
+    orders_completed = Column(Integer, nullable=False, default=0)
+    actual_revenue = Column(Numeric(precision=14, scale=2), nullable=False, default=0)
+
+    __table_args__ = (
+        CheckConstraint(
+            f"slot >= 0 AND slot < {REVENUE_TOTAL_SLOTS}",
+            name="ck_order_revenue_totals_slot",
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<OrderRevenueTotal(slot={self.slot}, "
+            f"orders_completed={self.orders_completed})>"
+        )
+
+
+class ServiceOrderVolume(Base):
+    __tablename__ = "service_order_volumes"
+
+    # No foreign key: a zeroed row must not block deleting the service
+    service_id = Column(UUID(as_uuid=True), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    quoted_revenue = Column(Numeric(precision=12, scale=2), nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ServiceOrderVolume(service_id='{self.service_id}')>"
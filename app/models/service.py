@@ -1,5 +1,6 @@
-from sqlalchemy import Boolean, Column, Integer, Numeric, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Computed, Index, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.models.base import Base, default_timestamp, default_uuid
 
@@ -17,9 +18,25 @@ class Service(Base):
     is_active = Column(Boolean, nullable=True, default=True)
     created_at = default_timestamp()
 
+    # Full-text search document: name matches outrank description matches
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
+
     # Relationships (referenced as a string)
     orders = relationship("Order", back_populates="service")
     bookings = relationship("Booking", back_populates="service")
 
+    __table_args__ = (
+        Index("ix_services_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
     def __repr__(self):
         return f"<Service(name='{self.name}')>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Enum, String
+from sqlalchemy import DDL, Boolean, Column, Enum, Index, String, event, text
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, default_timestamp, default_uuid
@@ -26,5 +26,21 @@ class User(Base):
     uploaded_images = relationship("OrderImage", back_populates="uploader")
     bookings = relationship("Booking", back_populates="users")
 
+    __table_args__ = (
+        # Fuzzy customer-name search; queries must use the same expression
+        Index(
+            "ix_users_full_name_trgm",
+            text("(first_name || ' ' || last_name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
+
     def __repr__(self):
         return f"<User(email='{self.email}')> "
+
+
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
@@ -0,0 +1,79 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DailyRevenue(BaseModel):
+    day: date
+    orders_created: int
+    quoted_revenue: Decimal
+    orders_completed: int
+    actual_revenue: Decimal
+
+    model_config = {"from_attributes": True}
+
+
+class ServiceVolume(BaseModel):
+    service_id: UUID
+    service_name: str
+    order_count: int
+    quoted_revenue: Decimal
+
+
+class AdminDashboardResponse(BaseModel):
+    total_orders: int
+    pending_orders: int
+    in_progress_orders: int
+    completed_this_month: int
+    total_revenue: Decimal
+    status_counts: Dict[str, int]
+    revenue_by_day: List[DailyRevenue]
+    service_volumes: List[ServiceVolume]
+
+
+class ArchiveRunResponse(BaseModel):
+    orders: int
+    images: int
+    # A full batch was moved; call again to continue
+    more: bool = False
+
+
+class ImportRowError(BaseModel):
+    # Line of the uploaded file (CSV counts the header as line 1)
+    line: int
+    errors: List[str]
+
+
+class ImportResult(BaseModel):
+    received: int
+    inserted: int
+    updated: int
+    skipped: int
+    errors: List[ImportRowError]
+
+
+class SlowQueryEntry(BaseModel):
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    # Parameter types only, values are never kept
+    parameters: Any
+    rows: Optional[int] = None
+    plan: Optional[str] = None
+    plan_error: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class PasswordPoolStats(BaseModel):
+    mode: Literal["thread", "process"]
+    workers: int
+    max_queue: int
+    running: int
+    waiting: int
+    completed: int
+    rejected: int
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -17,8 +17,22 @@ class BookingCreate(BookingBase):
 class BookingResponse(BookingBase):
     id: UUID
     user_id: UUID
+    service_id: UUID
+    appointment_time: datetime
+    appointment_end: datetime
     created_at: datetime
 
     model_config = {
         "from_attributes": True  # replaces orm_mode=True in pydantic v2
     }
+
+
+class BookingSlot(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class BookingAvailabilityResponse(BaseModel):
+    service_id: UUID
+    day: date
+    slots: List[BookingSlot]
@@ -1,9 +1,15 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, EmailStr
+
+from app.schemas.order_image import OrderImageResponse
+from app.schemas.service import ServiceResponse
+
+OrderStatus = Literal["pending", "in_progress", "ready", "completed", "cancelled"]
+OrderPriority = Literal["normal", "high", "urgent"]
 
 
 class OrderBase(BaseModel):
@@ -31,8 +37,89 @@ class OrderResponse(OrderBase):
     requested_date: datetime
     estimated_completion: datetime
     actual_completion: Optional[datetime]
+    version: int
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
+
+
+class OrderListItem(OrderResponse):
+    client_name: Optional[str] = None
+    service_name: Optional[str] = None
+
+
+class OrderClientSummary(BaseModel):
+    id: UUID
+    email: EmailStr
+    first_name: str
+    last_name: str
+    phone: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class OrderDetailResponse(OrderResponse):
+    """An order with everything the admin detail view shows, in one response."""
+
+    # None only for archived orders whose service or client is gone
+    service: Optional[ServiceResponse]
+    client: Optional[OrderClientSummary]
+    images: List[OrderImageResponse]
+
+
+class OrderStatusTransition(BaseModel):
+    status: OrderStatus
+    # The version the client last saw; the change only applies if it still matches
+    version: int
+    actual_price: Optional[Decimal] = None
+    notes: Optional[str] = None
+
+
+class OrderFilter(BaseModel):
+    """Query parameters accepted by the admin order listing."""
+
+    model_config = {"extra": "forbid"}
+
+    status: List[OrderStatus] = []
+    priority: List[OrderPriority] = []
+    service_id: Optional[UUID] = None
+    client_id: Optional[UUID] = None
+    requested_from: Optional[datetime] = None
+    requested_to: Optional[datetime] = None
+    estimated_from: Optional[datetime] = None
+    estimated_to: Optional[datetime] = None
+
+
+OrderExportColumn = Literal[
+    "id",
+    "client_id",
+    "service_id",
+    "status",
+    "priority",
+    "description",
+    "quoted_price",
+    "actual_price",
+    "requested_date",
+    "estimated_completion",
+    "actual_completion",
+    "created_at",
+]
+
+
+class OrderExportParams(OrderFilter):
+    """Order listing filters plus the shape of the export."""
+
+    format: Literal["csv", "ndjson"] = "csv"
+    # Empty means every export column
+    columns: List[OrderExportColumn] = []
+
+
+class OrderBulkItemError(BaseModel):
+    index: int
+    errors: List[str]
+
+
+class OrderBulkCreateResponse(BaseModel):
+    created: List[OrderResponse]
+    errors: List[OrderBulkItemError]
@@ -21,8 +21,7 @@ class OrderImageResponse(OrderImageBase):
     s3_url: str
     uploaded_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 
 class ImageUploadConfirmation(BaseModel):
@@ -0,0 +1,36 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class OrderSearchHit(BaseModel):
+    id: UUID
+    client_id: UUID
+    client_name: str
+    status: str
+    priority: Optional[str] = None
+    description: Optional[str] = None
+    notes: Optional[str] = None
+    created_at: datetime
+    rank: float
+
+
+class ServiceSearchHit(BaseModel):
+    id: UUID
+    name: str
+    description: Optional[str] = None
+    category: Optional[str] = None
+    base_price: Decimal
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    scope: Literal["all", "orders", "services"]
+    page: int
+    page_size: int
+    orders: List[OrderSearchHit]
+    services: List[ServiceSearchHit]
@@ -0,0 +1,192 @@
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings as app_config
+from app.db.session import AsyncSessionLocal
+from app.models.archive import OrderArchive, OrderImageArchive
+from app.models.order import Order
+from app.models.order_image import OrderImage
+from app.services.storage.factory import get_storage_service
+
+logger = logging.getLogger(__name__)
+
+ARCHIVABLE_STATUSES = ("completed", "cancelled")
+
+
+def _cutoff(older_than_days: int | None) -> datetime:
+    if older_than_days is None:
+        older_than_days = app_config.ARCHIVE_AFTER_DAYS
+    return datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+
+def _moved_columns(archive_model) -> list[str]:
+    # Everything but archived_at, which the archive table stamps itself
+    return [c.key for c in archive_model.__table__.c if c.key != "archived_at"]
+
+
+class ArchiveService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def archive_orders(
+        self, older_than_days: int | None = None, batch_size: int | None = None
+    ) -> dict:
+        """
+        Move finished orders and their images into the archive tables.
+
+        Orders that are completed or cancelled and have not changed for
+        ``older_than_days`` are moved in batches, one transaction per batch,
+        so the job never holds many row locks at once. The dashboard rollups
+        are left alone: archived orders still count as history.
+
+        Commits as it goes, so it belongs to the archive job
+        (``python -m app.services.archive_service``), never to a request.
+
+        Returns:
+            Number of orders and images moved
+        """
+        if batch_size is None:
+            batch_size = app_config.ARCHIVE_BATCH_SIZE
+        cutoff = _cutoff(older_than_days)
+        totals = {"orders": 0, "images": 0}
+
+        while True:
+            order_count, images = await self._archive_batch(cutoff, batch_size)
+            await self.session.commit()
+            totals["orders"] += order_count
+            totals["images"] += len(images)
+
+            await self._archive_objects(images)
+
+            if order_count < batch_size:
+                break
+
+        return totals
+
+    async def archive_batch(
+        self, older_than_days: int | None = None, batch_size: int | None = None
+    ) -> tuple[int, list[tuple], bool]:
+        """
+        Move one batch in the caller's transaction; nothing is committed here.
+        The images' objects are left in place: hand them to archive_objects
+        once the transaction has committed.
+
+        Returns:
+            (order count, [(image id, path)], whether more orders may remain)
+        """
+        if batch_size is None:
+            batch_size = app_config.ARCHIVE_BATCH_SIZE
+        order_count, images = await self._archive_batch(
+            _cutoff(older_than_days), batch_size
+        )
+        return order_count, images, order_count == batch_size
+
+    async def _archive_batch(
+        self, cutoff: datetime, batch_size: int
+    ) -> tuple[int, list[tuple]]:
+        """Move one batch of orders; returns (order count, [(image id, path)])."""
+        result = await self.session.execute(
+            select(Order.id)
+            .where(
+                Order.status.in_(ARCHIVABLE_STATUSES),
+                func.coalesce(Order.actual_completion, Order.updated_at) < cutoff,
+            )
+            .order_by(Order.created_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        order_ids = list(result.scalars().all())
+        if not order_ids:
+            return 0, []
+
+        # DELETE ... RETURNING feeding INSERT ... SELECT: each row is read once
+        image_columns = _moved_columns(OrderImageArchive)
+        moved_images = (
+            delete(OrderImage)
+            .where(OrderImage.order_id.in_(order_ids))
+            .returning(*(OrderImage.__table__.c[name] for name in image_columns))
+            .cte("moved_images")
+        )
+        result = await self.session.execute(
+            insert(OrderImageArchive)
+            .from_select(image_columns, select(moved_images))
+            .returning(OrderImageArchive.id, OrderImageArchive.s3_object_path)
+        )
+        images = [tuple(row) for row in result.all()]
+
+        order_columns = _moved_columns(OrderArchive)
+        moved_orders = (
+            delete(Order)
+            .where(Order.id.in_(order_ids))
+            .returning(*(Order.__table__.c[name] for name in order_columns))
+            .cte("moved_orders")
+        )
+        await self.session.execute(
+            insert(OrderArchive).from_select(order_columns, select(moved_orders))
+        )
+
+        return len(order_ids), images
+
+    async def _archive_objects(self, images: list[tuple]):
+        """
+        Move archived images to the cheaper storage tier.
+        Runs after the rows are committed; an object that fails to move
+        stays where it is and the archive row keeps pointing at it.
+        """
+        storage_service = get_storage_service()
+
+        for image_id, object_name in images:
+            try:
+                archived_name = await asyncio.to_thread(
+                    storage_service.archive_file, object_name
+                )
+            except Exception as e:
+                logger.error(f"Failed to archive object {object_name}: {e}")
+                continue
+
+            if archived_name == object_name:
+                continue
+
+            await self.session.execute(
+                update(OrderImageArchive)
+                .where(OrderImageArchive.id == image_id)
+                .values(s3_object_path=archived_name)
+            )
+            await self.session.commit()
+            # Only drop the original once the row points at the copy
+            await asyncio.to_thread(storage_service.delete_file, object_name)
+
+
+async def archive_objects(images: list[tuple]):
+    """
+    Move archived images to the cheaper storage tier in a session of its
+    own, after the transaction that archived their rows has committed.
+    """
+    async with AsyncSessionLocal() as session:
+        await ArchiveService(session)._archive_objects(images)
+
+
+async def _main(argv: list[str] | None = None):
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(prog="python -m app.services.archive_service")
+    parser.add_argument("--older-than-days", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    async with AsyncSessionLocal() as session:
+        totals = await ArchiveService(session).archive_orders(
+            args.older_than_days, args.batch_size
+        )
+    await engine.dispose()
+
+    print(f"archived {totals['orders']} orders, {totals['images']} images")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,142 @@
+import bisect
+import time
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from typing import Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings as app_config
+
+Interval = tuple[datetime, datetime]
+
+
+def booking_timezone() -> ZoneInfo:
+    return ZoneInfo(app_config.BOOKING_TIMEZONE)
+
+
+def slot_length() -> timedelta:
+    return timedelta(minutes=app_config.BOOKING_SLOT_MINUTES)
+
+
+def booking_day(moment: datetime) -> date:
+    """The local booking day a moment falls on."""
+    return moment.astimezone(booking_timezone()).date()
+
+
+def day_window(day: date) -> Interval:
+    """Bookable hours of a day as aware datetimes."""
+    tz = booking_timezone()
+    start = datetime.combine(
+        day, dt_time(hour=app_config.BOOKING_DAY_START_HOUR), tzinfo=tz
+    )
+    end = datetime.combine(
+        day, dt_time(hour=app_config.BOOKING_DAY_END_HOUR), tzinfo=tz
+    )
+    return start, end
+
+
+def free_slots(
+    booked: list[Interval], window: Interval, slot: timedelta
+) -> list[Interval]:
+    """
+    Walk the day in fixed-size slots and keep the ones no booking overlaps.
+
+    Args:
+        booked: Booked intervals sorted by start; they never overlap
+            because the exclusion constraint forbids it
+        window: Bookable hours of the day
+        slot: Slot length
+
+    Returns:
+        Free (start, end) slots in order
+    """
+    slots = []
+    current, window_end = window
+    i = 0
+
+    while current + slot <= window_end:
+        candidate_end = current + slot
+
+        # Skip bookings that end before this slot starts
+        while i < len(booked) and booked[i][1] <= current:
+            i += 1
+
+        if i < len(booked) and booked[i][0] < candidate_end:
+            # Overlap: jump to the next slot boundary after the booking ends
+            blocked_until = booked[i][1]
+            steps = -(-(blocked_until - current) // slot)
+            current += steps * slot
+            continue
+
+        slots.append((current, candidate_end))
+        current = candidate_end
+
+    return slots
+
+
+class BookingIntervalIndex:
+    """
+    Per-worker index of booked intervals keyed by (service_id, day).
+
+    A day is loaded from the database once and then kept current by
+    adding each booking this worker makes. Entries expire after a TTL so
+    bookings made by other workers show up; the database constraint stays
+    the source of truth for conflicts.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._days: dict[tuple[UUID, date], tuple[float, list[Interval]]] = {}
+
+    def get(self, service_id: UUID, day: date) -> Optional[list[Interval]]:
+        """Return the sorted intervals for a day, or None if not loaded/expired."""
+        entry = self._days.get((service_id, day))
+        if entry is None:
+            return None
+
+        loaded_at, intervals = entry
+        if time.monotonic() - loaded_at > self.ttl_seconds:
+            del self._days[(service_id, day)]
+            return None
+        return intervals
+
+    def load(
+        self, service_id: UUID, day: date, intervals: list[Interval]
+    ) -> list[Interval]:
+        """Replace a day with intervals freshly read from the database."""
+        intervals = sorted(intervals)
+        self._days[(service_id, day)] = (time.monotonic(), intervals)
+        return intervals
+
+    def add(self, service_id: UUID, start: datetime, end: datetime):
+        """Record a new booking in an already loaded day."""
+        intervals = self.get(service_id, booking_day(start))
+        if intervals is not None:
+            bisect.insort(intervals, (start, end))
+
+    def overlaps(self, service_id: UUID, start: datetime, end: datetime) -> bool:
+        """True if a loaded day already has a booking overlapping [start, end)."""
+        intervals = self.get(service_id, booking_day(start))
+        if not intervals:
+            return False
+
+        i = bisect.bisect_left(intervals, (end,))
+        return i > 0 and intervals[i - 1][1] > start
+
+    def clear(self):
+        self._days.clear()
+
+
+# Singleton instance
+_availability_index: BookingIntervalIndex = None
+
+
+def get_availability_index() -> BookingIntervalIndex:
+    """Get singleton availability index instance"""
+    global _availability_index
+    if _availability_index is None:
+        _availability_index = BookingIntervalIndex(
+            ttl_seconds=app_config.BOOKING_AVAILABILITY_TTL_SECONDS
+        )
+    return _availability_index
@@ -1,10 +1,25 @@
+from datetime import date
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import BookingConflictError, InvalidBookingSlotError
+from app.db.commit_hooks import on_commit
 from app.models.booking import Booking
 from app.schemas.booking import BookingCreate
+from app.services.availability_service import (
+    booking_day,
+    booking_timezone,
+    day_window,
+    free_slots,
+    get_availability_index,
+    slot_length,
+)
+
+# SQLSTATE raised by Postgres when an exclusion constraint rejects a row
+EXCLUSION_VIOLATION = "23P01"
 
 
 class BookingService:
@@ -12,15 +27,40 @@ class BookingService:
         self.session = session
 
     async def add(self, booking: BookingCreate, user_id: UUID):
+        start = booking.appointment_time
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=booking_timezone())
+        end = start + slot_length()
+
+        day_start, day_end = day_window(booking_day(start))
+        if start < day_start or end > day_end:
+            raise InvalidBookingSlotError()
+
+        index = get_availability_index()
+        # Cheap early rejection; the exclusion constraint is still the judge
+        if index.overlaps(booking.service_id, start, end):
+            raise BookingConflictError()
+
         booking = Booking(
-            **booking.model_dump(),
+            **booking.model_dump(exclude={"appointment_time"}),
+            appointment_time=start,
+            appointment_end=end,
             user_id=user_id,
         )
 
-        self.session.add(booking)
-        await self.session.commit()
+        try:
+            async with self.session.begin_nested():
+                self.session.add(booking)
+        except IntegrityError as e:
+            if getattr(e.orig, "sqlstate", None) == EXCLUSION_VIOLATION:
+                raise BookingConflictError()
+            raise
         await self.session.refresh(booking)
 
+        # Only once saved: a rolled-back booking must not block its slot
+        service_id = booking.service_id
+        on_commit(self.session, lambda: index.add(service_id, start, end))
+
         return booking
 
     async def get_bookings_by_user(self, user_id: UUID):
@@ -31,4 +71,24 @@ class BookingService:
 
         return bookings
 
+    async def get_availability(self, service_id: UUID, day: date):
+        """Free slots of a service on a day, served from the interval index."""
+        window = day_window(day)
+        index = get_availability_index()
+
+        booked = index.get(service_id, day)
+        if booked is None:
+            # Range overlap on the same expression as the exclusion
+            # constraint, so its GiST index answers the lookup.
+            booked_range = func.tstzrange(
+                Booking.appointment_time, Booking.appointment_end, "[)"
+            )
+            result = await self.session.execute(
+                select(Booking.appointment_time, Booking.appointment_end)
+                .where(Booking.service_id == service_id)
+                .where(Booking.status != "cancelled")
+                .where(booked_range.op("&&")(func.tstzrange(*window, "[)")))
+            )
+            booked = index.load(service_id, day, [tuple(row) for row in result.all()])
 
+        return free_slots(booked, window, slot_length())
@@ -0,0 +1,93 @@
+import csv
+import io
+from datetime import date, datetime
+from typing import AsyncIterator, Iterable, Sequence
+
+from pydantic_core import to_json
+from sqlalchemy import Select, select
+
+from app.core.config import settings as app_config
+from app.db.session import AsyncSessionLocal
+from app.models.order import Order
+from app.schemas.order import OrderFilter
+from app.services.order_service import order_filter_conditions
+
+# Columns an export may contain (OrderExportColumn), in default output order
+EXPORT_COLUMNS = {
+    "id": Order.id,
+    "client_id": Order.client_id,
+    "service_id": Order.service_id,
+    "status": Order.status,
+    "priority": Order.priority,
+    "description": Order.description,
+    "quoted_price": Order.quoted_price,
+    "actual_price": Order.actual_price,
+    "requested_date": Order.requested_date,
+    "estimated_completion": Order.estimated_completion,
+    "actual_completion": Order.actual_completion,
+    "created_at": Order.created_at,
+}
+
+
+def export_query(filters: OrderFilter, columns: Sequence[str]) -> Select:
+    """Only the requested columns, so rows never become ORM objects."""
+    return (
+        select(*(EXPORT_COLUMNS[name] for name in columns))
+        .where(*order_filter_conditions(filters))
+        .order_by(Order.created_at, Order.id)
+    )
+
+
+async def stream_partitions(
+    stmt: Select, batch_size: int | None = None
+) -> AsyncIterator[Sequence]:
+    """
+    Run a query on a server-side cursor and yield its rows in batches.
+
+    Uses a session of its own rather than the request's: it lives exactly
+    as long as the response body is being sent.
+    """
+    if batch_size is None:
+        batch_size = app_config.EXPORT_BATCH_SIZE
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield partition
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+async def csv_chunks(
+    columns: Sequence[str], partitions: AsyncIterator[Iterable]
+) -> AsyncIterator[str]:
+    """One CSV chunk per batch of rows, header first."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue()
+
+    async for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_text(value) for value in row] for row in rows)
+        yield buffer.getvalue()
+
+
+async def ndjson_chunks(
+    columns: Sequence[str], partitions: AsyncIterator[Iterable]
+) -> AsyncIterator[bytes]:
+    """
+    One chunk of newline-delimited JSON objects per batch of rows, encoded
+    by pydantic-core: UUID, Decimal and datetime values go straight to JSON
+    the same way response models render them.
+    """
+    async for rows in partitions:
+        yield b"".join(to_json(dict(zip(columns, row))) + b"\n" for row in rows)
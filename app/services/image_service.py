@@ -162,18 +162,18 @@ async def delete_order_image(db: Session, image_id: str) -> bool:
         return False
 
 
-async def regenerate_download_urls(images: list[OrderImage]) -> list[OrderImage]:
-    """Regenerate fresh download URLs for a list of images"""
+async def regenerate_download_urls(images: list[dict]) -> list[dict]:
+    """Regenerate fresh download URLs for a list of image rows"""
     storage_service = get_storage_service()
 
     for image in images:
         try:
             fresh_url = storage_service.generate_presigned_download_url(
-                image.s3_object_path,
+                image["s3_object_path"],
                 expiry_minutes=app_config.PRESIGNED_URL_EXPIRY_MINUTES,
             )
-            image.s3_url = fresh_url
+            image["s3_url"] = fresh_url
         except Exception as e:
-            print(f"Failed to regenerate URL for {image.s3_object_path}: {e}")
+            print(f"Failed to regenerate URL for {image['s3_object_path']}: {e}")
 
     return images
@@ -0,0 +1,281 @@
+import csv
+import io
+import json
+from decimal import Decimal
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import hash_passwords
+from app.models.user import User
+from app.schemas.admin import ImportRowError
+from app.schemas.service import ServiceCreate
+from app.schemas.user import UserCreate
+from app.services.service import ServiceService
+
+ImportFormat = Literal["csv", "ndjson"]
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> ImportFormat:
+    name = (filename or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or content_type in (
+        "application/x-ndjson",
+        "application/jsonl",
+    ):
+        return "ndjson"
+    return "csv"
+
+
+def parse_rows(content: bytes, format: ImportFormat) -> list[tuple[int, dict]]:
+    """
+    Decode an upload into (line number, raw row) pairs.
+    CSV needs a header row; empty CSV cells count as missing values.
+    """
+    lines = content.decode("utf-8-sig")
+    if format == "ndjson":
+        return [
+            (number, json.loads(line))
+            for number, line in enumerate(lines.splitlines(), start=1)
+            if line.strip()
+        ]
+
+    reader = csv.DictReader(io.StringIO(lines))
+    return [
+        (reader.line_num, {key: value for key, value in row.items() if value != ""})
+        for row in reader
+    ]
+
+
+def _validate(
+    rows: list[tuple[int, dict]], schema: type[BaseModel], key: str
+) -> tuple[list[BaseModel], list[ImportRowError]]:
+    """
+    Validate rows; the last row wins when several share the same key.
+    Keys compare exactly, as the unique email and the name matching do.
+    """
+    valid: dict[str, BaseModel] = {}
+    errors = []
+    for line, row in rows:
+        try:
+            item = schema.model_validate(row)
+        except ValidationError as e:
+            messages = [
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                for err in e.errors()
+            ]
+            errors.append(ImportRowError(line=line, errors=messages))
+            continue
+        valid[getattr(item, key)] = item
+    return list(valid.values()), errors
+
+
+class ImportService:
+    """
+    Bulk onboarding of users and services.
+
+    Rows are COPYed into a temporary staging table, which costs one round
+    trip however many rows there are, and applied to the real table with
+    set-based statements in the same transaction.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _copy(self, table: str, columns: list[str], records: list[tuple]):
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table, records=records, columns=columns
+        )
+
+    async def import_users(self, rows: list[tuple[int, dict]]) -> dict:
+        """
+        Create new users and update the profile of existing ones (matched
+        by email). Existing users keep their password, so only new users
+        are hashed, on the shared password pool.
+        """
+        users, errors = _validate(rows, UserCreate, "email")
+        result = {"received": len(rows), "inserted": 0, "updated": 0, "skipped": 0}
+        if not users:
+            return {**result, "errors": errors}
+
+        existing = await self.session.execute(
+            select(User.email).where(User.email.in_([user.email for user in users]))
+        )
+        existing_emails = set(existing.scalars().all())
+
+        new_users = [user for user in users if user.email not in existing_emails]
+        hashed = dict(
+            zip(
+                (user.email for user in new_users),
+                await hash_passwords([user.password for user in new_users]),
+            )
+        )
+
+        await self.session.execute(
+            text(
+                """
+                CREATE TEMP TABLE import_users (
+                    email text, hashed_password text, first_name text,
+                    last_name text, phone text, address text, user_type text
+                ) ON COMMIT DROP
+                """
+            )
+        )
+        await self._copy(
+            "import_users",
+            [
+                "email",
+                "hashed_password",
+                "first_name",
+                "last_name",
+                "phone",
+                "address",
+                "user_type",
+            ],
+            [
+                (
+                    user.email,
+                    hashed.get(user.email),
+                    user.first_name,
+                    user.last_name,
+                    user.phone,
+                    user.address,
+                    user.user_type.value,
+                )
+                for user in users
+            ],
+        )
+
+        # Separate statements: a row without a password hash cannot even be
+        # proposed for INSERT ... ON CONFLICT, NOT NULL is checked first.
+        inserted = await self.session.execute(
+            text(
+                """
+                INSERT INTO users (id, email, hashed_password, first_name,
+                                   last_name, phone, address, user_type,
+                                   is_active)
+                SELECT gen_random_uuid(), email, hashed_password, first_name,
+                       last_name, phone, address,
+                       user_type::user_type_enum, true
+                FROM import_users
+                WHERE hashed_password IS NOT NULL
+                ON CONFLICT (email) DO NOTHING
+                RETURNING id
+                """
+            )
+        )
+        result["inserted"] = len(inserted.all())
+
+        updated = await self.session.execute(
+            text(
+                """
+                UPDATE users
+                SET first_name = import_users.first_name,
+                    last_name = import_users.last_name,
+                    phone = import_users.phone,
+                    address = import_users.address,
+                    user_type = import_users.user_type::user_type_enum,
+                    updated_at = now()
+                FROM import_users
+                WHERE users.email = import_users.email
+                  AND import_users.hashed_password IS NULL
+                RETURNING users.id
+                """
+            )
+        )
+        result["updated"] = len(updated.all())
+        # Created concurrently by someone else between our check and insert
+        result["skipped"] = len(users) - result["inserted"] - result["updated"]
+
+        return {**result, "errors": errors}
+
+    async def import_services(self, rows: list[tuple[int, dict]]) -> dict:
+        """Create new services and update existing ones, matched by name."""
+        services, errors = _validate(rows, ServiceCreate, "name")
+        result = {"received": len(rows), "inserted": 0, "updated": 0, "skipped": 0}
+        if not services:
+            return {**result, "errors": errors}
+
+        await self.session.execute(
+            text(
+                """
+                CREATE TEMP TABLE import_services (
+                    name text, description text, base_price numeric(10, 2),
+                    category text, estimated_days integer, image_url text,
+                    is_active boolean
+                ) ON COMMIT DROP
+                """
+            )
+        )
+        await self._copy(
+            "import_services",
+            [
+                "name",
+                "description",
+                "base_price",
+                "category",
+                "estimated_days",
+                "image_url",
+                "is_active",
+            ],
+            [
+                (
+                    service.name,
+                    service.description,
+                    Decimal(str(service.base_price)),
+                    service.category,
+                    service.estimated_days,
+                    service.image_url,
+                    service.is_active,
+                )
+                for service in services
+            ],
+        )
+
+        updated = await self.session.execute(
+            text(
+                """
+                UPDATE services
+                SET description = import_services.description,
+                    base_price = import_services.base_price,
+                    category = import_services.category,
+                    estimated_days = import_services.estimated_days,
+                    image_url = import_services.image_url,
+                    is_active = import_services.is_active
+                FROM import_services
+                WHERE services.name = import_services.name
+                RETURNING services.id
+                """
+            )
+        )
+        result["updated"] = len(updated.all())
+
+        inserted = await self.session.execute(
+            text(
+                """
+                INSERT INTO services (id, name, description, base_price,
+                                      category, estimated_days, image_url,
+                                      is_active)
+                SELECT gen_random_uuid(), name, description, base_price,
+                       category, estimated_days, image_url,
+                       coalesce(is_active, true)
+                FROM import_services
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM services WHERE services.name = import_services.name
+                )
+                RETURNING id
+                """
+            )
+        )
+        result["inserted"] = len(inserted.all())
+        # Several existing services may share a name and all get updated
+        result["skipped"] = max(
+            0, len(services) - result["inserted"] - result["updated"]
+        )
+        if result["inserted"] or result["updated"]:
+            await ServiceService(self.session).catalog_changed()
+
+        return {**result, "errors": errors}
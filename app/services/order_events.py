@@ -0,0 +1,144 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings as app_config
+from app.db.listener import PgListener
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Every worker LISTENs here; the outbox dispatcher NOTIFYs once per event
+ORDER_EVENTS_CHANNEL = "order_events"
+
+
+def live_event(event: OutboxEvent) -> dict:
+    """
+    The part of an outbox event pushed to clients. Kept small: NOTIFY
+    payloads are capped at 8000 bytes.
+    """
+    payload = event.payload
+    live = {
+        "id": event.id,
+        "type": event.event_type,
+        "order_id": str(event.aggregate_id),
+        "client_id": payload.get("client_id"),
+    }
+    if event.event_type.startswith("order.image_"):
+        live["image_id"] = payload.get("id")
+        live["image_type"] = payload.get("image_type")
+    else:
+        live["status"] = payload.get("status")
+        live["version"] = payload.get("version")
+        if "previous_status" in payload:
+            live["previous_status"] = payload["previous_status"]
+    return live
+
+
+async def broadcast_order_events(session: AsyncSession, events: list[OutboxEvent]):
+    """
+    Outbox handler: fan events out to every worker.
+    Sent in the dispatcher's transaction, so a batch that fails to be
+    marked delivered is not announced either.
+    """
+    await session.execute(
+        text(
+            "SELECT pg_notify(:channel, payload) "
+            "FROM unnest(CAST(:payloads AS text[])) AS payload"
+        ),
+        {
+            "channel": ORDER_EVENTS_CHANNEL,
+            "payloads": [json.dumps(live_event(event)) for event in events],
+        },
+    )
+
+
+@dataclass(eq=False)
+class Subscription:
+    client_id: UUID
+    order_ids: Optional[frozenset[UUID]]
+    queue: asyncio.Queue = field(repr=False)
+
+    def wants(self, order_id: UUID) -> bool:
+        return self.order_ids is None or order_id in self.order_ids
+
+
+class OrderEventBroker:
+    """
+    Routes order events from the worker's shared LISTEN connection to the
+    live connections of the clients who own the orders.
+
+    An idle subscriber costs one small queue and nothing else: no database
+    connection and no task of its own beyond the response stream.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscriptions: dict[UUID, set[Subscription]] = defaultdict(set)
+
+    async def start(self, listener: PgListener):
+        try:
+            await listener.listen(ORDER_EVENTS_CHANNEL, self.on_notification)
+        except Exception as e:
+            logger.warning(f"Live order events unavailable: {e}")
+
+    def subscribe(
+        self, client_id: UUID, order_ids: Optional[set[UUID]] = None
+    ) -> Subscription:
+        subscription = Subscription(
+            client_id=client_id,
+            order_ids=frozenset(order_ids) if order_ids else None,
+            queue=asyncio.Queue(maxsize=self.queue_size),
+        )
+        self._subscriptions[client_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscriptions = self._subscriptions.get(subscription.client_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.client_id]
+
+    def on_notification(self, payload: str):
+        if not payload:
+            # Listener reconnected; nothing to replay for live pushes
+            return
+        try:
+            event = json.loads(payload)
+            client_id = UUID(event["client_id"])
+            order_id = UUID(event["order_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed order event: {payload!r}")
+            return
+        self.publish(client_id, order_id, event)
+
+    def publish(self, client_id: UUID, order_id: UUID, event: dict):
+        for subscription in self._subscriptions.get(client_id, ()):
+            if not subscription.wants(order_id):
+                continue
+            if subscription.queue.full():
+                # A slow reader loses its oldest event rather than
+                # holding up everyone else
+                subscription.queue.get_nowait()
+            subscription.queue.put_nowait(event)
+
+
+# Singleton instance
+_order_event_broker: OrderEventBroker = None
+
+
+def get_order_event_broker() -> OrderEventBroker:
+    """Get singleton order event broker instance"""
+    global _order_event_broker
+    if _order_event_broker is None:
+        _order_event_broker = OrderEventBroker(queue_size=app_config.SSE_QUEUE_SIZE)
+    return _order_event_broker
@@ -2,45 +2,305 @@ import logging
 import os
 import shutil
 import tempfile
+import time
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import select
+from pydantic import ValidationError
+from sqlalchemy import (
+    Text,
+    cast,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.core.config import settings as app_config
-from app.core.exceptions import DatabaseCommunicationError, OrderNotFoundError
-
-
+from app.core.etag import if_match_satisfied, make_etag
+from app.core.exceptions import (
+    DatabaseCommunicationError,
+    InternalDatabaseError,
+    InvalidOrderTransitionError,
+    OrderArchivedError,
+    OrderNotFoundError,
+    OrderPreconditionFailedError,
+    OrderVersionConflictError,
+)
+
+from app.db.loader import get_loaders
+from app.db.projection import response_columns, rows_as_dicts
+from app.db.session import release_connection
+from app.models.archive import OrderArchive, OrderImageArchive
 from app.models.order import Order
 from app.models.order_image import OrderImage
-from app.schemas.order import OrderCreate
+from app.models.service import Service
+from app.models.user import User
+from app.schemas.order import (
+    OrderBulkItemError,
+    OrderClientSummary,
+    OrderCreate,
+    OrderDetailResponse,
+    OrderFilter,
+    OrderResponse,
+    OrderStatusTransition,
+)
+from app.schemas.order_image import OrderImageResponse
+from app.schemas.service import ServiceResponse
+from app.services.outbox_service import OutboxService, image_payload, order_payload
+from app.services.rollup_service import OrderRollupService, OrderRollupSnapshot
 from app.services.storage.factory import get_storage_service
 
 logger = logging.getLogger(__name__)
 
+# List reads select only what the response serializes and return row dicts
+ORDER_LIST_COLUMNS = response_columns(Order, OrderResponse)
+ARCHIVED_ORDER_LIST_COLUMNS = response_columns(OrderArchive, OrderResponse)
+IMAGE_LIST_COLUMNS = response_columns(OrderImage, OrderImageResponse)
+ARCHIVED_IMAGE_LIST_COLUMNS = response_columns(OrderImageArchive, OrderImageResponse)
+CLIENT_SUMMARY_COLUMNS = response_columns(User, OrderClientSummary)
+
+# order_status_enum state machine: current status -> statuses it may move to
+ORDER_STATUS_TRANSITIONS = {
+    "pending": {"in_progress", "cancelled"},
+    "in_progress": {"ready", "cancelled"},
+    "ready": {"completed", "in_progress"},
+    "completed": set(),
+    "cancelled": set(),
+}
+
+
+def allowed_source_statuses(target: str) -> list[str]:
+    """Statuses an order may be in for a transition to ``target``."""
+    return [
+        source
+        for source, targets in ORDER_STATUS_TRANSITIONS.items()
+        if target in targets
+    ]
+
+
+def _inline(values):
+    # Enum filters are rendered into the SQL text: a prepared statement's
+    # generic plan cannot prove a bound parameter satisfies a partial index
+    # predicate, a literal can.
+    return [literal(value, literal_execute=True) for value in values]
+
+
+def order_filter_conditions(filters: OrderFilter) -> list:
+    """WHERE clauses for an order listing filter."""
+    conditions = []
+    if filters.status:
+        conditions.append(Order.status.in_(_inline(filters.status)))
+    if filters.priority:
+        conditions.append(Order.priority.in_(_inline(filters.priority)))
+    if filters.service_id is not None:
+        conditions.append(Order.service_id == filters.service_id)
+    if filters.client_id is not None:
+        conditions.append(Order.client_id == filters.client_id)
+    if filters.requested_from is not None:
+        conditions.append(Order.requested_date >= filters.requested_from)
+    if filters.requested_to is not None:
+        conditions.append(Order.requested_date < filters.requested_to)
+    if filters.estimated_from is not None:
+        conditions.append(Order.estimated_completion >= filters.estimated_from)
+    if filters.estimated_to is not None:
+        conditions.append(Order.estimated_completion < filters.estimated_to)
+    return conditions
+
+
+def order_etag(order) -> str:
+    """Strong ETag of one order; every write bumps its version."""
+    return make_etag("order", order.id, order.version)
+
+
+def fresh_download_url(
+    s3_object_path: str, current: Optional[str] = None
+) -> Optional[str]:
+    """A newly signed download URL, or ``current`` if signing fails."""
+    try:
+        return get_storage_service().generate_presigned_download_url(
+            s3_object_path,
+            expiry_minutes=app_config.PRESIGNED_URL_EXPIRY_MINUTES,
+        )
+    except Exception as e:
+        logger.warning("Failed to regenerate URL for %s: %s", s3_object_path, e)
+        return current
+
 
 class OrderService:
     def __init__(self, session: AsyncSession):
         # Get database session to perform database operations
         self.session = session
+        self.rollups = OrderRollupService(session)
+        self.outbox = OutboxService(session)
 
-    async def get(self):
-        services = await self.session.execute(select(Order))
-        return services.scalars().all()
+    async def get(self, filters: OrderFilter | None = None) -> list[dict]:
+        query = select(*ORDER_LIST_COLUMNS)
+        if filters is not None:
+            query = query.where(*order_filter_conditions(filters))
+        result = await self.session.execute(query.order_by(Order.requested_date))
+        return rows_as_dicts(result)
+
+    async def attach_names(self, orders: list[dict]) -> list[dict]:
+        """
+        Add client_name and service_name to order rows: one batched lookup
+        per table for the whole list, not one per row.
+        """
+        loaders = get_loaders(self.session)
+        clients = await loaders.users.load_many(o["client_id"] for o in orders)
+        services = await loaders.services.load_many(o["service_id"] for o in orders)
+
+        for order, client, service in zip(orders, clients, services):
+            if client is not None:
+                order["client_name"] = f"{client['first_name']} {client['last_name']}"
+            if service is not None:
+                order["service_name"] = service["name"]
+        return orders
 
     async def getId(self, id):
         result = await self.session.execute(select(Order).filter(Order.id == id))
         service = result.scalar()
+        if service is None:
+            # Finished orders move to the archive; reads fall through to it
+            service = await self.session.get(OrderArchive, id)
         return service
 
-    async def getMe(self, client_id):
-        service = await self.session.execute(
-            select(Order).filter(Order.client_id == client_id)
+    async def get_detail(self, order_id) -> Optional[OrderDetailResponse]:
+        """
+        An order with its service, client and freshly signed images. The
+        service and client are joined onto the order row and the images come
+        from one selectin query, so a live order takes two statements.
+        """
+        result = await self.session.execute(
+            select(Order)
+            .options(
+                joinedload(Order.service),
+                joinedload(Order.client).load_only(*CLIENT_SUMMARY_COLUMNS),
+                selectinload(Order.images),
+            )
+            .where(Order.id == order_id)
         )
-        return service.scalars().all()
+        order = result.scalar()
+        if order is not None:
+            detail = OrderDetailResponse.model_validate(order)
+        else:
+            # Archived orders have no relationships; assemble them by hand
+            archived = await self.session.get(OrderArchive, order_id)
+            if archived is None:
+                return None
+            service = await self.session.get(Service, archived.service_id)
+            client = await self.session.get(User, archived.client_id)
+            detail = OrderDetailResponse.model_validate(
+                {
+                    **OrderResponse.model_validate(archived).model_dump(),
+                    "service": service and ServiceResponse.model_validate(service),
+                    "client": client and OrderClientSummary.model_validate(client),
+                    "images": await self.getOrderImages(order_id),
+                }
+            )
+
+        # Signed on the response models, never on the ORM images
+        for image in detail.images:
+            image.s3_url = fresh_download_url(image.s3_object_path, image.s3_url)
+        return detail
+
+    async def getMe(self, client_id) -> list[dict]:
+        """A client's order history: live orders and archived ones."""
+        history = union_all(
+            select(*ORDER_LIST_COLUMNS).filter(Order.client_id == client_id),
+            select(*ARCHIVED_ORDER_LIST_COLUMNS).filter(
+                OrderArchive.client_id == client_id
+            ),
+        ).subquery()
+        result = await self.session.execute(
+            select(history).order_by(history.c.requested_date, history.c.id)
+        )
+        return rows_as_dicts(result)
+
+    async def etag_me(self, client_id) -> str:
+        """
+        Strong ETag of a client's order history. Every write bumps an
+        order's version, so the (id, version) pairs pin down the list's
+        content; the live aggregate is answered from ix_orders_client_etag
+        alone. Archived orders never change, but archiving moves them.
+        """
+        parts = []
+        for model in (Order, OrderArchive):
+            row_key = func.concat(model.id, ":", model.version)
+            parts.extend(
+                await self._digest(model.id, row_key, model.client_id == client_id)
+            )
+        return make_etag("orders", client_id, *parts)
+
+    async def images_etag(self, order_id) -> str:
+        """
+        ETag of an order's image list (same fallback to the archive as
+        getOrderImages). Download URLs in the body are re-signed on every
+        read, so the tag is weak and rolls over at half their lifetime: a
+        304 never leaves a client holding URLs about to expire.
+        """
+        for model in (OrderImage, OrderImageArchive):
+            count, digest = await self._digest(
+                model.id, cast(model.id, Text), model.order_id == order_id
+            )
+            if count:
+                break
+
+        epoch = int(time.time() // (app_config.PRESIGNED_URL_EXPIRY_MINUTES * 30))
+        return make_etag("images", order_id, count, digest, epoch, weak=True)
+
+    async def etag_list(self, filters: OrderFilter | None = None) -> str:
+        """
+        Strong ETag of the admin order listing for ``filters``. Rows carry
+        their client's and service's name, which do not bump the order's
+        version, so the names are part of each row key.
+        """
+        row_key = func.concat(
+            Order.id,
+            ":",
+            Order.version,
+            ":",
+            User.first_name,
+            " ",
+            User.last_name,
+            ":",
+            Service.name,
+        )
+        conditions = order_filter_conditions(filters) if filters is not None else []
+        count, digest = await self._digest(
+            Order.id,
+            row_key,
+            *conditions,
+            select_from=Order.__table__.outerjoin(
+                User, User.id == Order.client_id
+            ).outerjoin(Service, Service.id == Order.service_id),
+        )
+        return make_etag("order-list", count, digest)
+
+    async def _digest(self, id_column, row_key, *conditions, select_from=None):
+        """Row count and md5 over the sorted row keys of the matching rows."""
+        query = select(
+            func.count(),
+            func.md5(
+                func.string_agg(
+                    row_key, aggregate_order_by(literal_column("','"), id_column)
+                )
+            ),
+        ).where(*conditions)
+        if select_from is not None:
+            query = query.select_from(select_from)
+        result = await self.session.execute(query)
+        return result.one()
 
     async def getMeId(self, client_id, order_id):
         try:
@@ -51,6 +311,14 @@ class OrderService:
             )
             order = result.scalar_one_or_none()
 
+            if not order:
+                result = await self.session.execute(
+                    select(OrderArchive)
+                    .filter(OrderArchive.client_id == client_id)
+                    .filter(OrderArchive.id == order_id)
+                )
+                order = result.scalar_one_or_none()
+
             if not order:
                 raise OrderNotFoundError(f"Order {order_id} not found for this client.")
 
@@ -66,16 +334,113 @@ class OrderService:
         ser = Order(**order.model_dump())
 
         self.session.add(ser)
+        await self.session.flush()
+        await self.rollups.apply([(None, OrderRollupSnapshot.of(ser))])
+        await self.outbox.enqueue("order.created", ser.id, order_payload(ser))
 
-        await self.session.commit()
         await self.session.refresh(ser)
 
         return ser
 
+    async def add_bulk(
+        self, payloads: list[dict]
+    ) -> tuple[list[Order], list[OrderBulkItemError]]:
+        """
+        Validate and insert many orders in one transaction.
+        Valid items go out as a single multi-row INSERT ... RETURNING,
+        invalid ones are reported back by their index in the payload.
+        """
+        errors: dict[int, list[str]] = {}
+        valid: list[tuple[int, OrderCreate]] = []
+
+        for index, payload in enumerate(payloads):
+            try:
+                order = OrderCreate.model_validate(payload)
+            except ValidationError as e:
+                errors[index] = [
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                    for err in e.errors()
+                ]
+                continue
+
+            item_errors = []
+            if not order.description:
+                item_errors.append("description: Field required")
+            if order.status and order.status not in Order.status.type.enums:
+                item_errors.append(f"status: Invalid value '{order.status}'")
+            if order.priority and order.priority not in Order.priority.type.enums:
+                item_errors.append(f"priority: Invalid value '{order.priority}'")
+
+            if item_errors:
+                errors[index] = item_errors
+            else:
+                valid.append((index, order))
+
+        # Resolve every referenced client and service with one query each
+        # instead of letting a single bad foreign key abort the whole insert.
+        client_ids = {order.client_id for _, order in valid}
+        service_ids = {order.service_id for _, order in valid}
+        known_clients = set()
+        known_services = set()
+        if client_ids:
+            result = await self.session.execute(
+                select(User.id).where(User.id.in_(client_ids))
+            )
+            known_clients = set(result.scalars().all())
+        if service_ids:
+            result = await self.session.execute(
+                select(Service.id).where(Service.id.in_(service_ids))
+            )
+            known_services = set(result.scalars().all())
+
+        rows = []
+        for index, order in valid:
+            item_errors = []
+            if order.client_id not in known_clients:
+                item_errors.append(f"client_id: Unknown client {order.client_id}")
+            if order.service_id not in known_services:
+                item_errors.append(f"service_id: Unknown service {order.service_id}")
+
+            if item_errors:
+                errors[index] = item_errors
+                continue
+
+            row = order.model_dump()
+            row["status"] = row["status"] or "pending"
+            row["priority"] = row["priority"] or "normal"
+            rows.append(row)
+
+        created: list[Order] = []
+        if rows:
+            try:
+                result = await self.session.execute(
+                    insert(Order).returning(Order, sort_by_parameter_order=True),
+                    rows,
+                )
+                created = list(result.scalars().all())
+                await self.rollups.apply(
+                    (None, OrderRollupSnapshot.of(order)) for order in created
+                )
+                await self.outbox.enqueue_many(
+                    "order.created",
+                    ((order.id, order_payload(order)) for order in created),
+                )
+            except SQLAlchemyError as e:
+                logger.error(f"Database error during bulk order creation: {str(e)}")
+                raise InternalDatabaseError(
+                    "An internal error occurred while creating the orders."
+                )
+
+        item_errors = [
+            OrderBulkItemError(index=index, errors=messages)
+            for index, messages in sorted(errors.items())
+        ]
+        return created, item_errors
+
     async def addOrderImage(self, orderImage: OrderImage) -> OrderImage:
         self.session.add(orderImage)
+        await self._record_image_event("order.image_added", orderImage)
 
-        await self.session.commit()
         await self.session.refresh(orderImage)
 
         return orderImage
@@ -86,34 +451,147 @@ class OrderService:
         service = result.scalar_one_or_none()
         if not service:
             return False
+        await self.rollups.apply([(OrderRollupSnapshot.of(service), None)])
+        await self.outbox.enqueue("order.deleted", service.id, order_payload(service))
         await self.session.delete(service)
-        await self.session.commit()
+        await self.session.flush()
 
         return True
 
-    async def update(self, id, payload: OrderCreate):
+    async def update(self, id, payload: OrderCreate, if_match: Optional[str] = None):
+        """
+        Replace an order's fields. ``if_match`` (the ETag the client last
+        saw) makes the write apply only to that version; without it the
+        version column still catches writes racing this read.
+        """
         res = await self.getId(id)
 
         if res is None:
             return None
+        if isinstance(res, OrderArchive):
+            raise OrderArchivedError(f"Order {id} is archived and read-only.")
+        if not if_match_satisfied(if_match, order_etag(res)):
+            raise OrderPreconditionFailedError(
+                f"Order {id} has changed since it was read."
+            )
 
+        before = OrderRollupSnapshot.of(res)
         data = payload.model_dump(exclude_unset=True)
 
-        for field, value in data.items():
-            setattr(res, field, value)
-
-        await self.session.commit()
+        try:
+            # A conflict only undoes this update, not the rest of the request
+            async with self.session.begin_nested():
+                for field, value in data.items():
+                    setattr(res, field, value)
+
+                if res.status == "completed" and res.actual_completion is None:
+                    res.actual_completion = datetime.now(timezone.utc)
+
+                await self.rollups.apply([(before, OrderRollupSnapshot.of(res))])
+                # Flush first so the event carries the bumped version
+                await self.session.flush()
+                await self.outbox.enqueue("order.updated", res.id, order_payload(res))
+        except StaleDataError:
+            # version_id_col: someone else updated the row since we read it
+            raise OrderVersionConflictError(
+                f"Order {id} was modified by another request."
+            )
         await self.session.refresh(res)
 
         return res
 
-    async def updateOrderImage(self, orderImage):
-        ser = await self.addOrderImage(orderImage)
+    async def transition_status(self, id, payload: OrderStatusTransition):
+        """
+        Move an order to a new status in one conditional UPDATE.
+        The row only changes if it is still at the expected version and
+        in a status the state machine allows moving from, so there is no
+        read before the write and no row lock held across requests.
+        """
+        orders = Order.__table__
+        previous = orders.alias("previous")
+
+        values = {
+            "status": payload.status,
+            "version": orders.c.version + 1,
+            "updated_at": func.now(),
+        }
+        if payload.status == "completed":
+            values["actual_completion"] = func.now()
+        if payload.actual_price is not None:
+            values["actual_price"] = payload.actual_price
+        if payload.notes is not None:
+            values["notes"] = payload.notes
+
+        # The self-join exposes the pre-update status through RETURNING;
+        # it is the same row version because the version check passed.
+        stmt = (
+            update(orders)
+            .where(
+                orders.c.id == id,
+                orders.c.version == payload.version,
+                orders.c.status.in_(allowed_source_statuses(payload.status)),
+                previous.c.id == orders.c.id,
+            )
+            .values(**values)
+            .returning(
+                *(column for column in orders.c if column.key != "search_vector"),
+                previous.c.status.label("previous_status"),
+            )
+        )
+        result = await self.session.execute(stmt)
+        row = result.mappings().one_or_none()
 
-        await self.session.commit()
-        await self.session.refresh(ser)
+        if row is None:
+            # Only the failure path pays for a read, to explain what went wrong
+            result = await self.session.execute(
+                select(orders.c.status, orders.c.version).where(orders.c.id == id)
+            )
+            current = result.one_or_none()
+            if current is None:
+                if await self.session.get(OrderArchive, id) is not None:
+                    raise OrderArchivedError(f"Order {id} is archived and read-only.")
+                raise OrderNotFoundError(f"Order {id} not found.")
+            if current.version != payload.version:
+                raise OrderVersionConflictError(
+                    f"Order {id} is at version {current.version}, "
+                    f"not {payload.version}."
+                )
+            raise InvalidOrderTransitionError(
+                f"Cannot move order from '{current.status}' to '{payload.status}'."
+            )
+
+        # Only the status differs from before: a transition never leaves
+        # 'completed', so the old actual price never counted as revenue.
+        await self.rollups.apply(
+            [
+                (
+                    OrderRollupSnapshot.of(row, status=row["previous_status"]),
+                    OrderRollupSnapshot.of(row),
+                )
+            ]
+        )
+        await self.outbox.enqueue(
+            "order.status_changed",
+            row["id"],
+            {**order_payload(row), "previous_status": row["previous_status"]},
+        )
+
+        return dict(row)
+
+    async def updateOrderImage(self, orderImage):
+        await self.addOrderImage(orderImage)
         # db.query(OrderImage).filter(OrderImage.order_id == UUID(order_id)).all()
 
+    async def _record_image_event(self, event_type: str, image: OrderImage):
+        await self.session.flush()
+        # The owning client routes live pushes; resolve it while writing
+        client_id = await self.session.scalar(
+            select(Order.client_id).where(Order.id == image.order_id)
+        )
+        await self.outbox.enqueue(
+            event_type, image.order_id, image_payload(image, client_id)
+        )
+
     async def getImageImageId(self, image_id):
    
         try:
@@ -121,24 +599,29 @@ class OrderService:
                 select(OrderImage).filter(OrderImage.id == UUID(image_id))
             )
         except Exception as e:
-        
-            await self.session.rollback()
             raise Exception(f"Failed to upload image: {str(e)}")
 
         image = res.scalar_one_or_none()
 
         return image
 
-    async def getOrderImages(self, order_id):
-
+    async def getOrderImages(self, order_id) -> list[dict]:
         res = await self.session.execute(
-            select(OrderImage).filter(OrderImage.order_id == order_id)
+            select(*IMAGE_LIST_COLUMNS).filter(OrderImage.order_id == order_id)
         )
-        return list(res.scalars().all())
+        images = rows_as_dicts(res)
+        if not images:
+            res = await self.session.execute(
+                select(*ARCHIVED_IMAGE_LIST_COLUMNS).filter(
+                    OrderImageArchive.order_id == order_id
+                )
+            )
+            images = rows_as_dicts(res)
+        return images
 
-    async def getOrderImagesAll(self):
-        res = await self.session.execute(select(OrderImage))
-        return list(res.scalars().all())
+    async def getOrderImagesAll(self) -> list[dict]:
+        res = await self.session.execute(select(*IMAGE_LIST_COLUMNS))
+        return rows_as_dicts(res)
 
     async def save_order_image_record(
         self,
@@ -159,7 +642,7 @@ class OrderService:
             uploaded_at=datetime.now(timezone.utc),
         )
         self.session.add(db_image)
-        await self.session.commit()
+        await self._record_image_event("order.image_added", db_image)
         await self.session.refresh(db_image)
         return db_image
 
@@ -186,6 +669,11 @@ class OrderService:
                     detail=f"Invalid file type. Allowed: {', '.join(app_config.ALLOWED_IMAGE_TYPES)}",
                 )
 
+            # Nothing below needs the database until the image row is saved.
+            # This commits whatever the request wrote before this point, so
+            # it survives even if the storage upload below then fails.
+            await release_connection(self.session)
+
             # Create temporary file
             file_extension = (
                 os.path.splitext(file.filename)[1] if file.filename else ".jpeg"
@@ -240,8 +728,8 @@ class OrderService:
             )
 
             self.session.add(db_image)
+            await self._record_image_event("order.image_added", db_image)
 
-            await self.session.commit()
             await self.session.refresh(db_image)
 
             return db_image
@@ -249,7 +737,6 @@ class OrderService:
         except HTTPException:
             raise
         except Exception as e:
-            await self.session.rollback()
             raise Exception(f"Failed to upload image: {str(e)}")
 
         finally:
@@ -272,35 +759,43 @@ class OrderService:
             image = await self.getImageImageId(image_id)
             if not image:
                 return False
-            # Delete from storage
-            storage_service.delete_file(image.s3_object_path)
+            # Delete from database first: if the storage call then fails we
+            # are left with an orphaned object, never a row pointing at
+            # nothing
+            await self._record_image_event("order.image_deleted", image)
+            await self.session.delete(image)
+            await self.session.flush()
 
-            # Delete from database
+            # Commits the deletion and its outbox event before the storage
+            # round trip and frees the connection meanwhile; a failed storage
+            # call below cannot roll them back any more.
+            await release_connection(self.session)
 
-            await self.session.delete(image)
-            await self.session.commit()
+            # Delete from storage
+            try:
+                storage_service.delete_file(image.s3_object_path)
+            except Exception as e:
+                logger.warning(
+                    "Image %s deleted but its object %s was not: %s",
+                    image_id,
+                    image.s3_object_path,
+                    e,
+                )
 
             return True
         except Exception as e:
             print(f"Failed to delete image: {e}")
             return False
 
-    async def regenerate_download_urls(
-        self, images: list[OrderImage]
-    ) -> list[OrderImage]:
-        """Regenerate fresh download URLs for a list of images"""
-        storage_service = get_storage_service()
-
+    async def regenerate_download_urls(self, images: list[dict]) -> list[dict]:
+        """
+        Regenerate fresh download URLs for a list of image rows. The rows are
+        plain dicts, so the signed URLs never flow back into order_images.
+        """
         for image in images:
-            try:
-                fresh_url = storage_service.generate_presigned_download_url(
-                    image.s3_object_path,
-                    expiry_minutes=app_config.PRESIGNED_URL_EXPIRY_MINUTES,
-                )
-                image.s3_url = fresh_url
-            except Exception as e:
-                print(f"Failed to regenerate URL for {image.s3_object_path}: {e}")
-
+            image["s3_url"] = fresh_download_url(
+                image["s3_object_path"], image["s3_url"]
+            )
         return images
 
     # async def download_file(self, images: list[OrderImage]) -> str:
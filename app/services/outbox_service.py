@@ -0,0 +1,267 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings as app_config
+from app.db.listener import PgListener
+from app.db.session import AsyncSessionLocal
+from app.models.outbox import OutboxEvent
+from app.schemas.order import OrderResponse
+from app.services.order_events import broadcast_order_events
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel that wakes the dispatcher; the payload is unused
+OUTBOX_CHANNEL = "outbox_events"
+
+OutboxHandler = Callable[[AsyncSession, list[OutboxEvent]], Awaitable[None]]
+
+
+def order_payload(order) -> dict:
+    """JSON-ready snapshot of an Order entity or RETURNING row mapping."""
+    return OrderResponse.model_validate(order).model_dump(mode="json")
+
+
+def image_payload(image, client_id: UUID) -> dict:
+    return {
+        "id": str(image.id),
+        "order_id": str(image.order_id),
+        "client_id": str(client_id),
+        "uploaded_by": str(image.uploaded_by),
+        "image_type": image.image_type,
+        "s3_object_path": image.s3_object_path,
+    }
+
+
+class OutboxService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, event_type: str, order_id: UUID, payload: dict):
+        """Record one order event in the caller's transaction."""
+        await self.enqueue_many(event_type, [(order_id, payload)])
+
+    async def enqueue_many(
+        self, event_type: str, events: Iterable[tuple[UUID, dict]]
+    ):
+        """
+        Record order events in the caller's transaction and wake the
+        dispatcher. NOTIFY is transactional: it is delivered on commit and
+        dropped on rollback, together with the events.
+        """
+        self.session.add_all(
+            OutboxEvent(
+                aggregate_type="order",
+                aggregate_id=order_id,
+                event_type=event_type,
+                payload=payload,
+            )
+            for order_id, payload in events
+        )
+        await self.session.execute(select(func.pg_notify(OUTBOX_CHANNEL, "")))
+
+
+class OutboxDispatcher:
+    """
+    Delivers outbox events to in-process handlers.
+
+    Wakes on NOTIFY, and every OUTBOX_SWEEP_SECONDS in case a notification
+    was missed, then drains pending events in batches. A batch is claimed
+    with FOR UPDATE SKIP LOCKED, so several workers can run a dispatcher
+    side by side without delivering the same batch concurrently, and it is
+    only marked delivered after every handler succeeded. Delivery is
+    therefore at least once: handlers must tolerate duplicates.
+
+    If a batch fails, its events are retried one by one so a single bad
+    event cannot hold back the rest. An event that still fails is retried
+    later with exponential backoff and, after max_attempts, marked failed
+    and no longer claimed.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        batch_size: int,
+        sweep_seconds: int,
+        retention_hours: int,
+        max_attempts: int,
+        retry_seconds: int,
+        retry_max_seconds: int,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.sweep_seconds = sweep_seconds
+        self.retention_hours = retention_hours
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._handlers: list[OutboxHandler] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, handler: OutboxHandler):
+        self._handlers.append(handler)
+
+    def wake(self, _payload: str = ""):
+        self._wakeup.set()
+
+    async def start(self, listener: PgListener):
+        try:
+            await listener.listen(OUTBOX_CHANNEL, self.wake)
+        except Exception as e:
+            # Still correct without LISTEN, just slower: sweeps pick events up
+            logger.warning(f"Outbox LISTEN unavailable, sweeping only: {e}")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        self._wakeup.set()  # Deliver whatever piled up while we were down
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.sweep_seconds)
+            except asyncio.TimeoutError:
+                await self._guard(self.purge())
+            self._wakeup.clear()
+
+            await self._guard(self.drain())
+
+    async def _guard(self, work: Awaitable):
+        try:
+            await work
+        except Exception:
+            # Unclaimed events stay pending; the next wake-up retries them
+            logger.exception("Outbox dispatch failed")
+
+    async def drain(self):
+        while await self.dispatch_batch() == self.batch_size:
+            pass
+
+    async def dispatch_batch(self) -> int:
+        """Deliver the oldest due events; returns how many were claimed."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(OutboxEvent)
+                .where(
+                    OutboxEvent.dispatched_at.is_(None),
+                    OutboxEvent.failed_at.is_(None),
+                    or_(
+                        OutboxEvent.next_attempt_at.is_(None),
+                        OutboxEvent.next_attempt_at <= func.now(),
+                    ),
+                )
+                .order_by(OutboxEvent.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = list(result.scalars().all())
+            if not events:
+                return 0
+
+            error = await self._deliver(session, events)
+            if error is not None and len(events) == 1:
+                self._retry_later(events[0], error)
+            elif error is not None:
+                # Find the events that broke the batch and deliver the rest
+                for event in events:
+                    error = await self._deliver(session, [event])
+                    if error is not None:
+                        self._retry_later(event, error)
+
+            await session.commit()
+            return len(events)
+
+    async def _deliver(
+        self, session: AsyncSession, events: list[OutboxEvent]
+    ) -> Optional[Exception]:
+        """
+        Run every handler on events and mark them delivered. Handlers run in
+        a savepoint, so a failure also discards what they wrote (NOTIFYs
+        included). Returns the error, or None on success.
+        """
+        try:
+            async with session.begin_nested():
+                for handler in self._handlers:
+                    await handler(session, events)
+        except Exception as e:
+            return e
+
+        now = datetime.now(timezone.utc)
+        for event in events:
+            event.dispatched_at = now
+        return None
+
+    def _retry_later(self, event: OutboxEvent, error: Exception):
+        event.attempts += 1
+        event.last_error = str(error)[:1000]
+        now = datetime.now(timezone.utc)
+        if event.attempts >= self.max_attempts:
+            event.failed_at = now
+            logger.error(
+                "Outbox event %s (%s) failed after %d attempts: %s",
+                event.id,
+                event.event_type,
+                event.attempts,
+                event.last_error,
+            )
+            return
+
+        delay = min(
+            self.retry_seconds * 2 ** (event.attempts - 1), self.retry_max_seconds
+        )
+        event.next_attempt_at = now + timedelta(seconds=delay)
+        logger.warning(
+            "Outbox event %s (%s) failed, retrying in %ss: %s",
+            event.id,
+            event.event_type,
+            delay,
+            event.last_error,
+        )
+
+    async def purge(self):
+        """Drop delivered events past retention."""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.retention_hours)
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(OutboxEvent).where(OutboxEvent.dispatched_at < cutoff)
+            )
+            await session.commit()
+
+
+async def log_events(_session: AsyncSession, events: list[OutboxEvent]):
+    for event in events:
+        logger.info(f"Order event {event.event_type} for {event.aggregate_id}")
+
+
+# Singleton instance
+_outbox_dispatcher: OutboxDispatcher = None
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """Get singleton outbox dispatcher instance"""
+    global _outbox_dispatcher
+    if _outbox_dispatcher is None:
+        _outbox_dispatcher = OutboxDispatcher(
+            session_factory=AsyncSessionLocal,
+            batch_size=app_config.OUTBOX_BATCH_SIZE,
+            sweep_seconds=app_config.OUTBOX_SWEEP_SECONDS,
+            retention_hours=app_config.OUTBOX_RETENTION_HOURS,
+            max_attempts=app_config.OUTBOX_MAX_ATTEMPTS,
+            retry_seconds=app_config.OUTBOX_RETRY_SECONDS,
+            retry_max_seconds=app_config.OUTBOX_RETRY_MAX_SECONDS,
+        )
+        _outbox_dispatcher.subscribe(log_events)
+        _outbox_dispatcher.subscribe(broadcast_order_events)
+    return _outbox_dispatcher
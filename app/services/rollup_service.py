@@ -0,0 +1,295 @@
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rollup import (
+    REVENUE_TOTAL_SLOTS,
+    OrderDailyRevenue,
+    OrderRevenueTotal,
+    OrderStatusCount,
+    ServiceOrderVolume,
+)
+from app.models.service import Service
+
+
+def rollup_day(moment: datetime) -> date:
+    """Rollups bucket by UTC day."""
+    return moment.astimezone(timezone.utc).date()
+
+
+def revenue_slot(order_id: UUID) -> int:
+    """The order_revenue_totals row an order's completion is counted in."""
+    return order_id.int % REVENUE_TOTAL_SLOTS
+
+
+@dataclass(frozen=True)
+class OrderRollupSnapshot:
+    """The fields of an order that the dashboard rollups depend on."""
+
+    order_id: UUID
+    status: str
+    service_id: UUID
+    created_day: date
+    quoted_price: Decimal
+    actual_price: Optional[Decimal]
+    completed_day: Optional[date]
+
+    @classmethod
+    def of(cls, order, **overrides) -> "OrderRollupSnapshot":
+        """Snapshot an Order entity or a RETURNING row mapping."""
+        if isinstance(order, Mapping):
+            fields = dict(order)
+        else:
+            fields = {
+                name: getattr(order, name)
+                for name in (
+                    "id",
+                    "status",
+                    "service_id",
+                    "created_at",
+                    "quoted_price",
+                    "actual_price",
+                    "actual_completion",
+                )
+            }
+        fields.update(overrides)
+
+        completion = fields["actual_completion"]
+        return cls(
+            order_id=fields["id"],
+            status=fields["status"],
+            service_id=fields["service_id"],
+            created_day=rollup_day(fields["created_at"]),
+            quoted_price=Decimal(fields["quoted_price"]),
+            actual_price=(
+                Decimal(fields["actual_price"])
+                if fields["actual_price"] is not None
+                else None
+            ),
+            completed_day=rollup_day(completion) if completion else None,
+        )
+
+
+@dataclass
+class RollupDeltas:
+    status: dict[str, int]
+    daily: dict[date, list]  # [orders_created, quoted, orders_completed, actual]
+    service: dict[UUID, list]  # [order_count, quoted]
+    totals: dict[int, list]  # slot -> [orders_completed, actual] across all days
+
+
+def rollup_deltas(
+    changes: Iterable[
+        tuple[Optional[OrderRollupSnapshot], Optional[OrderRollupSnapshot]]
+    ],
+) -> RollupDeltas:
+    """
+    Net effect of order changes on the rollups.
+    Each change is (before, after); None stands for "did not exist".
+    """
+    status = defaultdict(int)
+    daily = defaultdict(lambda: [0, Decimal(0), 0, Decimal(0)])
+    service = defaultdict(lambda: [0, Decimal(0)])
+    totals = defaultdict(lambda: [0, Decimal(0)])
+
+    for before, after in changes:
+        for snapshot, sign in ((before, -1), (after, 1)):
+            if snapshot is None:
+                continue
+
+            status[snapshot.status] += sign
+
+            created = daily[snapshot.created_day]
+            created[0] += sign
+            created[1] += sign * snapshot.quoted_price
+
+            if snapshot.status == "completed" and snapshot.completed_day:
+                charged = (
+                    snapshot.actual_price
+                    if snapshot.actual_price is not None
+                    else snapshot.quoted_price
+                )
+                completed = daily[snapshot.completed_day]
+                completed[2] += sign
+                completed[3] += sign * charged
+
+                total = totals[revenue_slot(snapshot.order_id)]
+                total[0] += sign
+                total[1] += sign * charged
+
+            volume = service[snapshot.service_id]
+            volume[0] += sign
+            volume[1] += sign * snapshot.quoted_price
+
+    return RollupDeltas(
+        status={key: value for key, value in status.items() if value},
+        daily={key: value for key, value in daily.items() if any(value)},
+        service={key: value for key, value in service.items() if any(value)},
+        totals={key: value for key, value in totals.items() if any(value)},
+    )
+
+
+class OrderRollupService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply(
+        self,
+        changes: Iterable[
+            tuple[Optional[OrderRollupSnapshot], Optional[OrderRollupSnapshot]]
+        ],
+    ):
+        """
+        Add the net effect of order changes to the rollup tables.
+        Runs in the caller's transaction; rows are upserted in key order so
+        concurrent writers always lock them in the same sequence.
+        """
+        deltas = rollup_deltas(changes)
+
+        if deltas.status:
+            stmt = insert(OrderStatusCount).values(
+                [
+                    {"status": key, "order_count": value}
+                    for key, value in sorted(deltas.status.items())
+                ]
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[OrderStatusCount.status],
+                    set_={
+                        "order_count": OrderStatusCount.order_count
+                        + stmt.excluded.order_count
+                    },
+                )
+            )
+
+        if deltas.daily:
+            stmt = insert(OrderDailyRevenue).values(
+                [
+                    {
+                        "day": key,
+                        "orders_created": created,
+                        "quoted_revenue": quoted,
+                        "orders_completed": completed,
+                        "actual_revenue": actual,
+                    }
+                    for key, (created, quoted, completed, actual) in sorted(
+                        deltas.daily.items()
+                    )
+                ]
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[OrderDailyRevenue.day],
+                    set_={
+                        column: getattr(OrderDailyRevenue, column)
+                        + getattr(stmt.excluded, column)
+                        for column in (
+                            "orders_created",
+                            "quoted_revenue",
+                            "orders_completed",
+                            "actual_revenue",
+                        )
+                    },
+                )
+            )
+
+        if deltas.totals:
+            stmt = insert(OrderRevenueTotal).values(
+                [
+                    {
+                        "slot": key,
+                        "orders_completed": completed,
+                        "actual_revenue": actual,
+                    }
+                    for key, (completed, actual) in sorted(deltas.totals.items())
+                ]
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[OrderRevenueTotal.slot],
+                    set_={
+                        "orders_completed": OrderRevenueTotal.orders_completed
+                        + stmt.excluded.orders_completed,
+                        "actual_revenue": OrderRevenueTotal.actual_revenue
+                        + stmt.excluded.actual_revenue,
+                    },
+                )
+            )
+
+        if deltas.service:
+            stmt = insert(ServiceOrderVolume).values(
+                [
+                    {"service_id": key, "order_count": count, "quoted_revenue": quoted}
+                    for key, (count, quoted) in sorted(deltas.service.items())
+                ]
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[ServiceOrderVolume.service_id],
+                    set_={
+                        "order_count": ServiceOrderVolume.order_count
+                        + stmt.excluded.order_count,
+                        "quoted_revenue": ServiceOrderVolume.quoted_revenue
+                        + stmt.excluded.quoted_revenue,
+                    },
+                )
+            )
+
+    async def dashboard(self, days: int = 30) -> dict:
+        """Admin dashboard metrics, read from the rollups only."""
+        result = await self.session.execute(
+            select(OrderStatusCount.status, OrderStatusCount.order_count)
+        )
+        status_counts = {status: count for status, count in result.all()}
+
+        today = datetime.now(timezone.utc).date()
+        result = await self.session.execute(
+            select(OrderDailyRevenue)
+            .where(OrderDailyRevenue.day > today - timedelta(days=days))
+            .order_by(OrderDailyRevenue.day)
+        )
+        revenue_by_day = list(result.scalars().all())
+
+        # At most 31 rows, found through the primary key
+        completed_this_month = await self.session.scalar(
+            select(
+                func.coalesce(func.sum(OrderDailyRevenue.orders_completed), 0)
+            ).where(OrderDailyRevenue.day >= today.replace(day=1))
+        )
+        # At most REVENUE_TOTAL_SLOTS rows
+        total_revenue = await self.session.scalar(
+            select(func.sum(OrderRevenueTotal.actual_revenue))
+        )
+
+        result = await self.session.execute(
+            select(
+                ServiceOrderVolume.service_id,
+                Service.name.label("service_name"),
+                ServiceOrderVolume.order_count,
+                ServiceOrderVolume.quoted_revenue,
+            )
+            .join(Service, Service.id == ServiceOrderVolume.service_id)
+            .where(ServiceOrderVolume.order_count > 0)
+            .order_by(ServiceOrderVolume.order_count.desc())
+        )
+        service_volumes = [dict(row) for row in result.mappings().all()]
+
+        return {
+            "total_orders": sum(status_counts.values()),
+            "pending_orders": status_counts.get("pending", 0),
+            "in_progress_orders": status_counts.get("in_progress", 0),
+            "completed_this_month": completed_this_month,
+            "total_revenue": total_revenue or Decimal(0),
+            "status_counts": status_counts,
+            "revenue_by_day": revenue_by_day,
+            "service_volumes": service_volumes,
+        }
@@ -0,0 +1,85 @@
+from sqlalchemy import func, literal_column, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.order import Order
+from app.models.service import Service
+from app.models.user import User
+
+# Spelled out as SQL literals so the planner matches the indexed expressions
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+CLIENT_NAME = User.first_name.op("||")(literal_column("' '")).op("||")(User.last_name)
+
+
+class SearchService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search_orders(self, q: str, page: int, page_size: int) -> list[dict]:
+        """
+        Orders whose description/notes match the query (GIN on search_vector)
+        or whose client's name is similar to it (trigram GIN on users).
+        """
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+        text_hits = select(
+            Order.id.label("id"),
+            func.ts_rank_cd(Order.search_vector, query).label("rank"),
+        ).where(Order.search_vector.op("@@")(query))
+
+        name_hits = (
+            select(
+                Order.id.label("id"),
+                func.similarity(CLIENT_NAME, q).label("rank"),
+            )
+            .join(User, User.id == Order.client_id)
+            .where(CLIENT_NAME.op("%")(q))
+        )
+
+        hits = union_all(text_hits, name_hits).subquery()
+        ranked = (
+            select(hits.c.id, func.max(hits.c.rank).label("rank"))
+            .group_by(hits.c.id)
+            .order_by(func.max(hits.c.rank).desc(), hits.c.id)
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+            .subquery()
+        )
+
+        result = await self.session.execute(
+            select(
+                Order.id,
+                Order.client_id,
+                CLIENT_NAME.label("client_name"),
+                Order.status,
+                Order.priority,
+                Order.description,
+                Order.notes,
+                Order.created_at,
+                ranked.c.rank,
+            )
+            .join(ranked, ranked.c.id == Order.id)
+            .join(User, User.id == Order.client_id)
+            .order_by(ranked.c.rank.desc(), Order.id)
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    async def search_services(self, q: str, page: int, page_size: int) -> list[dict]:
+        """Services whose name or description match, name hits ranked first."""
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        rank = func.ts_rank_cd(Service.search_vector, query).label("rank")
+
+        result = await self.session.execute(
+            select(
+                Service.id,
+                Service.name,
+                Service.description,
+                Service.category,
+                Service.base_price,
+                rank,
+            )
+            .where(Service.search_vector.op("@@")(query))
+            .order_by(rank.desc(), Service.id)
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+        )
+        return [dict(row) for row in result.mappings().all()]
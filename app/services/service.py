@@ -1,45 +1,108 @@
-from sqlalchemy import select
+import logging
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings as app_config
+from app.core.etag import make_etag
+from app.db.commit_hooks import on_commit
+from app.db.listener import PgListener
 from app.models.service import Service
+from app.schemas.service import ServiceResponse
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY channel telling every worker to drop its catalog cache
+CATALOG_CHANNEL = "service_catalog"
+_ALL = "all"
 
 
 class ServiceService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: TTLCache | None = None):
         # Get database session to perform database operations
         self.session = session
+        self.cache = cache if cache is not None else get_catalog_cache()
+        # Set once this session changed the catalog: until the commit the
+        # cache holds the old rows, and must never hold our uncommitted ones
+        self._changed = False
+
+    async def get(self) -> list[ServiceResponse]:
+        services, _ = await self.get_with_etag()
+        return services
+
+    async def get_with_etag(self) -> tuple[list[ServiceResponse], str]:
+        """The catalog and a strong ETag of its content, both cached."""
+        catalog = None if self._changed else self.cache.get(_ALL)
+        if catalog is None:
+            generation = self.cache.generation
+            # The ETag hashes rows in order, so the order must be stable
+            result = await self.session.execute(select(Service).order_by(Service.id))
+            services = [
+                ServiceResponse.model_validate(service)
+                for service in result.scalars().all()
+            ]
+            etag = make_etag(*(service.model_dump_json() for service in services))
+            catalog = (services, etag)
+            if not self._changed:
+                self.cache.set(_ALL, catalog, generation)
+        services, etag = catalog
+        return list(services), etag
+
+    async def getId(self, id) -> ServiceResponse | None:
+        service, _ = await self.get_id_with_etag(id)
+        return service
+
+    async def get_id_with_etag(self, id) -> tuple[ServiceResponse | None, str | None]:
+        key = str(id)
+        entry = None if self._changed else self.cache.get(key)
+        if entry is None:
+            generation = self.cache.generation
+            service = await self._load(id)
+            if service is None:
+                return None, None
+            service = ServiceResponse.model_validate(service)
+            entry = (service, make_etag(service.model_dump_json()))
+            if not self._changed:
+                self.cache.set(key, entry, generation)
+        return entry
+
+    async def _load(self, id) -> Service | None:
+        result = await self.session.execute(select(Service).filter(Service.id == id))
+        return result.scalar()
 
-    async def get(self):
-        services = await self.session.execute(select(Service))
-        return services.scalars().all()
-
-    async def getId(self, id):
-        service = await self.session.execute(select(Service).filter(Service.id == id))
-        return service.scalar()
+    async def catalog_changed(self):
+        """Invalidate every worker's catalog cache; call after any write."""
+        # Every worker drops its copy when the NOTIFY is delivered at commit.
+        # The local clear waits for the commit too: done earlier, a concurrent
+        # reader could cache the old rows again before they are replaced.
+        self._changed = True
+        on_commit(self.session, self.cache.clear)
+        await self.session.execute(select(func.pg_notify(CATALOG_CHANNEL, "")))
 
     async def add(self, service) -> Service:
         ser = Service(**service.model_dump())
 
         self.session.add(ser)
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(ser)
+        await self.catalog_changed()
 
         return ser
 
     async def remove(self, id):
-        result = await self.session.execute(select(Service).filter(Service.id == id))
-
-        service = result.scalar_one_or_none()
+        service = await self._load(id)
         if not service:
             return False
         await self.session.delete(service)
-        await self.session.commit()
+        await self.session.flush()
+        await self.catalog_changed()
 
         return True
 
     async def update(self, id, updateService):
-        res = await self.getId(id)
+        res = await self._load(id)
 
         if res is None:
             return None
@@ -49,9 +112,37 @@ class ServiceService:
         for field, value in data.items():
             setattr(res, field, value)
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(res)
+        await self.catalog_changed()
 
         return res
 
-    
+
+# Singleton instance
+_catalog_cache: TTLCache = None
+
+
+def get_catalog_cache() -> TTLCache:
+    """Get singleton service catalog cache instance"""
+    global _catalog_cache
+    if _catalog_cache is None:
+        _catalog_cache = TTLCache(
+            ttl_seconds=app_config.SERVICE_CACHE_TTL_SECONDS,
+            max_entries=app_config.SERVICE_CACHE_MAX_ENTRIES,
+        )
+    return _catalog_cache
+
+
+async def listen_for_catalog_changes(listener: PgListener):
+    """
+    Clear this worker's catalog cache whenever any worker changes it.
+    The listener also sends an empty payload after reconnecting, which
+    clears the cache in case an invalidation was missed meanwhile.
+    """
+    try:
+        await listener.listen(
+            CATALOG_CHANNEL, lambda _payload: get_catalog_cache().clear()
+        )
+    except Exception as e:
+        logger.warning(f"Cross-worker catalog invalidation unavailable: {e}")
@@ -62,6 +62,23 @@ class StorageServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def archive_file(self, object_name: str) -> str:
+        """
+        Move an object to the archive tier.
+
+        The original is left in place when the archived copy has a
+        different name, so the caller can delete it once the new name
+        has been recorded.
+
+        Args:
+            object_name: Object name in storage
+
+        Returns:
+            Object name of the archived copy
+        """
+        pass
+
     @abstractmethod
     def file_exists(self, object_name: str) -> bool:
         """
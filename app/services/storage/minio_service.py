@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
+from minio.commonconfig import CopySource
 from minio.error import S3Error
 from urllib3 import ProxyManager
 
@@ -125,6 +126,19 @@ class MinIOStorageService(StorageServiceInterface):
         except S3Error as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
 
+    def archive_file(self, object_name: str) -> str:
+        """Copy object under the archive prefix (MinIO has no storage classes)"""
+        archived_name = f"{app_config.ARCHIVE_OBJECT_PREFIX}{object_name}"
+        try:
+            self.client.copy_object(
+                self.bucket_name,
+                archived_name,
+                CopySource(self.bucket_name, object_name),
+            )
+            return archived_name
+        except S3Error as e:
+            raise Exception(f"Failed to archive in MinIO: {str(e)}")
+
     def file_exists(self, object_name: str) -> bool:
         """Check if file exists"""
         try:
@@ -194,6 +194,21 @@ class AWSS3StorageService(StorageServiceInterface):
         except ClientError as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
 
+    def archive_file(self, object_name: str) -> str:
+        """Rewrite object in place with the archive storage class"""
+        try:
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                CopySource={"Bucket": self.bucket_name, "Key": object_name},
+                StorageClass=app_config.ARCHIVE_STORAGE_CLASS,
+                MetadataDirective="COPY",
+                ServerSideEncryption="AES256",
+            )
+            return object_name
+        except ClientError as e:
+            raise Exception(f"Failed to archive in S3: {str(e)}")
+
     def file_exists(self, object_name: str) -> bool:
         """Check if file exists"""
         try:
@@ -6,9 +6,15 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    get_password_hash_async,
+    verify_and_update_password_async,
+)
+from app.db.projection import response_columns, rows_as_dicts
 from app.models.user import User
-from app.schemas.user import UserUpdateAdmin, UserUpdateSelf
+from app.schemas.user import UserResponse, UserUpdateAdmin, UserUpdateSelf
+
+USER_LIST_COLUMNS = response_columns(User, UserResponse)
 
 
 class UserService:
@@ -20,9 +26,10 @@ class UserService:
 
         return user
 
-    async def getAll(self):
-        users = await self.session.execute(select(User))
-        return users.scalars().all()
+    async def getAll(self) -> list[dict]:
+        # Never loads hashed_password
+        users = await self.session.execute(select(*USER_LIST_COLUMNS))
+        return rows_as_dicts(users)
 
     async def get_by_email(self, email: str) -> Optional[User]:
         result = await self.session.execute(select(User).where(User.email == email))
@@ -31,7 +38,7 @@ class UserService:
     async def add(self, user_data) -> User:
         """Create a new user with a hashed password."""
         time = datetime.now()
-        hashed_pw = get_password_hash(user_data.password)
+        hashed_pw = await get_password_hash_async(user_data.password)
 
         # 2. Convert Pydantic model to SQLAlchemy model
         # Exclude 'password' from the dict and add 'hashed_password'
@@ -50,7 +57,7 @@ class UserService:
 
         # )
         self.session.add(db_user)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(db_user)
         return db_user
 
@@ -58,8 +65,15 @@ class UserService:
         user = await self.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = await verify_and_update_password_async(
+            password, user.hashed_password
+        )
+        if not verified:
             return None
+        if new_hash is not None:
+            # Legacy scheme or outdated costs: store the upgraded hash, it is
+            # written with the request's commit
+            user.hashed_password = new_hash
         return user
 
     async def update_user_self_service(
@@ -69,7 +83,7 @@ class UserService:
         update_data = payload.model_dump(exclude_unset=True)
 
         if "password" in update_data:
-            update_data["hashshed_password"] = get_password_hash(
+            update_data["hashed_password"] = await get_password_hash_async(
                 update_data.pop("password")
             )
         # user = await self.get(user_id)
@@ -79,14 +93,13 @@ class UserService:
         )
 
         result = await self.session.execute(query)
-        await self.session.commit()
         return result.scalars().first()
 
     async def update_user_admin_service(self, user_id: UUID, payload: UserUpdateAdmin):
         update_data = payload.model_dump(exclude_unset=True)
 
         if "password" in update_data:
-            update_data["hashshed_password"] = get_password_hash(
+            update_data["hashed_password"] = await get_password_hash_async(
                 update_data.pop("password")
             )
 
@@ -95,14 +108,13 @@ class UserService:
         )
 
         result = await self.session.execute(query)
-        await self.session.commit()
         return result.scalars().first()
 
     async def delete_user_service(self, id: UUID) -> bool:
-        user = self.get(id)
+        user = await self.get(id)
 
         await self.session.delete(user)
-        await self.session.commit()
+        await self.session.flush()
         return True
 
 
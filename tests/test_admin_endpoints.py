@@ -0,0 +1,266 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import admin as admin_endpoint
+from app.core.password_pool import PasswordPool
+from app.core.security import create_access_token, get_current_user
+from app.db.slow_queries import SlowQueryLog
+from app.main import app
+from app.schemas.user import UserAuthPayload
+from app.services import (
+    archive_service,
+    import_service,
+    rollup_service,
+    search_service,
+)
+from app.services.import_service import detect_format, parse_rows
+
+client = TestClient(app)
+
+
+def override_user(user_type):
+    user = UserAuthPayload(
+        id=str(uuid.uuid4()), email=f"{user_type}@example.com", user_type=user_type
+    )
+    app.dependency_overrides[get_current_user] = lambda: user
+    token = create_access_token({"sub": user.email})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture()
+def auth_headers_admin():
+    yield override_user("admin")
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def auth_headers_client():
+    yield override_user("client")
+    app.dependency_overrides.clear()
+
+
+def test_dashboard_requires_admin(auth_headers_client):
+    res = client.get("/api/v1/admin/dashboard", headers=auth_headers_client)
+    assert res.status_code == 403
+
+
+def test_dashboard_returns_rollup_metrics(monkeypatch, auth_headers_admin):
+    service_id = uuid.uuid4()
+
+    async def fake_dashboard(_self, days):
+        assert days == 7
+        return {
+            "total_orders": 3,
+            "pending_orders": 2,
+            "in_progress_orders": 0,
+            "completed_this_month": 1,
+            "total_revenue": Decimal("45.00"),
+            "status_counts": {"pending": 2, "completed": 1},
+            "revenue_by_day": [],
+            "service_volumes": [
+                {
+                    "service_id": service_id,
+                    "service_name": "Hemming",
+                    "order_count": 3,
+                    "quoted_revenue": Decimal("120.00"),
+                }
+            ],
+        }
+
+    monkeypatch.setattr(
+        rollup_service.OrderRollupService, "dashboard", fake_dashboard
+    )
+
+    res = client.get("/api/v1/admin/dashboard?days=7", headers=auth_headers_admin)
+
+    assert res.status_code == 200
+    data = res.json()
+    assert data["total_orders"] == 3
+    assert data["service_volumes"][0]["service_name"] == "Hemming"
+
+
+def test_search_scope_limits_queries(monkeypatch, auth_headers_admin):
+    calls = []
+
+    async def fake_search_orders(_self, q, page, page_size):
+        calls.append("orders")
+        return []
+
+    async def fake_search_services(_self, q, page, page_size):
+        calls.append("services")
+        assert (q, page, page_size) == ("hem", 2, 5)
+        return [
+            {
+                "id": uuid.uuid4(),
+                "name": "Hemming",
+                "description": "Shorten trousers",
+                "category": "alterations",
+                "base_price": Decimal("15.00"),
+                "rank": 0.8,
+            }
+        ]
+
+    monkeypatch.setattr(
+        search_service.SearchService, "search_orders", fake_search_orders
+    )
+    monkeypatch.setattr(
+        search_service.SearchService, "search_services", fake_search_services
+    )
+
+    res = client.get(
+        "/api/v1/admin/search?q=hem&scope=services&page=2&page_size=5",
+        headers=auth_headers_admin,
+    )
+
+    assert res.status_code == 200
+    assert calls == ["services"]
+    data = res.json()
+    assert data["orders"] == []
+    assert data["services"][0]["name"] == "Hemming"
+
+
+def test_search_rejects_oversized_page(auth_headers_admin):
+    res = client.get(
+        "/api/v1/admin/search?q=hem&page_size=500", headers=auth_headers_admin
+    )
+    assert res.status_code == 422
+
+
+def test_archive_moves_one_batch_and_objects_after_the_response(
+    monkeypatch, auth_headers_admin
+):
+    images = [("image-1", "orders/a.jpg")]
+    moved = []
+
+    async def fake_archive_batch(_self, older_than_days=None, batch_size=None):
+        assert (older_than_days, batch_size) == (400, 50)
+        return 50, images, True
+
+    async def fake_archive_objects(batch):
+        moved.append(batch)
+
+    monkeypatch.setattr(
+        archive_service.ArchiveService, "archive_batch", fake_archive_batch
+    )
+    monkeypatch.setattr(admin_endpoint, "archive_objects", fake_archive_objects)
+
+    res = client.post(
+        "/api/v1/admin/archive?older_than_days=400&batch_size=50",
+        headers=auth_headers_admin,
+    )
+
+    assert res.status_code == 200
+    assert res.json() == {"orders": 50, "images": 1, "more": True}
+    assert moved == [images]
+
+
+def test_parse_rows_csv_drops_empty_cells_and_keeps_line_numbers():
+    content = (
+        b"email,first_name,last_name,phone\n"
+        b"a@x.io,Ann,Lee,\n"
+        b"b@x.io,Bo,Kim,555\n"
+    )
+
+    rows = parse_rows(content, "csv")
+
+    assert rows == [
+        (2, {"email": "a@x.io", "first_name": "Ann", "last_name": "Lee"}),
+        (
+            3,
+            {"email": "b@x.io", "first_name": "Bo", "last_name": "Kim", "phone": "555"},
+        ),
+    ]
+
+
+def test_parse_rows_ndjson_and_format_detection():
+    content = b'{"name": "Hemming"}\n\n{"name": "Zip repair"}\n'
+
+    assert detect_format("services.ndjson", "application/octet-stream") == "ndjson"
+    assert detect_format("services.csv", "text/csv") == "csv"
+    assert parse_rows(content, "ndjson") == [
+        (1, {"name": "Hemming"}),
+        (3, {"name": "Zip repair"}),
+    ]
+
+
+def test_import_users_reports_invalid_rows(monkeypatch, auth_headers_admin):
+    async def fake_import_users(_self, rows):
+        return {
+            "received": len(rows),
+            "inserted": 1,
+            "updated": 0,
+            "skipped": 0,
+            "errors": [{"line": 3, "errors": ["password: too short"]}],
+        }
+
+    monkeypatch.setattr(
+        import_service.ImportService, "import_users", fake_import_users
+    )
+
+    csv_file = (
+        b"email,password,first_name,last_name\n"
+        b"a@x.io,longenough,Ann,Lee\n"
+        b"b@x.io,short,Bo,Kim\n"
+    )
+    res = client.post(
+        "/api/v1/admin/import/users",
+        files={"file": ("users.csv", csv_file, "text/csv")},
+        headers=auth_headers_admin,
+    )
+
+    assert res.status_code == 207
+    assert res.json()["received"] == 2
+    assert res.json()["errors"][0]["line"] == 3
+
+
+def test_import_rejects_unreadable_file(auth_headers_admin):
+    res = client.post(
+        "/api/v1/admin/import/services",
+        files={"file": ("services.ndjson", b"{not json", "application/x-ndjson")},
+        headers=auth_headers_admin,
+    )
+    assert res.status_code == 400
+
+
+def test_slow_queries_lists_newest_first_without_values(
+    monkeypatch, auth_headers_admin
+):
+    log = SlowQueryLog(threshold_ms=100, capacity=10, explain_rate=0)
+    log.record("SELECT * FROM orders WHERE id = $1", ("secret",), 0.25)
+    log.record("SELECT count(*) FROM orders", (), 0.01)
+    log.record("SELECT * FROM services WHERE name = $1", ("x",), 0.5)
+    monkeypatch.setattr(admin_endpoint, "get_slow_query_log", lambda: log)
+
+    res = client.get("/api/v1/admin/slow-queries", headers=auth_headers_admin)
+
+    assert res.status_code == 200
+    body = res.json()
+    assert [entry["duration_ms"] for entry in body] == [500.0, 250.0]
+    assert body[1]["parameters"] == ["str"]
+    assert "secret" not in res.text
+
+    res = client.delete("/api/v1/admin/slow-queries", headers=auth_headers_admin)
+    assert res.status_code == 204
+    assert log.recent() == []
+
+
+def test_password_pool_stats(monkeypatch, auth_headers_admin):
+    pool = PasswordPool(workers=2, max_queue=8, queue_timeout=1)
+    pool.rejected = 3
+    monkeypatch.setattr(admin_endpoint, "get_password_pool", lambda: pool)
+
+    res = client.get("/api/v1/admin/password-pool", headers=auth_headers_admin)
+
+    assert res.status_code == 200
+    assert res.json() == {
+        "mode": "thread",
+        "workers": 2,
+        "max_queue": 8,
+        "running": 0,
+        "waiting": 0,
+        "completed": 0,
+        "rejected": 3,
+    }
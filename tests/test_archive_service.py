@@ -0,0 +1,61 @@
+import asyncio
+import uuid
+
+from app.services.archive_service import ArchiveService
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Every SELECT finds ``ids`` and every image move returns ``images``."""
+
+    def __init__(self, ids, images=()):
+        self.ids = list(ids)
+        self.images = list(images)
+        self.commits = 0
+
+    async def execute(self, stmt):
+        if stmt.is_select:
+            return FakeResult(self.ids)
+        return FakeResult(self.images)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_archive_batch_leaves_the_commit_to_the_caller():
+    session = FakeSession([uuid.uuid4(), uuid.uuid4()], [("image-1", "a.jpg")])
+
+    orders, images, more = asyncio.run(
+        ArchiveService(session).archive_batch(batch_size=2)
+    )
+
+    assert (orders, images, more) == (2, [("image-1", "a.jpg")], True)
+    assert session.commits == 0
+
+
+def test_archive_job_commits_each_batch():
+    session = FakeSession([uuid.uuid4()])
+    service = ArchiveService(session)
+    moved = []
+
+    async def archive_objects(images):
+        moved.append(session.commits)
+
+    service._archive_objects = archive_objects
+
+    totals = asyncio.run(service.archive_orders(batch_size=2))
+
+    assert totals == {"orders": 1, "images": 0}
+    assert session.commits == 1
+    # Objects move only once their rows are committed
+    assert moved == [1]
@@ -0,0 +1,98 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+
+from app.db.commit_hooks import _KEY as ON_COMMIT
+from app.schemas.booking import BookingCreate
+from app.services import booking_service as booking_service_module
+from app.services.availability_service import (
+    BookingIntervalIndex,
+    free_slots,
+)
+from app.services.booking_service import BookingService
+
+DAY = date(2026, 3, 2)
+SLOT = timedelta(minutes=30)
+
+
+def at(hour, minute=0):
+    return datetime(2026, 3, 2, hour, minute, tzinfo=timezone.utc)
+
+
+def test_free_slots_skips_booked_intervals():
+    booked = [(at(9), at(9, 30)), (at(10, 15), at(10, 45))]
+
+    slots = free_slots(booked, (at(9), at(12)), SLOT)
+
+    assert slots == [
+        (at(9, 30), at(10)),
+        (at(11), at(11, 30)),
+        (at(11, 30), at(12)),
+    ]
+
+
+def test_free_slots_empty_day_is_fully_open():
+    slots = free_slots([], (at(9), at(10)), SLOT)
+    assert slots == [(at(9), at(9, 30)), (at(9, 30), at(10))]
+
+
+def test_index_add_keeps_loaded_day_current():
+    index = BookingIntervalIndex(ttl_seconds=60)
+    service_id = uuid.uuid4()
+
+    # Nothing is tracked for days that were never loaded
+    index.add(service_id, at(9), at(9, 30))
+    assert index.get(service_id, DAY) is None
+
+    index.load(service_id, DAY, [(at(11), at(11, 30))])
+    index.add(service_id, at(9), at(9, 30))
+
+    assert index.get(service_id, DAY) == [(at(9), at(9, 30)), (at(11), at(11, 30))]
+    assert index.overlaps(service_id, at(9, 15), at(9, 45))
+    assert not index.overlaps(service_id, at(9, 30), at(10))
+
+
+def test_index_entries_expire():
+    index = BookingIntervalIndex(ttl_seconds=-1)
+    service_id = uuid.uuid4()
+
+    index.load(service_id, DAY, [(at(9), at(9, 30))])
+
+    assert index.get(service_id, DAY) is None
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    def add(self, obj):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+
+def test_booking_reaches_the_index_only_on_commit(monkeypatch):
+    index = BookingIntervalIndex(ttl_seconds=60)
+    monkeypatch.setattr(booking_service_module, "get_availability_index", lambda: index)
+    service_id = uuid.uuid4()
+    index.load(service_id, DAY, [])
+    session = FakeSession()
+
+    asyncio.run(
+        BookingService(session).add(
+            BookingCreate(service_id=service_id, appointment_time=at(10)),
+            uuid.uuid4(),
+        )
+    )
+
+    # Not yet committed: a rollback must leave the slot free
+    assert index.get(service_id, DAY) == []
+    for callback in session.info[ON_COMMIT]:
+        callback()
+    assert index.get(service_id, DAY) == [(at(10), at(10, 30))]
@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.db.commit_hooks import on_commit
+
+
+@pytest.fixture
+def session():
+    with Session(create_engine("sqlite://")) as session:
+        yield session
+
+
+def test_callbacks_run_after_the_outer_commit_only(session):
+    ran = []
+    session.execute(text("SELECT 1"))
+    on_commit(session, lambda: ran.append("first"))
+
+    with session.begin_nested():
+        on_commit(session, lambda: ran.append("second"))
+    assert ran == []
+
+    session.commit()
+    assert ran == ["first", "second"]
+
+    session.execute(text("SELECT 1"))
+    session.commit()
+    assert ran == ["first", "second"]
+
+
+def test_callbacks_are_dropped_on_rollback(session):
+    ran = []
+    session.execute(text("SELECT 1"))
+    on_commit(session, lambda: ran.append("rolled back"))
+
+    session.rollback()
+    session.execute(text("SELECT 1"))
+    session.commit()
+
+    assert ran == []
+
+
+def test_failing_callback_does_not_stop_the_others(session):
+    ran = []
+    session.execute(text("SELECT 1"))
+    on_commit(session, lambda: 1 / 0)
+    on_commit(session, lambda: ran.append("after"))
+
+    session.commit()
+
+    assert ran == ["after"]
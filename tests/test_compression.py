@@ -0,0 +1,129 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.middleware import (
+    CompressionMiddleware,
+    is_compressible,
+    negotiate_encoding,
+)
+
+ROWS = [
+    {"id": i, "url": f"https://bucket.example.com/image-{i}.jpg"} for i in range(50)
+]
+
+
+async def big_json(request):
+    return JSONResponse(ROWS, headers={"ETag": '"v1"'})
+
+
+async def small_json(request):
+    return JSONResponse({"ok": True})
+
+
+async def png(request):
+    return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+
+async def csv_stream(request):
+    async def rows():
+        yield b"id,url\n"
+        for row in ROWS:
+            yield f"{row['id']},{row['url']}\n".encode()
+
+    return StreamingResponse(rows(), media_type="text/csv")
+
+
+async def events(request):
+    async def stream():
+        yield b"data: " + b"x" * 2048 + b"\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+app = CompressionMiddleware(
+    Starlette(
+        routes=[
+            Route("/big", big_json),
+            Route("/small", small_json),
+            Route("/png", png),
+            Route("/csv", csv_stream),
+            Route("/events", events),
+        ]
+    ),
+    minimum_size=512,
+)
+client = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br, zstd", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, *;q=0.1", "zstd"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding_honours_weights_then_server_preference(header, expected):
+    assert negotiate_encoding(header, ("br", "zstd", "gzip")) == expected
+
+
+def test_only_text_like_media_is_compressible():
+    assert is_compressible("application/json")
+    assert is_compressible("text/csv; charset=utf-8")
+    assert is_compressible("application/problem+json")
+    assert not is_compressible("image/jpeg")
+    assert not is_compressible("text/event-stream")
+
+
+def test_large_json_is_gzipped_and_keeps_its_strong_etag():
+    res = client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert res.headers["Vary"] == "Accept-Encoding"
+    assert res.headers["ETag"] == '"v1"'
+    assert res.json() == ROWS
+
+
+def test_small_bodies_and_binary_media_are_sent_as_is():
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    image = client.get("/png", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in small.headers
+    assert "Content-Encoding" not in image.headers
+    assert image.content.startswith(b"\x89PNG")
+
+
+def test_identity_only_clients_get_plain_responses():
+    res = client.get("/big", headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in res.headers
+    assert res.headers["ETag"] == '"v1"'
+
+
+def test_streamed_bodies_are_compressed_chunk_by_chunk():
+    res = client.get("/csv", headers={"Accept-Encoding": "gzip"})
+
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in res.headers
+    assert res.text.splitlines()[1] == "0,https://bucket.example.com/image-0.jpg"
+
+
+def test_event_streams_are_not_compressed():
+    with client.stream("GET", "/events", headers={"Accept-Encoding": "gzip"}) as res:
+        assert "Content-Encoding" not in res.headers
+        assert res.read().startswith(b"data: ")
+
+
+def test_gzip_chunks_form_one_valid_stream():
+    # Decode the raw bytes, not the client's transparently decoded body
+    with client.stream("GET", "/csv", headers={"Accept-Encoding": "gzip"}) as res:
+        raw = b"".join(res.iter_raw())
+
+    assert gzip.decompress(raw).startswith(b"id,url\n0,")
@@ -161,3 +161,19 @@ def test_get_session_rolls_back_and_closes_on_exception(monkeypatch):
 
     assert events["rolled_back"] is True
     assert events["closed"] is True
+
+
+@pytest.mark.parametrize("in_transaction, committed", [(True, True), (False, False)])
+def test_release_connection_ends_open_transaction_only(in_transaction, committed):
+    events = {"committed": False}
+
+    class DummyAsyncSession:
+        def in_transaction(self):
+            return in_transaction
+
+        async def commit(self):
+            events["committed"] = True
+
+    asyncio.run(db_session.release_connection(DummyAsyncSession()))
+
+    assert events["committed"] is committed
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from app.core.dependencies import get_unit_of_work
+
+
+class DummyAsyncSession:
+    def __init__(self, in_transaction=True):
+        self._in_transaction = in_transaction
+        self.commits = 0
+
+    def in_transaction(self):
+        return self._in_transaction
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_unit_of_work_commits_once_after_handler_returns():
+    session = DummyAsyncSession()
+
+    async def run():
+        uow = get_unit_of_work(session)
+        assert await uow.__anext__() is session
+        assert session.commits == 0
+        with pytest.raises(StopAsyncIteration):
+            await uow.__anext__()
+
+    asyncio.run(run())
+
+    assert session.commits == 1
+
+
+def test_unit_of_work_skips_commit_without_transaction():
+    session = DummyAsyncSession(in_transaction=False)
+
+    async def run():
+        async for _ in get_unit_of_work(session):
+            pass
+
+    asyncio.run(run())
+
+    assert session.commits == 0
+
+
+def test_unit_of_work_does_not_commit_when_handler_fails():
+    session = DummyAsyncSession()
+
+    async def run():
+        uow = get_unit_of_work(session)
+        await uow.__anext__()
+        with pytest.raises(RuntimeError):
+            await uow.athrow(RuntimeError("handler failed"))
+
+    asyncio.run(run())
+
+    assert session.commits == 0
@@ -0,0 +1,48 @@
+from fastapi import Response
+
+from app.core.etag import (
+    conditional_response,
+    etag_matches,
+    if_match_satisfied,
+    make_etag,
+)
+
+
+def test_make_etag_is_stable_and_sensitive_to_parts():
+    assert make_etag("orders", 3, "abc") == make_etag("orders", 3, "abc")
+    assert make_etag("orders", 3, "abc") != make_etag("orders", 4, "abc")
+    assert make_etag("images", weak=True).startswith('W/"')
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag = make_etag("catalog")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_conditional_response_tags_or_short_circuits():
+    etag = make_etag("catalog")
+    response = Response()
+
+    assert conditional_response('"stale"', etag, response) is None
+    assert response.headers["ETag"] == etag
+
+    not_modified = conditional_response(etag, etag, Response())
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.body == b""
+
+
+def test_if_match_uses_strong_comparison():
+    etag = make_etag("order", 1, 2)
+
+    assert if_match_satisfied(None, etag)
+    assert if_match_satisfied("*", etag)
+    assert if_match_satisfied(f'"other", {etag}', etag)
+    assert not if_match_satisfied(make_etag("order", 1, 1), etag)
+    assert not if_match_satisfied(f"W/{etag}", etag)
+    assert not if_match_satisfied(f"W/{etag}", f"W/{etag}")
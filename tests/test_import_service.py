@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.cache import TTLCache
+from app.db.commit_hooks import _KEY as ON_COMMIT
+from app.services import service as service_module
+from app.services.import_service import ImportService
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeDriver:
+    def __init__(self):
+        self.copied = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copied.extend(records)
+
+
+class FakeSession:
+    """UPDATE and INSERT each report ``updated`` and ``inserted`` rows."""
+
+    def __init__(self, updated=0, inserted=0):
+        self.returning = {"UPDATE": updated, "INSERT": inserted}
+        self.driver = FakeDriver()
+        self.statements = []
+        self.info = {}
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect())).strip()
+        self.statements.append(sql)
+        return FakeResult([None] * self.returning.get(sql.split()[0], 0))
+
+    async def connection(self):
+        driver = self.driver
+
+        class Connection:
+            async def get_raw_connection(self):
+                return SimpleNamespace(driver_connection=driver)
+
+        return Connection()
+
+
+def rows(count):
+    return [
+        (
+            line,
+            {
+                "name": f"Service {line}",
+                "base_price": "10",
+                "category": "repairs",
+                "estimated_days": "2",
+            },
+        )
+        for line in range(1, count + 1)
+    ]
+
+
+@pytest.mark.parametrize(
+    "updated, inserted, notified", [(1, 1, True), (0, 2, True), (0, 0, False)]
+)
+def test_service_import_invalidates_the_catalog(
+    monkeypatch, updated, inserted, notified
+):
+    cache = TTLCache(ttl_seconds=60, max_entries=10)
+    cache.set("all", ["stale"])
+    monkeypatch.setattr(service_module, "get_catalog_cache", lambda: cache)
+    session = FakeSession(updated=updated, inserted=inserted)
+
+    result = asyncio.run(ImportService(session).import_services(rows(2)))
+
+    assert (result["updated"], result["inserted"]) == (updated, inserted)
+    assert len(session.driver.copied) == 2
+    assert any("pg_notify" in sql for sql in session.statements) is notified
+    assert cache.get("all") == ["stale"]
+    for callback in session.info.get(ON_COMMIT, []):
+        callback()
+    assert (cache.get("all") is None) is notified
+
+
+def test_import_dedupes_on_the_exact_key():
+    session = FakeSession(inserted=3)
+    uploaded = [
+        (
+            1,
+            {
+                "name": "Repair",
+                "base_price": "10",
+                "category": "a",
+                "estimated_days": "1",
+            },
+        ),
+        (
+            2,
+            {
+                "name": "REPAIR",
+                "base_price": "11",
+                "category": "a",
+                "estimated_days": "1",
+            },
+        ),
+        (
+            3,
+            {
+                "name": "Repair",
+                "base_price": "12",
+                "category": "a",
+                "estimated_days": "1",
+            },
+        ),
+    ]
+
+    asyncio.run(ImportService(session).import_services(uploaded))
+
+    assert [(row[0], row[2]) for row in session.driver.copied] == [
+        ("Repair", 12),
+        ("REPAIR", 11),
+    ]
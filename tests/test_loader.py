@@ -0,0 +1,147 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.loader import DataLoader, get_loaders
+from app.models.user import User
+from app.services.order_service import OrderService
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return FakeResult([vars(row) for row in self.rows])
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows=(), error=None):
+        self.rows = {row.id: row for row in rows}
+        self.error = error
+        self.info = {}
+        self.batches = []
+        self.statements = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append(str(compiled))
+        if self.error is not None:
+            raise self.error
+        ids = compiled.params["ids"]
+        self.batches.append(ids)
+        return FakeResult([self.rows[i] for i in ids if i in self.rows])
+
+
+def make_row(**fields):
+    return SimpleNamespace(id=uuid.uuid4(), **fields)
+
+
+def test_loads_in_one_tick_are_one_query():
+    alice, bob = make_row(), make_row()
+    session = FakeSession([alice, bob])
+    loader = DataLoader(session, User)
+
+    async def run():
+        return await asyncio.gather(
+            loader.load(alice.id), loader.load(bob.id), loader.load(alice.id)
+        )
+
+    assert asyncio.run(run()) == [alice, bob, alice]
+    assert session.batches == [[alice.id, bob.id]]
+    assert "WHERE users.id = ANY (%(ids)s::UUID[])" in session.statements[0]
+
+
+def test_loaded_ids_are_not_fetched_again_and_missing_ids_are_none():
+    alice = make_row()
+    missing = uuid.uuid4()
+    session = FakeSession([alice])
+    loader = DataLoader(session, User)
+
+    async def run():
+        first = await loader.load_many([alice.id, missing])
+        second = await loader.load_many([alice.id, missing])
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == [alice, None]
+    assert len(session.batches) == 1
+
+
+def test_primed_rows_skip_the_query():
+    alice = make_row()
+    session = FakeSession()
+    loader = DataLoader(session, User)
+
+    async def run():
+        loader.prime(alice.id, alice)
+        return await loader.load(alice.id)
+
+    assert asyncio.run(run()) is alice
+    assert session.batches == []
+
+
+def test_failed_batch_raises_for_every_caller_and_can_be_retried():
+    key = uuid.uuid4()
+    session = FakeSession(error=RuntimeError("connection lost"))
+    loader = DataLoader(session, User)
+
+    async def run():
+        results = await asyncio.gather(
+            loader.load(key), loader.load(key), return_exceptions=True
+        )
+        session.error = None
+        return results, await loader.load(key)
+
+    results, retried = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert retried is None
+
+
+def test_loaders_are_shared_per_session():
+    session = FakeSession()
+
+    assert get_loaders(session) is get_loaders(session)
+    assert get_loaders(FakeSession()) is not get_loaders(session)
+
+
+@pytest.mark.parametrize("orders", [0, 3])
+def test_attach_names_batches_per_table(orders):
+    client = make_row(first_name="Ada", last_name="Lovelace")
+    service = make_row(name="Hemming")
+    session = FakeSession([client, service])
+    rows = [
+        {"id": uuid.uuid4(), "client_id": client.id, "service_id": service.id}
+        for _ in range(orders)
+    ]
+
+    named = asyncio.run(OrderService(session).attach_names(rows))
+
+    assert [(o["client_name"], o["service_name"]) for o in named] == [
+        ("Ada Lovelace", "Hemming")
+    ] * orders
+    assert len(session.statements) == (2 if orders else 0)
+
+
+def test_projected_loader_selects_only_its_columns():
+    client = make_row(first_name="Ada", last_name="Lovelace", hashed_password="x")
+    session = FakeSession([client])
+
+    async def run():
+        return await get_loaders(session).users.load(client.id)
+
+    row = asyncio.run(run())
+
+    assert session.statements[0].startswith(
+        "SELECT users.id, users.first_name, users.last_name \nFROM users"
+    )
+    assert row["first_name"] == "Ada"
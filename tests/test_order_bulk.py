@@ -0,0 +1,207 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from app.api.v1.endpoints import order as order_endpoint
+from app.core.dependencies import get_order_service
+from app.core.exceptions import InternalDatabaseError
+from app.core.security import create_access_token
+from app.main import app
+from app.schemas.user import UserAuthPayload
+from app.services.order_service import OrderService
+
+client = TestClient(app)
+
+CLIENT_ID = uuid.uuid4()
+SERVICE_ID = uuid.uuid4()
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Knows one client and one service; INSERT ... RETURNING echoes the rows."""
+
+    def __init__(self, insert_error=None):
+        self.insert_error = insert_error
+        self.statements = []
+        self.inserted = None
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if sql.startswith("SELECT users.id"):
+            return FakeResult([CLIENT_ID])
+        if sql.startswith("SELECT services.id"):
+            return FakeResult([SERVICE_ID])
+        if sql.startswith("INSERT INTO orders"):
+            if self.insert_error is not None:
+                raise self.insert_error
+            self.inserted = params
+            now = datetime.now(timezone.utc)
+            return FakeResult(
+                [
+                    SimpleNamespace(
+                        id=uuid.uuid4(),
+                        requested_date=now,
+                        estimated_completion=now,
+                        actual_completion=None,
+                        version=1,
+                        created_at=now,
+                        updated_at=now,
+                        **row,
+                    )
+                    for row in params
+                ]
+            )
+        raise AssertionError(f"unexpected statement: {sql}")
+
+
+def make_service(session):
+    service = OrderService(session)
+    calls = {}
+
+    async def apply(changes):
+        calls["rollups"] = list(changes)
+
+    async def enqueue_many(event_type, events):
+        calls["outbox"] = (event_type, list(events))
+
+    service.rollups = SimpleNamespace(apply=apply)
+    service.outbox = SimpleNamespace(enqueue_many=enqueue_many)
+    return service, calls
+
+
+def item(**overrides):
+    payload = {
+        "client_id": str(CLIENT_ID),
+        "service_id": str(SERVICE_ID),
+        "description": "Hem trousers",
+        "quoted_price": "25.00",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_add_bulk_reports_invalid_items_by_index():
+    session = FakeSession()
+    service, _ = make_service(session)
+    payloads = [
+        item(),
+        {"client_id": str(CLIENT_ID)},
+        item(description=""),
+        item(status="lost", priority="whenever"),
+    ]
+
+    created, errors = asyncio.run(service.add_bulk(payloads))
+
+    assert len(created) == 1
+    by_index = {error.index: error.errors for error in errors}
+    assert sorted(by_index) == [1, 2, 3]
+    assert "quoted_price: Field required" in by_index[1]
+    assert by_index[2] == ["description: Field required"]
+    assert by_index[3] == [
+        "status: Invalid value 'lost'",
+        "priority: Invalid value 'whenever'",
+    ]
+
+
+def test_add_bulk_prevalidates_foreign_keys_with_one_query_each():
+    session = FakeSession()
+    service, _ = make_service(session)
+    payloads = [
+        item(client_id=str(uuid.uuid4())),
+        item(),
+        item(service_id=str(uuid.uuid4())),
+        item(),
+    ]
+
+    created, errors = asyncio.run(service.add_bulk(payloads))
+
+    assert [error.index for error in errors] == [0, 2]
+    assert errors[0].errors[0].startswith("client_id: Unknown client")
+    assert errors[1].errors[0].startswith("service_id: Unknown service")
+    assert len(created) == 2
+    selects = [sql for sql in session.statements if sql.startswith("SELECT")]
+    assert len(selects) == 2
+    # Only the valid items reach the INSERT, with defaults filled in
+    assert len(session.inserted) == 2
+    assert {row["status"] for row in session.inserted} == {"pending"}
+    assert {row["priority"] for row in session.inserted} == {"normal"}
+
+
+def test_add_bulk_returns_orders_in_payload_order_and_records_them():
+    session = FakeSession()
+    service, calls = make_service(session)
+    payloads = [item(description=f"Order {n}") for n in range(3)]
+
+    created, errors = asyncio.run(service.add_bulk(payloads))
+
+    assert errors == []
+    assert [order.description for order in created] == [
+        "Order 0",
+        "Order 1",
+        "Order 2",
+    ]
+    assert "RETURNING" in session.statements[-1]
+    assert [after.status for before, after in calls["rollups"]] == ["pending"] * 3
+    event_type, events = calls["outbox"]
+    assert event_type == "order.created"
+    assert [order_id for order_id, _ in events] == [order.id for order in created]
+
+
+def test_add_bulk_with_no_valid_items_runs_no_statements():
+    session = FakeSession()
+    service, _ = make_service(session)
+
+    created, errors = asyncio.run(service.add_bulk([{}, {"quoted_price": "x"}]))
+
+    assert created == []
+    assert [error.index for error in errors] == [0, 1]
+    assert session.statements == []
+
+
+def test_add_bulk_wraps_database_errors():
+    session = FakeSession(insert_error=OperationalError("INSERT", {}, Exception()))
+    service, _ = make_service(session)
+
+    with pytest.raises(InternalDatabaseError):
+        asyncio.run(service.add_bulk([item()]))
+
+
+def test_bulk_endpoint_assembles_207_from_real_service():
+    admin = UserAuthPayload(
+        id=str(uuid.uuid4()), email="admin@example.com", user_type="admin"
+    )
+    service, _ = make_service(FakeSession())
+    app.dependency_overrides[order_endpoint.get_current_user] = lambda: admin
+    app.dependency_overrides[get_order_service] = lambda: service
+    token = create_access_token({"sub": admin.email})
+    try:
+        res = client.post(
+            "/api/v1/order/bulk",
+            json=[item(), item(client_id=str(uuid.uuid4())), {"description": "x"}],
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert res.status_code == 207
+    body = res.json()
+    assert len(body["created"]) == 1
+    assert body["created"][0]["client_id"] == str(CLIENT_ID)
+    assert [error["index"] for error in body["errors"]] == [1, 2]
@@ -0,0 +1,177 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.archive import OrderArchive
+from app.models.service import Service
+from app.services import order_service as order_service_module
+from app.services.order_service import OrderService
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_order(**overrides):
+    fields = {
+        "id": uuid.uuid4(),
+        "client_id": uuid.uuid4(),
+        "service_id": uuid.uuid4(),
+        "description": "Hem trousers",
+        "quoted_price": Decimal("20.00"),
+        "actual_price": None,
+        "notes": None,
+        "priority": "normal",
+        "status": "pending",
+        "requested_date": NOW,
+        "estimated_completion": NOW,
+        "actual_completion": None,
+        "version": 1,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def make_service():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name="Hemming",
+        description=None,
+        base_price=15.0,
+        category="alterations",
+        estimated_days=2,
+        image_url=None,
+        is_active=True,
+    )
+
+
+def make_client():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        email="client@example.com",
+        first_name="Ada",
+        last_name="Lovelace",
+        phone=None,
+    )
+
+
+def make_image(order_id, path="orders/a.jpg"):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        order_id=order_id,
+        uploaded_by=uuid.uuid4(),
+        image_type="before",
+        s3_object_path=path,
+        s3_url="https://stale",
+        uploaded_at=NOW,
+    )
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalar(self):
+        return self.rows[0] if self.rows else None
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, results, objects=None):
+        self.results = list(results)
+        self.objects = objects or {}
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.results.pop(0))
+
+    async def get(self, model, key):
+        return self.objects.get((model, key))
+
+
+class FakeStorage:
+    def generate_presigned_download_url(self, path, expiry_minutes):
+        return f"https://signed/{path}"
+
+
+def test_detail_loads_service_and_client_with_the_order(monkeypatch):
+    monkeypatch.setattr(order_service_module, "get_storage_service", FakeStorage)
+    order = make_order()
+    order.service = make_service()
+    order.client = make_client()
+    order.images = [make_image(order.id)]
+    session = FakeSession([[order]])
+
+    detail = asyncio.run(OrderService(session).get_detail(order.id))
+
+    assert len(session.statements) == 1
+    sql = session.statements[0]
+    assert "LEFT OUTER JOIN services" in sql
+    assert "LEFT OUTER JOIN users" in sql
+    assert "hashed_password" not in sql
+    assert detail.service.name == "Hemming"
+    assert detail.client.email == "client@example.com"
+    assert detail.images[0].s3_url == "https://signed/orders/a.jpg"
+    # The signed URL is never written to the ORM image
+    assert order.images[0].s3_url == "https://stale"
+
+
+def test_detail_falls_back_to_archive(monkeypatch):
+    monkeypatch.setattr(order_service_module, "get_storage_service", FakeStorage)
+    archived = make_order(status="completed")
+    service = make_service()
+    image = vars(make_image(archived.id, "orders/b.jpg"))
+    session = FakeSession(
+        [[], [], [image]],
+        {
+            (OrderArchive, archived.id): archived,
+            (Service, archived.service_id): service,
+        },
+    )
+
+    detail = asyncio.run(OrderService(session).get_detail(archived.id))
+
+    assert detail.status == "completed"
+    assert detail.service.id == service.id
+    assert detail.client is None
+    assert detail.images[0].s3_url == "https://signed/orders/b.jpg"
+
+
+def test_detail_of_unknown_order_is_none():
+    session = FakeSession([[]])
+
+    assert asyncio.run(OrderService(session).get_detail(uuid.uuid4())) is None
+
+
+def test_client_summary_selects_only_its_columns():
+    assert [column.key for column in order_service_module.CLIENT_SUMMARY_COLUMNS] == [
+        "id",
+        "email",
+        "first_name",
+        "last_name",
+        "phone",
+    ]
+
+
+def test_signing_failure_keeps_current_url_and_logs(monkeypatch, caplog):
+    class BrokenStorage:
+        def generate_presigned_download_url(self, path, expiry_minutes):
+            raise RuntimeError("no credentials")
+
+    monkeypatch.setattr(order_service_module, "get_storage_service", BrokenStorage)
+
+    with caplog.at_level("WARNING", logger=order_service_module.__name__):
+        url = order_service_module.fresh_download_url("orders/a.jpg", "https://old")
+
+    assert url == "https://old"
+    assert "orders/a.jpg" in caplog.text
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime, timezone
+from decimal import Decimal
 from types import SimpleNamespace
 
 import pytest
@@ -9,6 +10,7 @@ from app.api.v1.endpoints import order as order_endpoint
 from app.core.security import create_access_token
 from app.main import app
 from app.schemas.order import OrderCreate
+from app.schemas.order_image import OrderImageResponse
 from app.services import order_service
 
 client = TestClient(app)
@@ -90,6 +92,25 @@ def test_get_order_not_found_returns_404(monkeypatch, auth_headers_admin):
     assert res.status_code == 404
 
 
+def test_get_order_detail_returns_404_for_unknown_order(
+    monkeypatch, auth_headers_admin
+):
+    async def fake_get_detail(_self, oid):
+        return None
+
+    monkeypatch.setattr(order_service.OrderService, "get_detail", fake_get_detail)
+
+    order_id = uuid.uuid4()
+    res = client.get(f"/api/v1/order/{order_id}/detail", headers=auth_headers_admin)
+    assert res.status_code == 404
+
+
+def test_get_order_detail_requires_admin(auth_headers_client):
+    order_id = uuid.uuid4()
+    res = client.get(f"/api/v1/order/{order_id}/detail", headers=auth_headers_client)
+    assert res.status_code in (401, 403)
+
+
 def test_list_order_requires_admin(monkeypatch, auth_headers_client):
     # Hitting admin-protected route with client user should return 403
     res = client.get("/api/v1/order/", headers=auth_headers_client)
@@ -189,3 +210,388 @@ def test_get_order_images_populates_fresh_urls(monkeypatch, auth_headers_client)
     data = res.json()
     assert len(data) == 2
     assert data[0]["s3_url"].startswith("https://s3.local/orders/")
+
+
+def test_create_orders_bulk_reports_item_errors(monkeypatch, auth_headers_admin):
+    created_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+
+    async def fake_add_bulk(_self, payloads):
+        assert len(payloads) == 2
+        created = SimpleNamespace(
+            id=created_id,
+            client_id=uuid.uuid4(),
+            service_id=uuid.uuid4(),
+            description="Hem trousers",
+            quoted_price=25,
+            actual_price=None,
+            notes=None,
+            priority="normal",
+            status="pending",
+            requested_date=now,
+            estimated_completion=now,
+            actual_completion=None,
+            version=1,
+            created_at=now,
+            updated_at=now,
+        )
+        errors = [
+            order_service.OrderBulkItemError(
+                index=1, errors=["quoted_price: Field required"]
+            )
+        ]
+        return [created], errors
+
+    monkeypatch.setattr(order_service.OrderService, "add_bulk", fake_add_bulk)
+
+    payload = [
+        {
+            "client_id": str(uuid.uuid4()),
+            "service_id": str(uuid.uuid4()),
+            "description": "Hem trousers",
+            "quoted_price": "25.00",
+        },
+        {"client_id": str(uuid.uuid4())},
+    ]
+
+    res = client.post("/api/v1/order/bulk", json=payload, headers=auth_headers_admin)
+
+    assert res.status_code == 207
+    data = res.json()
+    assert uuid.UUID(data["created"][0]["id"]) == created_id
+    assert data["errors"] == [
+        {"index": 1, "errors": ["quoted_price: Field required"]}
+    ]
+
+
+def test_create_orders_bulk_rejects_oversized_batch(monkeypatch, auth_headers_admin):
+    monkeypatch.setattr(order_endpoint.settings, "BULK_ORDER_MAX_ITEMS", 1)
+
+    res = client.post(
+        "/api/v1/order/bulk", json=[{}, {}], headers=auth_headers_admin
+    )
+    assert res.status_code == 413
+
+
+def test_allowed_source_statuses_follow_state_machine():
+    assert order_service.allowed_source_statuses("in_progress") == [
+        "pending",
+        "ready",
+    ]
+    assert order_service.allowed_source_statuses("completed") == ["ready"]
+    assert order_service.allowed_source_statuses("pending") == []
+
+
+def test_transition_status_stale_version_returns_409(monkeypatch, auth_headers_admin):
+    async def fake_transition(_self, order_id, payload):
+        raise order_service.OrderVersionConflictError("stale")
+
+    monkeypatch.setattr(
+        order_service.OrderService, "transition_status", fake_transition
+    )
+
+    res = client.patch(
+        f"/api/v1/order/{uuid.uuid4()}/status",
+        json={"status": "in_progress", "version": 1},
+        headers=auth_headers_admin,
+    )
+    assert res.status_code == 409
+
+
+def test_transition_status_rejects_unknown_status(auth_headers_admin):
+    res = client.patch(
+        f"/api/v1/order/{uuid.uuid4()}/status",
+        json={"status": "shipped", "version": 1},
+        headers=auth_headers_admin,
+    )
+    assert res.status_code == 422
+
+
+def test_list_order_passes_filters(monkeypatch, auth_headers_admin):
+    captured = {}
+
+    async def fake_get(_self, filters=None):
+        captured["filters"] = filters
+        return []
+
+    async def fake_etag_list(_self, filters=None):
+        return '"v1"'
+
+    monkeypatch.setattr(order_service.OrderService, "get", fake_get)
+    monkeypatch.setattr(order_service.OrderService, "etag_list", fake_etag_list)
+
+    res = client.get(
+        "/api/v1/order/?status=pending&status=in_progress&priority=urgent"
+        "&requested_from=2026-01-01T00:00:00Z",
+        headers=auth_headers_admin,
+    )
+
+    assert res.status_code == 200
+    filters = captured["filters"]
+    assert filters.status == ["pending", "in_progress"]
+    assert filters.priority == ["urgent"]
+    assert filters.requested_from == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_list_order_answers_304_before_loading_orders(
+    monkeypatch, auth_headers_admin
+):
+    tagged = []
+    loads = []
+
+    async def fake_etag_list(_self, filters=None):
+        tagged.append(filters)
+        return '"v1"'
+
+    async def fake_get(_self, filters=None):
+        loads.append(filters)
+        return []
+
+    monkeypatch.setattr(order_service.OrderService, "etag_list", fake_etag_list)
+    monkeypatch.setattr(order_service.OrderService, "get", fake_get)
+
+    first = client.get("/api/v1/order/?status=pending", headers=auth_headers_admin)
+    second = client.get(
+        "/api/v1/order/?status=pending",
+        headers={**auth_headers_admin, "If-None-Match": '"v1"'},
+    )
+
+    assert first.status_code == 200
+    assert first.headers["ETag"] == '"v1"'
+    assert second.status_code == 304
+    assert len(loads) == 1
+    assert tagged[1].status == ["pending"]
+
+
+def test_list_order_rejects_unknown_status(auth_headers_admin):
+    res = client.get("/api/v1/order/?status=shipped", headers=auth_headers_admin)
+    assert res.status_code == 422
+
+
+def test_admin_upload_rejects_archived_order(monkeypatch, auth_headers_admin):
+    order_id = uuid.uuid4()
+
+    async def fake_get_id(_self, oid):
+        return SimpleNamespace(
+            id=order_id,
+            client_id=uuid.uuid4(),
+            archived_at=datetime.now(timezone.utc),
+        )
+
+    monkeypatch.setattr(order_service.OrderService, "getId", fake_get_id)
+
+    res = client.post(
+        f"/api/v1/order/{order_id}/admin-upload-image",
+        files={"file": ("shirt.jpg", b"jpeg-bytes", "image/jpeg")},
+        data={"image_type": "after"},
+        headers=auth_headers_admin,
+    )
+    assert res.status_code == 409
+
+
+def test_upload_rejects_bad_image_type_before_loading_order(
+    monkeypatch, auth_headers_client
+):
+    async def fake_get_id(_self, oid):
+        raise AssertionError("order must not be loaded")
+
+    monkeypatch.setattr(order_service.OrderService, "getId", fake_get_id)
+
+    res = client.post(
+        f"/api/v1/order/{uuid.uuid4()}/upload-image",
+        files={"file": ("shirt.jpg", b"jpeg-bytes", "image/jpeg")},
+        data={"image_type": "selfie"},
+        headers=auth_headers_client,
+    )
+    assert res.status_code == 400
+
+
+def test_list_order_me_answers_304_without_loading_orders(monkeypatch):
+    app.dependency_overrides[order_endpoint.get_current_user] = lambda: FakeUser(
+        str(uuid.uuid4()), "client@example.com"
+    )
+    loads = []
+
+    async def fake_etag_me(_self, client_id):
+        return '"v1"'
+
+    async def fake_get_me(_self, client_id):
+        loads.append(client_id)
+        return []
+
+    monkeypatch.setattr(order_service.OrderService, "etag_me", fake_etag_me)
+    monkeypatch.setattr(order_service.OrderService, "getMe", fake_get_me)
+
+    try:
+        first = client.get("/api/v1/order/me")
+        second = client.get("/api/v1/order/me", headers={"If-None-Match": '"v1"'})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert first.headers["ETag"] == '"v1"'
+    assert second.status_code == 304
+    assert second.content == b""
+    assert len(loads) == 1
+
+
+def test_update_archived_order_returns_409(monkeypatch, auth_headers_admin):
+    order_id = uuid.uuid4()
+
+    async def fake_update(_self, oid, payload, if_match=None):
+        raise order_service.OrderArchivedError()
+
+    monkeypatch.setattr(order_service.OrderService, "update", fake_update)
+
+    res = client.put(
+        f"/api/v1/order/{order_id}",
+        json={
+            "description": "Hem trousers",
+            "quoted_price": "20.00",
+            "client_id": str(uuid.uuid4()),
+            "service_id": str(uuid.uuid4()),
+        },
+        headers=auth_headers_admin,
+    )
+    assert res.status_code == 409
+
+
+def test_update_with_stale_if_match_returns_412(monkeypatch, auth_headers_admin):
+    order_id = uuid.uuid4()
+    current = SimpleNamespace(id=order_id, version=2)
+
+    async def fake_get_id(_self, oid):
+        return current
+
+    monkeypatch.setattr(order_service.OrderService, "getId", fake_get_id)
+    stale = order_service.order_etag(SimpleNamespace(id=order_id, version=1))
+
+    res = client.put(
+        f"/api/v1/order/{order_id}",
+        json={
+            "description": "Hem trousers",
+            "quoted_price": "20.00",
+            "client_id": str(uuid.uuid4()),
+            "service_id": str(uuid.uuid4()),
+        },
+        headers={**auth_headers_admin, "If-Match": stale},
+    )
+    assert res.status_code == 412
+
+
+def test_etag_of_compressed_get_satisfies_if_match_on_put(
+    monkeypatch, auth_headers_admin
+):
+    now = datetime.now(timezone.utc)
+    current = SimpleNamespace(
+        id=uuid.uuid4(),
+        client_id=uuid.uuid4(),
+        service_id=uuid.uuid4(),
+        # Large enough to be compressed
+        description="Hem trousers " * 200,
+        quoted_price=Decimal("20.00"),
+        actual_price=None,
+        notes=None,
+        priority="normal",
+        status="pending",
+        requested_date=now,
+        estimated_completion=now,
+        actual_completion=None,
+        version=3,
+        created_at=now,
+        updated_at=now,
+    )
+
+    async def fake_get_id(_self, oid):
+        return current
+
+    async def fake_update(_self, oid, payload, if_match=None):
+        if not order_service.if_match_satisfied(
+            if_match, order_service.order_etag(current)
+        ):
+            raise order_service.OrderPreconditionFailedError()
+        return current
+
+    monkeypatch.setattr(order_service.OrderService, "getId", fake_get_id)
+    monkeypatch.setattr(order_service.OrderService, "update", fake_update)
+
+    got = client.get(
+        f"/api/v1/order/{current.id}",
+        headers={**auth_headers_admin, "Accept-Encoding": "gzip"},
+    )
+    assert got.headers["Content-Encoding"] == "gzip"
+
+    res = client.put(
+        f"/api/v1/order/{current.id}",
+        json={
+            "description": "Hem trousers",
+            "quoted_price": "20.00",
+            "client_id": str(current.client_id),
+            "service_id": str(current.service_id),
+        },
+        headers={**auth_headers_admin, "If-Match": got.headers["ETag"]},
+    )
+    assert res.status_code == 200
+
+
+def test_export_streams_requested_columns_as_csv(monkeypatch, auth_headers_admin):
+    captured = {}
+    order_id = uuid.uuid4()
+
+    async def fake_partitions(stmt):
+        captured["sql"] = str(stmt)
+        yield [(order_id, "pending", Decimal("25.50"))]
+        yield [(order_id, "ready", None)]
+
+    monkeypatch.setattr(order_endpoint, "stream_partitions", fake_partitions)
+
+    res = client.get(
+        "/api/v1/order/export?columns=id&columns=status&columns=actual_price"
+        "&status=pending&status=ready",
+        headers=auth_headers_admin,
+    )
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    assert res.text.splitlines() == [
+        "id,status,actual_price",
+        f"{order_id},pending,25.50",
+        f"{order_id},ready,",
+    ]
+    assert "orders.description" not in captured["sql"]
+
+
+def test_export_ndjson(monkeypatch, auth_headers_admin):
+    async def fake_partitions(stmt):
+        yield [("pending", Decimal("10.00"))]
+
+    monkeypatch.setattr(order_endpoint, "stream_partitions", fake_partitions)
+
+    res = client.get(
+        "/api/v1/order/export?format=ndjson&columns=status&columns=quoted_price",
+        headers=auth_headers_admin,
+    )
+
+    assert res.status_code == 200
+    assert res.text == '{"status":"pending","quoted_price":"10.00"}\n'
+
+
+def test_export_rejects_unknown_column(auth_headers_admin):
+    res = client.get(
+        "/api/v1/order/export?columns=password", headers=auth_headers_admin
+    )
+    assert res.status_code == 422
+
+
+def test_order_image_response_reads_orm_attributes():
+    image = SimpleNamespace(
+        id=uuid.uuid4(),
+        order_id=uuid.uuid4(),
+        uploaded_by=uuid.uuid4(),
+        image_type="before",
+        s3_object_path="orders/a.jpg",
+        s3_url="https://bucket.example.com/orders/a.jpg",
+        uploaded_at=datetime.now(timezone.utc),
+    )
+
+    assert OrderImageResponse.model_validate(image).s3_object_path == "orders/a.jpg"
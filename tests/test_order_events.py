@@ -0,0 +1,114 @@
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+
+from app.api.v1.endpoints.order import stream_order_events_me
+from app.schemas.user import UserAuthPayload
+from app.services.order_events import (
+    OrderEventBroker,
+    get_order_event_broker,
+    live_event,
+)
+
+CLIENT_ID = uuid.uuid4()
+ORDER_ID = uuid.uuid4()
+
+
+def notification(client_id=CLIENT_ID, order_id=ORDER_ID, **extra):
+    return json.dumps(
+        {
+            "id": 1,
+            "type": "order.status_changed",
+            "order_id": str(order_id),
+            "client_id": str(client_id),
+            **extra,
+        }
+    )
+
+
+def test_events_reach_only_the_owning_client():
+    broker = OrderEventBroker(queue_size=10)
+    mine = broker.subscribe(CLIENT_ID)
+    theirs = broker.subscribe(uuid.uuid4())
+
+    broker.on_notification(notification(status="ready"))
+
+    assert mine.queue.get_nowait()["status"] == "ready"
+    assert theirs.queue.empty()
+
+
+def test_order_filter_and_unsubscribe():
+    broker = OrderEventBroker(queue_size=10)
+    watching = broker.subscribe(CLIENT_ID, {uuid.uuid4()})
+
+    broker.on_notification(notification())
+    assert watching.queue.empty()
+
+    broker.unsubscribe(watching)
+    assert broker._subscriptions == {}
+
+
+def test_slow_subscriber_drops_oldest_event():
+    broker = OrderEventBroker(queue_size=2)
+    subscription = broker.subscribe(CLIENT_ID)
+
+    for version in (1, 2, 3):
+        broker.on_notification(notification(version=version))
+
+    versions = [subscription.queue.get_nowait()["version"] for _ in range(2)]
+    assert versions == [2, 3]
+
+
+def test_malformed_and_reconnect_notifications_are_ignored():
+    broker = OrderEventBroker(queue_size=10)
+    subscription = broker.subscribe(CLIENT_ID)
+
+    broker.on_notification("")
+    broker.on_notification("not json")
+
+    assert subscription.queue.empty()
+
+
+def test_live_event_keeps_image_fields_for_image_events():
+    event = SimpleNamespace(
+        id=7,
+        event_type="order.image_added",
+        aggregate_id=ORDER_ID,
+        payload={
+            "id": "img-1",
+            "client_id": str(CLIENT_ID),
+            "image_type": "after",
+            "s3_object_path": "orders/img-1.jpg",
+        },
+    )
+
+    assert live_event(event) == {
+        "id": 7,
+        "type": "order.image_added",
+        "order_id": str(ORDER_ID),
+        "client_id": str(CLIENT_ID),
+        "image_id": "img-1",
+        "image_type": "after",
+    }
+
+
+def test_sse_stream_formats_events_and_unsubscribes_on_close():
+    broker = get_order_event_broker()
+    user = UserAuthPayload(id=str(CLIENT_ID), email="c@example.com", user_type="client")
+
+    async def run():
+        response = await stream_order_events_me(None, user)
+        stream = response.body_iterator
+        chunks = [await stream.__anext__()]
+        broker.publish(CLIENT_ID, ORDER_ID, {"id": 3, "type": "order.updated"})
+        chunks.append(await stream.__anext__())
+        await stream.aclose()
+        return response, chunks
+
+    response, chunks = asyncio.run(run())
+
+    assert response.media_type == "text/event-stream"
+    assert chunks[0] == "retry: 5000\n\n"
+    assert chunks[1].startswith("id: 3\nevent: order.updated\ndata: ")
+    assert CLIENT_ID not in broker._subscriptions
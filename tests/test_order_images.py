@@ -0,0 +1,64 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import order_service as order_service_module
+from app.services.order_service import OrderService
+
+
+class FakeSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def delete(self, obj):
+        self.calls.append("delete row")
+
+    async def flush(self):
+        self.calls.append("flush")
+
+    def in_transaction(self):
+        return True
+
+    async def commit(self):
+        self.calls.append("commit")
+
+
+def make_service(monkeypatch, calls, storage_error=None):
+    class FakeStorage:
+        def delete_file(self, path):
+            calls.append("delete object")
+            if storage_error is not None:
+                raise storage_error
+
+    monkeypatch.setattr(order_service_module, "get_storage_service", FakeStorage)
+    service = OrderService(FakeSession(calls))
+    image = SimpleNamespace(id=uuid.uuid4(), s3_object_path="orders/a.jpg")
+
+    async def get_image(image_id):
+        return image
+
+    async def record_event(event_type, image):
+        calls.append(event_type)
+
+    service.getImageImageId = get_image
+    service._record_image_event = record_event
+    return service
+
+
+@pytest.mark.parametrize("storage_error", [None, RuntimeError("bucket gone")])
+def test_image_row_is_deleted_and_committed_before_the_object(
+    monkeypatch, storage_error
+):
+    calls = []
+    service = make_service(monkeypatch, calls, storage_error)
+
+    assert asyncio.run(service.delete_order_image(str(uuid.uuid4()))) is True
+    assert calls == [
+        "order.image_deleted",
+        "delete row",
+        "flush",
+        "commit",
+        "delete object",
+    ]
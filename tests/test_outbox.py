@@ -0,0 +1,184 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.outbox_service import OutboxDispatcher, OutboxService
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.added = []
+        self.statements = []
+        self.commits = 0
+        self.rolled_back_savepoints = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def add_all(self, objects):
+        self.added.extend(objects)
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.rows)
+
+    async def commit(self):
+        self.commits += 1
+
+    def begin_nested(self):
+        session = self
+
+        class Savepoint:
+            async def __aenter__(self):
+                return session
+
+            async def __aexit__(self, exc_type, *exc):
+                if exc_type is not None:
+                    session.rolled_back_savepoints += 1
+                return False
+
+        return Savepoint()
+
+
+def pending_event(id=1, attempts=0):
+    return SimpleNamespace(
+        id=id,
+        aggregate_id=uuid.uuid4(),
+        event_type="order.created",
+        attempts=attempts,
+        last_error=None,
+        dispatched_at=None,
+        next_attempt_at=None,
+        failed_at=None,
+    )
+
+
+def make_dispatcher(session):
+    return OutboxDispatcher(
+        session_factory=lambda: session,
+        batch_size=10,
+        sweep_seconds=30,
+        retention_hours=72,
+        max_attempts=3,
+        retry_seconds=30,
+        retry_max_seconds=3600,
+    )
+
+
+def test_enqueue_many_adds_events_and_notifies_once():
+    session = FakeSession()
+    order_ids = [uuid.uuid4(), uuid.uuid4()]
+
+    asyncio.run(
+        OutboxService(session).enqueue_many(
+            "order.created", ((order_id, {}) for order_id in order_ids)
+        )
+    )
+
+    assert [event.aggregate_id for event in session.added] == order_ids
+    assert len(session.statements) == 1
+    assert "pg_notify" in session.statements[0]
+
+
+def test_dispatch_marks_batch_delivered_after_handlers():
+    event = pending_event()
+    session = FakeSession([event])
+    dispatcher = make_dispatcher(session)
+    seen = []
+
+    async def handler(_session, events):
+        seen.extend(events)
+
+    dispatcher.subscribe(handler)
+    claimed = asyncio.run(dispatcher.dispatch_batch())
+
+    assert claimed == 1
+    assert seen == [event]
+    assert event.dispatched_at is not None
+    assert "SKIP LOCKED" in session.statements[0]
+
+
+def test_dispatch_claims_only_due_live_events():
+    session = FakeSession()
+
+    asyncio.run(make_dispatcher(session).dispatch_batch())
+
+    sql = session.statements[0]
+    assert "outbox_events.failed_at IS NULL" in sql
+    assert "outbox_events.next_attempt_at <= now()" in sql
+
+
+def test_failed_event_is_retried_later_with_backoff():
+    event = pending_event(attempts=1)
+    session = FakeSession([event])
+    dispatcher = make_dispatcher(session)
+
+    async def handler(_session, events):
+        raise RuntimeError("consumer down")
+
+    dispatcher.subscribe(handler)
+    before = datetime.now(timezone.utc)
+    assert asyncio.run(dispatcher.dispatch_batch()) == 1
+
+    assert event.dispatched_at is None
+    assert event.failed_at is None
+    assert event.attempts == 2
+    assert event.last_error == "consumer down"
+    assert event.next_attempt_at - before >= timedelta(seconds=60)
+    assert session.rolled_back_savepoints == 1
+    assert session.commits == 1
+
+
+def test_poison_event_does_not_hold_back_its_batch():
+    poison, good = pending_event(id=1), pending_event(id=2)
+    session = FakeSession([poison, good])
+    dispatcher = make_dispatcher(session)
+    delivered = []
+
+    async def handler(_session, events):
+        if poison in events:
+            raise RuntimeError("cannot serialize")
+        delivered.extend(events)
+
+    dispatcher.subscribe(handler)
+    asyncio.run(dispatcher.dispatch_batch())
+
+    assert delivered == [good]
+    assert good.dispatched_at is not None
+    assert poison.dispatched_at is None
+    assert poison.attempts == 1
+    assert poison.next_attempt_at is not None
+
+
+def test_event_is_marked_failed_after_max_attempts():
+    event = pending_event(attempts=2)
+    session = FakeSession([event])
+    dispatcher = make_dispatcher(session)
+
+    async def handler(_session, events):
+        raise RuntimeError("consumer down")
+
+    dispatcher.subscribe(handler)
+    asyncio.run(dispatcher.dispatch_batch())
+
+    assert event.attempts == 3
+    assert event.failed_at is not None
+    assert event.dispatched_at is None
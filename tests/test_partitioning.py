@@ -0,0 +1,153 @@
+import asyncio
+from datetime import date
+
+from app.db import partitioning
+from app.db.partitioning import (
+    add_months,
+    create_partition_sql,
+    detach_partition_sql,
+    detach_partitions,
+    ensure_partitions,
+    months_between,
+    partition_month,
+    partition_name,
+)
+from app.models.order_image import OrderImage
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeConnection:
+    """Partitions per table; ``rows`` names the partitions holding rows."""
+
+    def __init__(self, partitions, rows=()):
+        self.partitions = partitions
+        self.rows = set(rows)
+        self.ddl = []
+
+    async def execute(self, stmt, params=None):
+        if params is not None:
+            return FakeResult(self.partitions[params["table"]])
+        self.ddl.append(str(stmt))
+        return FakeResult([])
+
+    async def scalar(self, stmt):
+        return str(stmt).split("FROM ")[1].rstrip(")") in self.rows
+
+
+def test_add_months_crosses_year_boundaries():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_months_between_is_inclusive():
+    assert months_between(date(2026, 11, 15), date(2027, 1, 1)) == [
+        date(2026, 11, 1),
+        date(2026, 12, 1),
+        date(2027, 1, 1),
+    ]
+
+
+def test_partition_name_round_trips():
+    name = partition_name("order_images", date(2026, 3, 1))
+    assert name == "order_images_p2026_03"
+    assert partition_month(name) == date(2026, 3, 1)
+    assert partition_month("order_images_default") is None
+
+
+def test_create_partition_sql_covers_one_utc_month():
+    sql = create_partition_sql("orders", date(2026, 12, 9))
+    assert sql == (
+        "CREATE TABLE IF NOT EXISTS orders_p2026_12 PARTITION OF orders "
+        "FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+    )
+
+
+def test_detach_partition_sql():
+    assert detach_partition_sql("orders", date(2023, 5, 1)) == (
+        "ALTER TABLE orders DETACH PARTITION orders_p2023_05"
+    )
+
+
+def test_detach_moves_empty_months_of_every_table_together():
+    conn = FakeConnection(
+        {
+            "orders": ["orders_default", "orders_p2020_01", "orders_p2020_02"],
+            "order_images": ["order_images_p2020_01", "order_images_p2020_02"],
+        },
+        rows=["order_images_p2020_02"],
+    )
+
+    detached = asyncio.run(detach_partitions(conn, retain_months=1))
+
+    assert detached == ["orders_p2020_01", "order_images_p2020_01"]
+    assert conn.ddl == [
+        "ALTER TABLE orders DETACH PARTITION orders_p2020_01",
+        "ALTER TABLE order_images DETACH PARTITION order_images_p2020_01",
+    ]
+
+
+def test_image_order_foreign_key_is_left_to_migrations():
+    (fk,) = OrderImage.__table__.c.order_id.foreign_keys
+
+    assert fk.constraint.name == "order_images_order_id_fkey"
+    assert fk.info == {"autogenerate": False}
+
+
+class EnsureConnection:
+    """orders has a default partition holding rows of ``default_months``."""
+
+    def __init__(self, default_months):
+        self.default_months = default_months
+        self.ddl = []
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt)
+        if "pg_inherits" in sql:
+            return FakeResult(["orders_default"] if params["table"] == "orders" else [])
+        if "information_schema" in sql:
+            return FakeResult(["id", "created_at"])
+        self.ddl.append(sql)
+        return FakeResult([])
+
+    async def scalar(self, stmt):
+        return any(
+            f">= '{month.isoformat()} " in str(stmt) for month in self.default_months
+        )
+
+
+def test_ensure_moves_stranded_rows_out_of_the_default_partition(monkeypatch):
+    monkeypatch.setattr(partitioning, "_this_month", lambda: date(2026, 10, 1))
+    conn = EnsureConnection(default_months=[date(2026, 10, 1)])
+
+    created = asyncio.run(ensure_partitions(conn, months_ahead=1))
+
+    assert created == [
+        "orders_p2026_10",
+        "orders_p2026_11",
+        "order_images_p2026_10",
+        "order_images_p2026_11",
+    ]
+    where = (
+        "created_at >= '2026-10-01 00:00:00+00' "
+        "AND created_at < '2026-11-01 00:00:00+00'"
+    )
+    assert conn.ddl[1:7] == [
+        "ALTER TABLE orders DETACH PARTITION orders_default",
+        create_partition_sql("orders", date(2026, 10, 1)),
+        "INSERT INTO orders_p2026_10 (id, created_at) "
+        f"SELECT id, created_at FROM orders_default WHERE {where}",
+        f"DELETE FROM orders_default WHERE {where}",
+        "ALTER TABLE orders ATTACH PARTITION orders_default DEFAULT",
+        create_partition_sql("orders", date(2026, 11, 1)),
+    ]
+    assert "pg_advisory_xact_lock" in conn.ddl[0]
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import security
+from app.core.exceptions import PasswordHashingBusyError
+from app.core.password_pool import PasswordPool
+from app.main import app
+from app.services import user_service
+
+client = TestClient(app)
+
+
+def test_operations_run_off_the_event_loop():
+    pool = PasswordPool(workers=2, max_queue=4, queue_timeout=1)
+
+    async def run():
+        loop_thread = threading.get_ident()
+        worker_thread = await pool.run(threading.get_ident)
+        return loop_thread, worker_thread
+
+    loop_thread, worker_thread = asyncio.run(run())
+    assert loop_thread != worker_thread
+    assert pool.stats()["completed"] == 1
+
+
+def test_concurrency_is_bounded_and_overflow_is_rejected():
+    pool = PasswordPool(workers=1, max_queue=1, queue_timeout=5)
+
+    async def run():
+        results = await asyncio.gather(
+            pool.run(time.sleep, 0.05),
+            pool.run(time.sleep, 0.05),
+            pool.run(time.sleep, 0.05),
+            return_exceptions=True,
+        )
+        return results
+
+    results = asyncio.run(run())
+    # One runs, one waits, the third finds the queue full
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], PasswordHashingBusyError)
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["running"] == pool.stats()["waiting"] == 0
+
+
+def test_waiting_too_long_is_rejected():
+    pool = PasswordPool(workers=1, max_queue=10, queue_timeout=0.01)
+
+    async def run():
+        return await asyncio.gather(
+            pool.run(time.sleep, 0.2),
+            pool.run(time.sleep, 0),
+            return_exceptions=True,
+        )
+
+    first, second = asyncio.run(run())
+    assert first is None
+    assert isinstance(second, PasswordHashingBusyError)
+
+
+def test_bulk_hashing_runs_on_the_pool_and_leaves_it_room(monkeypatch):
+    pool = PasswordPool(workers=4, max_queue=0, queue_timeout=1)
+    peak = []
+
+    def hash_many(passwords):
+        peak.append(pool.running)
+        return [f"hashed:{password}" for password in passwords]
+
+    monkeypatch.setattr(security, "get_password_pool", lambda: pool)
+    monkeypatch.setattr(security, "_hash_many", hash_many)
+    passwords = [str(n) for n in range(20)]
+
+    hashed = asyncio.run(security.hash_passwords(passwords, chunk_size=3))
+
+    assert hashed == [f"hashed:{password}" for password in passwords]
+    assert pool.stats()["completed"] == 7
+    assert max(peak) <= 2
+
+
+@pytest.mark.parametrize("path", ["/api/v1/user/login"])
+def test_login_answers_503_when_pool_is_saturated(monkeypatch, path):
+    async def busy(_self, email, password):
+        raise PasswordHashingBusyError()
+
+    monkeypatch.setattr(user_service.UserService, "authenticate_user", busy)
+
+    res = client.post(path, json={"email": "a@example.com", "password": "secret123"})
+
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
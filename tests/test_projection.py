@@ -0,0 +1,138 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.dialects import postgresql
+
+from app.db.projection import response_columns
+from app.models.user import User
+from app.schemas.order import OrderFilter
+from app.schemas.order_image import OrderImageResponse
+from app.schemas.user import UserResponse
+from app.services import order_service as order_service_module
+from app.services.order_service import OrderService
+from app.services.user_service import UserService
+
+
+class FakeMappings:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return FakeMappings(self.rows)
+
+    def one(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.results.pop(0))
+
+
+def make_image_row(**overrides):
+    fields = {
+        "image_type": "before",
+        "id": uuid.uuid4(),
+        "order_id": uuid.uuid4(),
+        "uploaded_by": uuid.uuid4(),
+        "s3_object_path": "orders/a.jpg",
+        "s3_url": "https://stale",
+        "uploaded_at": datetime.now(timezone.utc),
+    }
+    fields.update(overrides)
+    return fields
+
+
+def test_response_columns_follow_schema_fields():
+    columns = response_columns(User, UserResponse)
+
+    assert [column.key for column in columns] == list(UserResponse.model_fields)
+    assert "hashed_password" not in [column.key for column in columns]
+
+
+def test_response_columns_rejects_unmapped_fields():
+    class WithExtra(BaseModel):
+        email: str
+        display_name: str
+
+    with pytest.raises(ValueError, match="display_name"):
+        response_columns(User, WithExtra)
+
+
+def test_user_listing_never_selects_password_hash():
+    session = FakeSession([{"email": "a@example.com"}])
+
+    users = asyncio.run(UserService(session).getAll())
+
+    assert users == [{"email": "a@example.com"}]
+    assert "hashed_password" not in session.statements[0]
+    assert "users.email" in session.statements[0]
+
+
+def test_order_images_fall_back_to_archive_as_rows():
+    row = make_image_row()
+    session = FakeSession([], [row])
+
+    images = asyncio.run(OrderService(session).getOrderImages(row["order_id"]))
+
+    assert images == [row]
+    assert "FROM order_images_archive" in session.statements[1]
+    assert OrderImageResponse.model_validate(images[0]).id == row["id"]
+
+
+def test_order_history_includes_archived_orders():
+    session = FakeSession([])
+
+    asyncio.run(OrderService(session).getMe(uuid.uuid4()))
+
+    sql = session.statements[0]
+    assert "UNION ALL" in sql
+    assert "FROM orders_archive" in sql
+    assert sql.endswith("ORDER BY anon_1.requested_date, anon_1.id")
+
+
+def test_order_list_etag_digests_filtered_rows_with_their_names():
+    session = FakeSession((2, "abc"), (2, "abc"), (2, "def"))
+    service = OrderService(session)
+
+    pending = asyncio.run(service.etag_list(OrderFilter(status=["pending"])))
+    again = asyncio.run(service.etag_list(OrderFilter(status=["pending"])))
+    changed = asyncio.run(service.etag_list(OrderFilter(status=["pending"])))
+
+    assert pending == again != changed
+    sql = session.statements[0]
+    assert "md5(string_agg(" in sql
+    assert "users.first_name" in sql and "services.name" in sql
+    assert "WHERE orders.status IN" in sql
+
+
+def test_regenerated_urls_are_written_to_rows_only(monkeypatch):
+    class FakeStorage:
+        def generate_presigned_download_url(self, path, expiry_minutes):
+            return f"https://signed/{path}"
+
+    monkeypatch.setattr(order_service_module, "get_storage_service", FakeStorage)
+    rows = [make_image_row(), make_image_row(s3_object_path="orders/b.jpg")]
+
+    images = asyncio.run(OrderService(FakeSession()).regenerate_download_urls(rows))
+
+    assert [image["s3_url"] for image in images] == [
+        "https://signed/orders/a.jpg",
+        "https://signed/orders/b.jpg",
+    ]
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import create_engine, text
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.middleware import QueryStatsMiddleware
+from app.db import query_stats
+from app.db.query_stats import (
+    QueryBudgetExceeded,
+    current_stats,
+    query_budget,
+    statement_shape,
+    track_queries,
+)
+
+
+@pytest.fixture()
+def engine():
+    engine = create_engine("sqlite://")
+    query_stats.install(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_statement_shape_ignores_arguments_and_in_list_length():
+    one = "SELECT * FROM orders WHERE id = $1::UUID AND status IN ($2::VARCHAR)"
+    many = (
+        "SELECT * FROM orders WHERE id = $9::UUID "
+        "AND status IN ($10::VARCHAR, $11::VARCHAR)"
+    )
+    assert statement_shape(one) == statement_shape(many)
+
+
+def test_repeated_shapes_are_flagged(engine):
+    with track_queries() as stats, engine.connect() as conn:
+        for order_id in range(4):
+            conn.execute(text("SELECT :id"), {"id": order_id})
+        conn.execute(text("SELECT 1 + 1"))
+
+    assert stats.count == 5
+    assert stats.repeated(3) == [("SELECT ?", 4)]
+    assert current_stats() is None
+
+
+def test_query_budget_fails_when_exceeded(engine):
+    with pytest.raises(QueryBudgetExceeded, match="3 queries, budget is 2"):
+        with query_budget(2), engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+
+
+def test_middleware_reports_stats_in_headers():
+    def endpoint(request):
+        stats = current_stats()
+        for _ in range(3):
+            stats.record("SELECT * FROM order_images WHERE order_id = $1", 0.002)
+        return PlainTextResponse("ok")
+
+    app = QueryStatsMiddleware(
+        Starlette(routes=[Route("/", endpoint)]), repeat_threshold=3
+    )
+
+    res = TestClient(app).get("/")
+
+    assert res.headers["X-DB-Query-Count"] == "3"
+    assert res.headers["X-DB-Repeated-Query"] == "1"
+    assert float(res.headers["X-DB-Time-Ms"]) == pytest.approx(6.0)
@@ -0,0 +1,160 @@
+import asyncio
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.rollup import REVENUE_TOTAL_SLOTS
+from app.services.rollup_service import (
+    OrderRollupService,
+    OrderRollupSnapshot,
+    revenue_slot,
+    rollup_deltas,
+)
+
+SERVICE_ID = uuid.uuid4()
+ORDER_ID = uuid.uuid4()
+
+
+def snapshot(status, actual_price=None, completed_day=None, order_id=ORDER_ID):
+    return OrderRollupSnapshot(
+        order_id=order_id,
+        status=status,
+        service_id=SERVICE_ID,
+        created_day=date(2026, 3, 1),
+        quoted_price=Decimal("40.00"),
+        actual_price=actual_price,
+        completed_day=completed_day,
+    )
+
+
+def test_create_counts_status_day_and_service():
+    deltas = rollup_deltas([(None, snapshot("pending"))])
+
+    assert deltas.status == {"pending": 1}
+    assert deltas.daily == {date(2026, 3, 1): [1, Decimal("40.00"), 0, 0]}
+    assert deltas.service == {SERVICE_ID: [1, Decimal("40.00")]}
+    assert deltas.totals == {}
+
+
+def test_transition_only_moves_status_and_completion():
+    before = snapshot("ready")
+    after = snapshot(
+        "completed", actual_price=Decimal("45.00"), completed_day=date(2026, 3, 4)
+    )
+
+    deltas = rollup_deltas([(before, after)])
+
+    assert deltas.status == {"ready": -1, "completed": 1}
+    # Creation-day figures cancel out; only the completion day changes
+    assert deltas.daily == {date(2026, 3, 4): [0, 0, 1, Decimal("45.00")]}
+    assert deltas.service == {}
+    assert deltas.totals == {revenue_slot(ORDER_ID): [1, Decimal("45.00")]}
+
+
+def test_delete_reverses_create():
+    order = snapshot("completed", completed_day=date(2026, 3, 2))
+
+    deltas = rollup_deltas([(None, order), (order, None)])
+
+    assert deltas.status == {}
+    assert deltas.daily == {}
+    assert deltas.service == {}
+    assert deltas.totals == {}
+
+
+def test_snapshot_from_returning_row_with_override():
+    row = {
+        "id": ORDER_ID,
+        "status": "in_progress",
+        "service_id": SERVICE_ID,
+        "created_at": datetime(2026, 3, 1, 23, 30, tzinfo=timezone.utc),
+        "quoted_price": Decimal("40.00"),
+        "actual_price": None,
+        "actual_completion": None,
+    }
+
+    before = OrderRollupSnapshot.of(row, status="pending")
+
+    assert before.order_id == ORDER_ID
+    assert before.status == "pending"
+    assert before.created_day == date(2026, 3, 1)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+
+class FakeSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return FakeResult([])
+
+    async def scalar(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        return Decimal("120.00") if "order_revenue_totals" in sql else 2
+
+
+def test_dashboard_reads_are_bounded():
+    session = FakeSession()
+
+    metrics = asyncio.run(OrderRollupService(session).dashboard(days=7))
+
+    assert metrics["total_revenue"] == Decimal("120.00")
+    assert metrics["completed_this_month"] == 2
+    daily_reads = [sql for sql in session.statements if "order_daily_revenue" in sql]
+    # Every read of the daily rollup is a primary key range, never a full scan
+    assert daily_reads and all(
+        "WHERE order_daily_revenue.day" in sql for sql in daily_reads
+    )
+
+
+def test_totals_row_moves_with_completions():
+    session = FakeSession()
+    before = snapshot("ready")
+    after = snapshot(
+        "completed", actual_price=Decimal("45.00"), completed_day=date(2026, 3, 4)
+    )
+
+    asyncio.run(OrderRollupService(session).apply([(before, after)]))
+
+    assert any("INSERT INTO order_revenue_totals" in sql for sql in session.statements)
+
+    session = FakeSession()
+    asyncio.run(OrderRollupService(session).apply([(None, snapshot("pending"))]))
+    assert not any("order_revenue_totals" in sql for sql in session.statements)
+
+
+def test_completions_spread_over_revenue_slots():
+    order_ids = [uuid.UUID(int=slot) for slot in (3, 3 + REVENUE_TOTAL_SLOTS, 5)]
+    changes = [
+        (
+            snapshot("ready", order_id=order_id),
+            snapshot(
+                "completed",
+                actual_price=Decimal("10.00"),
+                completed_day=date(2026, 3, 4),
+                order_id=order_id,
+            ),
+        )
+        for order_id in order_ids
+    ]
+
+    deltas = rollup_deltas(changes)
+
+    assert deltas.totals == {3: [2, Decimal("20.00")], 5: [1, Decimal("10.00")]}
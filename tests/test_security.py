@@ -1,9 +1,12 @@
+import asyncio
 import uuid
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
+from passlib.context import CryptContext
 
 from app.core.security import (
     JWTBearer,
@@ -12,8 +15,10 @@ from app.core.security import (
     decode_access_token,
     get_current_user,
     get_password_hash,
+    verify_and_update_password,
     verify_password,
 )
+from app.services.user_service import UserService
 
 app = FastAPI()
 
@@ -54,6 +59,37 @@ def test_password_hash_and_verify_roundtrip():
     assert verify_password("wrong", hashed) is False
 
 
+def test_new_hashes_are_argon2id():
+    assert get_password_hash("S3cureP@ss!").startswith("$argon2id$")
+
+
+def test_legacy_bcrypt_hash_is_upgraded_on_verify():
+    legacy = CryptContext(schemes=["bcrypt"]).hash("S3cureP@ss!")
+
+    verified, new_hash = verify_and_update_password("S3cureP@ss!", legacy)
+    assert verified is True
+    assert new_hash.startswith("$argon2id$")
+    assert verify_and_update_password("S3cureP@ss!", new_hash) == (True, None)
+    assert verify_and_update_password("wrong", legacy) == (False, None)
+
+
+def test_authenticate_user_stores_upgraded_hash(monkeypatch):
+    legacy = CryptContext(schemes=["bcrypt"]).hash("S3cureP@ss!")
+    user = SimpleNamespace(hashed_password=legacy)
+
+    async def get_by_email(_self, email):
+        return user
+
+    monkeypatch.setattr(UserService, "get_by_email", get_by_email)
+    service = UserService(session=None)
+
+    assert asyncio.run(service.authenticate_user("a@example.com", "nope")) is None
+    assert user.hashed_password == legacy
+
+    assert asyncio.run(service.authenticate_user("a@example.com", "S3cureP@ss!"))
+    assert user.hashed_password.startswith("$argon2id$")
+
+
 # 2. Token creation and decoding behaviors
 
 
@@ -0,0 +1,156 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+from app.db.commit_hooks import _KEY as ON_COMMIT
+from app.schemas.service import ServiceUpdate
+from app.services.service import ServiceService
+
+
+def make_service(**overrides):
+    fields = {
+        "id": uuid.uuid4(),
+        "name": "Hemming",
+        "description": None,
+        "base_price": 15.0,
+        "category": "alterations",
+        "estimated_days": 2,
+        "image_url": None,
+        "is_active": True,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def scalar(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    def __init__(self, services):
+        self.services = services
+        self.reads = 0
+        self.statements = []
+        self.info = {}
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if "pg_notify" in sql:
+            return FakeResult([])
+        self.reads += 1
+        params = stmt.compile().params
+        if params:
+            wanted = str(next(iter(params.values())))
+            return FakeResult([s for s in self.services if str(s.id) == wanted])
+        return FakeResult(self.services)
+
+    async def flush(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+
+def test_catalog_reads_are_served_from_cache():
+    hemming = make_service()
+    session = FakeSession([hemming, make_service(name="Resizing")])
+    service = ServiceService(session, cache=TTLCache(ttl_seconds=60, max_entries=10))
+
+    async def run():
+        first = await service.get()
+        second = await service.get()
+        by_id = await service.getId(hemming.id)
+        again = await service.getId(str(hemming.id))
+        return first, second, by_id, again
+
+    first, second, by_id, again = asyncio.run(run())
+
+    assert [s.name for s in first] == [s.name for s in second]
+    assert by_id == again and by_id.name == "Hemming"
+    assert session.reads == 2
+    assert session.statements[0].endswith("ORDER BY services.id")
+
+
+def test_unknown_service_is_not_cached():
+    session = FakeSession([])
+    service = ServiceService(session, cache=TTLCache(ttl_seconds=60, max_entries=10))
+
+    async def run():
+        return [await service.getId(uuid.uuid4()) for _ in range(2)]
+
+    assert asyncio.run(run()) == [None, None]
+    assert session.reads == 2
+
+
+def test_update_invalidates_locally_and_notifies_other_workers():
+    hemming = make_service()
+    session = FakeSession([hemming])
+    cache = TTLCache(ttl_seconds=60, max_entries=10)
+    service = ServiceService(session, cache=cache)
+
+    async def run():
+        await service.get()
+        await service.update(
+            hemming.id,
+            ServiceUpdate(
+                name="Hemming (express)",
+                base_price=25.0,
+                category="alterations",
+                estimated_days=1,
+            ),
+        )
+        return await service.get()
+
+    services = asyncio.run(run())
+
+    assert services[0].name == "Hemming (express)"
+    assert [sql for sql in session.statements if "pg_notify" in sql]
+    # get, update's own read, get again around the cache
+    assert session.reads == 3
+    # Until the commit the cache keeps the committed catalog
+    assert cache.get("all")[0][0].name == "Hemming"
+
+    for callback in session.info[ON_COMMIT]:
+        callback()
+    assert cache.get("all") is None
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl_seconds=10, max_entries=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] += 11
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_drops_values_read_before_an_invalidation():
+    cache = TTLCache(ttl_seconds=10, max_entries=10)
+    generation = cache.generation
+
+    cache.clear()
+
+    assert cache.set("all", ["stale"], generation) is False
+    assert cache.get("all") is None
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.db.slow_queries import SlowQueryLog, explainable
+
+
+@pytest.fixture()
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("SELECT * FROM orders WHERE id = $1", True),
+        ("  with recent AS (SELECT 1) SELECT * FROM recent", True),
+        ("SELECT * FROM outbox_events FOR UPDATE SKIP LOCKED", False),
+        ("WITH moved AS (DELETE FROM orders RETURNING *) SELECT * FROM moved", False),
+        ("UPDATE orders SET status = $1", False),
+    ],
+)
+def test_only_plain_reads_are_explained(statement, expected):
+    assert explainable(statement) is expected
+
+
+def test_statements_over_threshold_are_kept_newest_first(engine):
+    log = SlowQueryLog(threshold_ms=0, capacity=2, explain_rate=1.0)
+    log.install(engine)
+
+    with engine.connect() as conn:
+        for value in ("a", 1, 2.5):
+            conn.execute(text("SELECT :value"), {"value": value})
+
+    entries = log.recent()
+    assert [entry.parameters for entry in entries] == [["float"], ["int"]]
+    assert entries[0].id == 3
+    # No explain engine: nothing is re-run
+    assert entries[0].plan is None and not log._pending
+
+
+def test_fast_statements_are_ignored(engine):
+    log = SlowQueryLog(threshold_ms=60_000, capacity=10, explain_rate=1.0)
+    log.install(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert log.recent() == []
+
+
+def test_sampled_reads_are_explained_in_background():
+    log = SlowQueryLog(threshold_ms=0, capacity=10, explain_rate=1.0)
+    log._explain_engine = object()
+    explained = []
+
+    async def fake_explain(entry, parameters):
+        entry.plan = "Seq Scan on orders"
+        explained.append((entry.statement, parameters))
+
+    log.explain = fake_explain
+
+    async def run():
+        log.record("SELECT * FROM orders WHERE id = $1", ("x",), 1.0)
+        log.record("UPDATE orders SET notes = $1", ("x",), 1.0)
+        await asyncio.gather(*log._pending)
+
+    asyncio.run(run())
+
+    assert explained == [("SELECT * FROM orders WHERE id = $1", ("x",))]
+    assert log.recent()[1].plan == "Seq Scan on orders"